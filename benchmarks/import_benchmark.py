@@ -0,0 +1,83 @@
+"""HED import-time benchmark.
+
+Measures the wall-clock cost of importing HED entry points in a fresh interpreter
+(so nothing is cached in ``sys.modules``) and reports which heavy third-party
+modules each entry point pulls in.
+
+Usage::
+
+    python import_benchmark.py              # 10 runs per entry point
+    python import_benchmark.py --runs 3     # fewer runs
+    python import_benchmark.py --max-seconds 0.5   # exit 1 if ``import hed`` is slower
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "inflect", "defusedxml")
+
+ENTRY_POINTS = [
+    ("import hed", "import hed"),
+    ("hed.cli", "import hed.cli.cli"),
+    ("HedString", "from hed import HedString"),
+    ("load_schema_version", "from hed import load_schema_version"),
+    ("HedValidator", "from hed.validator import HedValidator"),
+    ("TabularInput", "from hed import TabularInput"),
+    ("hed.tools", "from hed.tools import BidsDataset"),
+]
+
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def time_import(code, n_runs):
+    """Return (median_seconds, loaded_heavy_modules) for running *code* in fresh interpreters."""
+    times = []
+    loaded = []
+    probe = _PROBE.format(code=code, heavy=HEAVY_MODULES)
+    for _ in range(n_runs):
+        result = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True, cwd=REPO_ROOT
+        )
+        record = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(record["seconds"])
+        loaded = record["loaded"]
+    times.sort()
+    return times[len(times) // 2], loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark HED import times")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh-interpreter runs per entry point")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="Fail if the median time of 'import hed' exceeds this"
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'entry point':<22}{'median (ms)':>12}  heavy modules loaded")
+    results = {}
+    for label, code in ENTRY_POINTS:
+        median, loaded = time_import(code, args.runs)
+        results[label] = median
+        print(f"{label:<22}{median * 1000:>12.1f}  {', '.join(loaded) or '-'}")
+
+    if args.max_seconds is not None and results["import hed"] > args.max_seconds:
+        print(f"FAIL: 'import hed' took {results['import hed']:.3f}s (limit {args.max_seconds:.3f}s)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,26 @@
-from hed.models.hed_string import HedString
-from hed.models.hed_tag import HedTag
-from hed.models.hed_group import HedGroup
-from hed.errors.error_reporter import get_printable_issue_string
-from hed.errors.exceptions import HedFileError, HedExceptions, HedQueryError
-from hed.models.spreadsheet_input import SpreadsheetInput
-from hed.models.tabular_input import TabularInput
-from hed.models.sidecar import Sidecar
-from hed.models.definition_dict import DefinitionDict
-from hed.models.query_handler import QueryHandler
-from hed.models.query_service import get_query_handlers, search_hed_objs
+from hed._lazy_import import attach as _attach
 
-from hed.schema.hed_schema import HedSchema
-from hed.schema.hed_schema_group import HedSchemaGroup
-from hed.schema.hed_schema_io import load_schema, load_schema_version
+# Public names are resolved on first access (PEP 562) so that ``import hed`` does not pull in
+# pandas, openpyxl, the schema loaders and the validators before any work is done.
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "models.hed_string": ["HedString"],
+        "models.hed_tag": ["HedTag"],
+        "models.hed_group": ["HedGroup"],
+        "errors.error_reporter": ["get_printable_issue_string"],
+        "errors.exceptions": ["HedFileError", "HedExceptions", "HedQueryError"],
+        "models.spreadsheet_input": ["SpreadsheetInput"],
+        "models.tabular_input": ["TabularInput"],
+        "models.sidecar": ["Sidecar"],
+        "models.definition_dict": ["DefinitionDict"],
+        "models.query_handler": ["QueryHandler"],
+        "models.query_service": ["get_query_handlers", "search_hed_objs"],
+        "schema.hed_schema": ["HedSchema"],
+        "schema.hed_schema_group": ["HedSchemaGroup"],
+        "schema.hed_schema_io": ["load_schema", "load_schema_version"],
+    },
+)
 
 try:
     from hed._version import __version__
@@ -0,0 +1,57 @@
+"""PEP 562 lazy attribute loading for HED package ``__init__`` modules.
+
+Package ``__init__`` modules declare which public names live in which submodule and
+call :func:`attach`. The submodule is only imported the first time one of its names is
+accessed, so ``import hed`` stays cheap and heavy dependencies (pandas, openpyxl,
+inflect, defusedxml) are only loaded by the code paths that actually need them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+
+
+def attach(
+    package_name: str, submodule_attrs: dict[str, list[str]]
+) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """Create ``__getattr__``, ``__dir__`` and ``__all__`` for a lazily loaded package.
+
+    Parameters:
+        package_name (str): The ``__name__`` of the package being set up.
+        submodule_attrs (dict[str, list[str]]): Maps a submodule path relative to the package
+            (e.g. ``"hed_string"`` or ``"analysis.key_map"``) to the public names it provides.
+
+    Returns:
+        tuple: The ``__getattr__`` function, the ``__dir__`` function and the ``__all__`` list.
+
+    Notes:
+        - Resolved attributes are cached on the package so ``__getattr__`` is called at most once per name.
+        - Names that are not registered fall back to importing a submodule of that name, so
+          ``import hed; hed.models.df_util`` keeps working as it did with eager imports.
+    """
+    attr_to_module = {}
+    for submodule, attrs in submodule_attrs.items():
+        for attr in attrs:
+            attr_to_module[attr] = f"{package_name}.{submodule}"
+
+    def _getattr(name):
+        module_name = attr_to_module.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name), name)
+            setattr(sys.modules[package_name], name, value)
+            return value
+        if not name.startswith("__"):
+            full_name = f"{package_name}.{name}"
+            try:
+                return importlib.import_module(full_name)
+            except ModuleNotFoundError as e:
+                if e.name != full_name:
+                    raise
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def _dir():
+        return sorted(set(vars(sys.modules[package_name])) | set(attr_to_module))
+
+    return _getattr, _dir, list(attr_to_module)
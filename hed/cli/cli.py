@@ -86,6 +86,9 @@ Examples:
 
     # Limit error reporting for large datasets
     hedpy validate bids-dataset /path/to/dataset --error-limit 10
+
+    # Stream issues as JSON Lines while the dataset is validated
+    hedpy validate bids-dataset /path/to/dataset -f jsonl -p
 """,
 )
 @click.argument("data_path", type=click.Path(exists=True))
@@ -131,15 +134,45 @@ Examples:
     is_flag=True,
     help="Apply error limit by file rather than overall",
 )
+@optgroup.option(
+    "-mi",
+    "--max-issues",
+    type=int,
+    default=None,
+    metavar=METAVAR_N,
+    help="Stop validating once this many issues have been found",
+)
+@optgroup.option(
+    "-mc",
+    "--max-issues-per-code",
+    type=int,
+    default=None,
+    metavar=METAVAR_N,
+    help="Stop reporting issues of a code once this many have been found",
+)
+@optgroup.option(
+    "-mf",
+    "--max-issues-per-file",
+    type=int,
+    default=None,
+    metavar=METAVAR_N,
+    help="Stop validating a file once this many issues have been found in it",
+)
+@optgroup.option(
+    "-fe",
+    "--stop-on-first-error",
+    is_flag=True,
+    help="Stop validating each file after its first error",
+)
 # Output options
 @optgroup.group("Output options")
 @optgroup.option(
     "-f",
     "--format",
-    type=click.Choice(["text", "json", "json_pp"]),
+    type=click.Choice(["text", "json", "json_pp", "jsonl"]),
     default="text",
     show_default="text",
-    help="Output format (e.g., '-f json_pp' outputs errors in pretty-printed JSON)",
+    help="Output format (e.g., '-f json_pp' outputs errors in pretty-printed JSON; '-f jsonl' streams one JSON issue per line as each file is validated)",
 )
 @optgroup.option(
     "-o",
@@ -209,6 +242,10 @@ def validate_bids_cmd(
     verbose,
     check_for_warnings,
     exclude_dirs,
+    max_issues,
+    max_issues_per_code,
+    max_issues_per_file,
+    stop_on_first_error,
 ):
     """Validate HED annotations in a BIDS dataset.
 
@@ -222,6 +259,14 @@ def validate_bids_cmd(
         args.extend(["-el", str(error_limit)])
     if errors_by_file:
         args.append("-ef")
+    if max_issues is not None:
+        args.extend(["-mi", str(max_issues)])
+    if max_issues_per_code is not None:
+        args.extend(["-mc", str(max_issues_per_code)])
+    if max_issues_per_file is not None:
+        args.extend(["-mf", str(max_issues_per_file)])
+    if stop_on_first_error:
+        args.append("-fe")
     if format:
         args.extend(["-f", format])
     if log_level:
@@ -311,10 +356,10 @@ Examples:
 @optgroup.option(
     "-f",
     "--format",
-    type=click.Choice(["text", "json"]),
+    type=click.Choice(["text", "json", "jsonl"]),
     default="text",
     show_default="text",
-    help="Output format for validation results (text: human-readable; json: structured format for programmatic use)",
+    help="Output format for validation results (text: human-readable; json: structured format for programmatic use; jsonl: one JSON issue per line)",
 )
 @optgroup.option(
     "-o",
@@ -448,10 +493,10 @@ Examples:
 @optgroup.option(
     "-f",
     "--format",
-    type=click.Choice(["text", "json"]),
+    type=click.Choice(["text", "json", "jsonl"]),
     default="text",
     show_default="text",
-    help="Output format for validation results (text: human-readable; json: structured format for programmatic use)",
+    help="Output format for validation results (text: human-readable; json: structured format for programmatic use; jsonl: one JSON issue per line)",
 )
 @optgroup.option(
     "-o",
@@ -608,10 +653,10 @@ Examples:
 @optgroup.option(
     "-f",
     "--format",
-    type=click.Choice(["text", "json"]),
+    type=click.Choice(["text", "json", "jsonl"]),
     default="text",
     show_default="text",
-    help="Output format for validation results (text: human-readable; json: structured format for programmatic use)",
+    help="Output format for validation results (text: human-readable; json: structured format for programmatic use; jsonl: one JSON issue per line)",
 )
 @optgroup.option(
     "-o",
@@ -1018,6 +1063,9 @@ Examples:
 
     # Filter to only process files from task 'rest' with all TSV files
     hedpy extract tabular-summary /path/to/data -s '*' --filter 'task-rest'
+
+    # Summarize the files with 8 worker processes
+    hedpy extract tabular-summary /path/to/data --jobs 8
 """,
 )
 @click.argument("data_path", type=click.Path(exists=True))
@@ -1077,6 +1125,15 @@ Examples:
     metavar=METAVAR_N,
     help="Maximum unique values for categorical columns",
 )
+@optgroup.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=1,
+    show_default="1",
+    metavar=METAVAR_N,
+    help="Number of worker processes used to summarize the files; 0 uses one per CPU",
+)
 # Output options
 @optgroup.group("Output options")
 @optgroup.option(
@@ -1134,6 +1191,7 @@ def extract_tabular_summary_cmd(
     value_columns,
     skip_columns,
     categorical_limit,
+    jobs,
     output_file,
     output_format,
     log_level,
@@ -1165,6 +1223,8 @@ def extract_tabular_summary_cmd(
         args.extend(skip_columns)
     if categorical_limit is not None:
         args.extend(["-cl", str(categorical_limit)])
+    if jobs != 1:
+        args.extend(["-j", str(jobs)])
     if output_file:
         args.extend(["-o", output_file])
     if output_format:
@@ -1,24 +1,34 @@
 """Error handling module for HED."""
 
-from .error_reporter import (
-    ErrorHandler,
-    separate_issues,
-    get_printable_issue_string,
-    get_printable_issue_string_html,
-    check_for_any_errors,
-    sort_issues,
-    iter_errors,
-)
-from .error_types import (
-    DefinitionErrors,
-    TemporalErrors,
-    SchemaErrors,
-    SchemaWarnings,
-    SchemaAttributeErrors,
-    SidecarErrors,
-    ValidationErrors,
-    ColumnErrors,
-    TagQualityErrors,
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "error_reporter": [
+            "ErrorHandler",
+            "IssueRecord",
+            "separate_issues",
+            "get_printable_issue_string",
+            "get_printable_issue_string_html",
+            "check_for_any_errors",
+            "sort_issues",
+            "iter_errors",
+        ],
+        "error_types": [
+            "DefinitionErrors",
+            "TemporalErrors",
+            "SchemaErrors",
+            "SchemaWarnings",
+            "SchemaAttributeErrors",
+            "SidecarErrors",
+            "ValidationErrors",
+            "ColumnErrors",
+            "TagQualityErrors",
+            "ErrorContext",
+            "ErrorSeverity",
+        ],
+        "issue_sink": ["IssueSink", "ListIssueSink", "JsonLinesIssueSink", "CountingIssueSink"],
+        "exceptions": ["HedExceptions", "HedFileError", "HedQueryError"],
+    },
 )
-from .error_types import ErrorContext, ErrorSeverity
-from .exceptions import HedExceptions, HedFileError, HedQueryError
@@ -220,13 +220,156 @@ def separate_issues(issues_list: list[dict]) -> tuple[list[dict], list[dict]]:
     return errors, warnings
 
 
+class IssueRecord(dict):
+    """An immutable issue dictionary that holds no references to parse trees.
+
+    Records are produced by an ErrorHandler created with ``compact_issues=True``. The HED string context
+    is stored as its original text and ``source_tag`` as the tag text, so keeping a record alive does not keep
+    the HedString, its tags, or their schema entries alive. Records are ordinary dictionaries for reading,
+    sorting, printing and JSON serialization, but cannot be modified; use ``copy()`` to get a mutable dict.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_issue(cls, issue, context=()) -> IssueRecord:
+        """Create a compact record from an issue dictionary and optional extra context.
+
+        Parameters:
+            issue (dict): The issue to compact. It should already have its character positions computed.
+            context (list): Context tuples (context_type, context) to add to the record.
+
+        Returns:
+            IssueRecord: The compact record.
+        """
+        values = {}
+        for key, value in issue.items():
+            values[key] = _compact_issue_value(key, value)
+        for context_type, context_value in context:
+            values[context_type] = _compact_issue_value(context_type, context_value)
+        return cls(values)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("IssueRecord objects are immutable; use copy() to get a modifiable dict.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def copy(self) -> dict:
+        """Return a mutable dict with the same contents."""
+        return dict(self)
+
+    def __reduce__(self):
+        return IssueRecord, (dict(self),)
+
+
+def _compact_issue_value(key, value):
+    """Return a value safe to store in an IssueRecord, replacing HED objects with their text."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if key == ErrorContext.HED_STRING:
+        return value.get_original_hed_string()
+    if key == "source_tag":
+        return str(value)
+    return value
+
+
 class ErrorHandler:
     """Class to hold error context and having general error functions."""
 
-    def __init__(self, check_for_warnings=True):
+    def __init__(
+        self,
+        check_for_warnings=True,
+        compact_issues=False,
+        max_issues=None,
+        max_issues_per_code=None,
+        max_issues_per_file=None,
+        stop_on_first_error=False,
+    ):
+        """Constructor for the ErrorHandler class.
+
+        Parameters:
+            check_for_warnings (bool): If False, warnings are filtered out as issues are reported.
+            compact_issues (bool): If True, issues are converted to immutable IssueRecord objects as soon as
+                their context is added, so reported issues do not keep HedString or HedTag objects alive.
+            max_issues (int or None): Stop reporting issues once this many have been reported in total.
+            max_issues_per_code (int or None): Report at most this many issues of each code.
+            max_issues_per_file (int or None): Report at most this many issues for each file.
+            stop_on_first_error (bool): If True, stop reporting issues for a file after its first error.
+
+        Notes:
+            - The limits are enforced as issues are reported. Validators check limit_reached and
+              file_limit_reached() to skip the rest of a dataset or file once nothing more can be reported.
+            - Setting any limit implies compact_issues, since each issue must be counted exactly once.
+        """
         # The current (ordered) dictionary of contexts.
         self.error_context = []
         self._check_for_warnings = check_for_warnings
+        self._max_issues = max_issues
+        self._max_issues_per_code = max_issues_per_code
+        self._max_issues_per_file = max_issues_per_file
+        self._stop_on_first_error = stop_on_first_error
+        self._has_limits = (
+            max_issues is not None
+            or max_issues_per_code is not None
+            or max_issues_per_file is not None
+            or stop_on_first_error
+        )
+        self._compact_issues = compact_issues or self._has_limits
+        self._code_counts = defaultdict(int)
+        self._file_counts = defaultdict(int)
+        self._file_error_counts = defaultdict(int)
+        self.issue_count = 0
+        self.suppressed_count = 0
+        self.suppressed_error_count = 0
+
+    @property
+    def limit_reached(self) -> bool:
+        """True if max_issues issues have been reported, so validation of the remaining data can be skipped."""
+        return self._max_issues is not None and self.issue_count >= self._max_issues
+
+    def file_limit_reached(self, file_name=None) -> bool:
+        """Return True if no more issues can be reported for a file, so the rest of it can be skipped.
+
+        Parameters:
+            file_name (str or None): The file to check. If None, the innermost file name context is used.
+
+        Returns:
+            bool: True if the overall limit, the per-file limit, or stop_on_first_error applies to the file.
+        """
+        if not self._has_limits:
+            return False
+        if self.limit_reached:
+            return True
+        if file_name is None:
+            file_name = self._current_file_name()
+        if self._max_issues_per_file is not None and self._file_counts[file_name] >= self._max_issues_per_file:
+            return True
+        return self._stop_on_first_error and self._file_error_counts[file_name] > 0
+
+    def _current_file_name(self):
+        for context_type, context in reversed(self.error_context):
+            if context_type == ErrorContext.FILE_NAME:
+                return context
+        return ""
+
+    def _accept_issue(self, issue):
+        """Count an issue against the limits and return False if it should be suppressed."""
+        file_name = issue.get(ErrorContext.FILE_NAME, "")
+        code = issue.get("code", "UNKNOWN")
+        if self.file_limit_reached(file_name) or (
+            self._max_issues_per_code is not None and self._code_counts[code] >= self._max_issues_per_code
+        ):
+            self.suppressed_count += 1
+            if issue.get("severity", ErrorSeverity.ERROR) <= ErrorSeverity.ERROR:
+                self.suppressed_error_count += 1
+            return False
+        self.issue_count += 1
+        self._code_counts[code] += 1
+        self._file_counts[file_name] += 1
+        if issue.get("severity", ErrorSeverity.ERROR) <= ErrorSeverity.ERROR:
+            self._file_error_counts[file_name] += 1
+        return True
 
     def push_error_context(self, context_type, context):
         """Push a new error context to narrow down error scope.
@@ -274,9 +417,23 @@ class ErrorHandler:
         if not self._check_for_warnings:
             issues[:] = self.filter_issues_by_severity(issues, ErrorSeverity.ERROR)
 
+        kept_issues = []
         for error_object in issues:
+            if isinstance(error_object, IssueRecord):
+                # Already compacted (and counted) at an inner level, which had at least this much context.
+                missing = [item for item in self.error_context if item[0] not in error_object]
+                if missing:
+                    error_object = IssueRecord.from_issue(error_object, missing)
+                kept_issues.append(error_object)
+                continue
             self._add_context_to_error(error_object, self.error_context)
             self._update_error_with_char_pos(error_object)
+            if self._compact_issues:
+                error_object = IssueRecord.from_issue(error_object)
+            if self._has_limits and not self._accept_issue(error_object):
+                continue
+            kept_issues.append(error_object)
+        issues[:] = kept_issues
 
     def format_error_with_context(self, *args, **kwargs):
         error_object = ErrorHandler.format_error(*args, **kwargs)
@@ -287,6 +444,10 @@ class ErrorHandler:
                 return []
             self._add_context_to_error(actual_error, self.error_context)
             self._update_error_with_char_pos(actual_error)
+            if self._compact_issues:
+                error_object[0] = IssueRecord.from_issue(actual_error)
+            if self._has_limits and not self._accept_issue(error_object[0]):
+                return []
 
         return error_object
 
@@ -392,6 +553,9 @@ class ErrorHandler:
     @staticmethod
     def _update_error_with_char_pos(error_object):
         # This part is optional as you can always generate these as needed.
+        if "char_index" in error_object:
+            # Issues passed through add_context_and_filter again at an outer level already have their span.
+            return
         start, end = ErrorHandler._get_tag_span_to_error_object(error_object)
         if start is not None:
             # silence warning in pycharm
@@ -519,7 +683,12 @@ class ErrorHandler:
 
         Parameters:
            list_or_dict (list or dict): An arbitrarily nested list/dict structure
+
+        Notes:
+            IssueRecord objects hold no references already and are left unchanged.
         """
+        if isinstance(list_or_dict, IssueRecord):
+            return
         if isinstance(list_or_dict, dict):
             for key, value in list_or_dict.items():
                 if isinstance(value, (dict, list)):
@@ -780,7 +949,7 @@ def _get_context_from_issue(val_issue, skip_filename=True):
     for key, value in val_issue.items():
         if skip_filename and key == ErrorContext.FILE_NAME:
             continue
-        if key == ErrorContext.HED_STRING:
+        if key == ErrorContext.HED_STRING and not isinstance(value, str):
             value = value.get_original_hed_string()
         if key.startswith("ec_"):
             single_issue_context.append((key, str(value)))
@@ -0,0 +1,155 @@
+"""Issue sinks that receive validation issues as they are produced.
+
+Validators normally return the full list of issues. When an issue sink is passed to
+``HedValidator.validate``, ``SidecarValidator.validate``, ``SpreadsheetValidator.validate`` or
+``BidsFileGroup.validate``, each string, sidecar or data file writes its (sorted) issues to the
+sink as soon as it is done and returns an empty list, so reports can be streamed and memory
+stays flat no matter how large the dataset is.
+
+Sinks can be chained: a :class:`CountingIssueSink` keeps per-code counts and forwards the first
+issues of each code to a downstream sink such as a :class:`JsonLinesIssueSink`.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from hed.errors.error_reporter import iter_errors
+from hed.errors.error_types import ErrorContext, ErrorSeverity
+
+
+class IssueSink(ABC):
+    """Base class for objects that receive batches of validation issues."""
+
+    @abstractmethod
+    def write(self, issues: list[dict]):
+        """Receive the issues for one unit of work (a string, sidecar or data file).
+
+        Parameters:
+            issues (list[dict]): The issues, already sorted and with their context added.
+        """
+        raise NotImplementedError("This function must be implemented in the baseclass")
+
+    def close(self):  # noqa: B027 - an optional hook, so not abstract
+        """Flush any buffered output. The default does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ListIssueSink(IssueSink):
+    """Collect the issues in a list, which is what validators do when no sink is given."""
+
+    def __init__(self):
+        self.issues = []
+
+    def write(self, issues):
+        self.issues += issues
+
+
+class JsonLinesIssueSink(IssueSink):
+    """Write each issue as one JSON object per line (JSON Lines) to one or more text streams."""
+
+    def __init__(self, *streams, flush=True):
+        """Constructor for the JsonLinesIssueSink class.
+
+        Parameters:
+            streams (TextIO): The open text streams to write to (e.g. a file and sys.stdout).
+            flush (bool): If True, flush the streams after each batch so output appears progressively.
+        """
+        self.streams = streams
+        self.flush = flush
+
+    def write(self, issues):
+        if not issues:
+            return
+        text = "".join(json.dumps(issue) + "\n" for issue in iter_errors(issues))
+        for stream in self.streams:
+            stream.write(text)
+            if self.flush:
+                stream.flush()
+
+    def close(self):  # noqa: B027 - an optional hook, so not abstract
+        for stream in self.streams:
+            stream.flush()
+
+
+class CountingIssueSink(IssueSink):
+    """Count issues by code and forward them, optionally only the first few of each code, to other sinks.
+
+    This is the streaming equivalent of ``ErrorHandler.get_code_counts`` and ``ErrorHandler.filter_issues_by_count``.
+    """
+
+    def __init__(self, *sinks, error_limit=None, by_file=False):
+        """Constructor for the CountingIssueSink class.
+
+        Parameters:
+            sinks (IssueSink): Downstream sinks to forward the (possibly filtered) issues to.
+            error_limit (int or None): If given, forward only the first error_limit issues of each code.
+            by_file (bool): If True, apply error_limit separately for each file.
+        """
+        self.sinks = sinks
+        self.error_limit = error_limit
+        self.by_file = by_file
+        self._file_code_counts = defaultdict(lambda: defaultdict(int))
+        self.error_count = 0
+        self.warning_count = 0
+
+    def write(self, issues):
+        forwarded = []
+        for issue in issues:
+            file_name = issue.get(ErrorContext.FILE_NAME, "") if self.by_file else ""
+            seen_codes = self._file_code_counts[file_name]
+            code = issue.get("code", "UNKNOWN")
+            seen_codes[code] += 1
+            if issue.get("severity", ErrorSeverity.ERROR) <= ErrorSeverity.ERROR:
+                self.error_count += 1
+            else:
+                self.warning_count += 1
+            if self.error_limit is None or seen_codes[code] <= self.error_limit:
+                forwarded.append(issue)
+        if forwarded:
+            for sink in self.sinks:
+                sink.write(forwarded)
+
+    def close(self):  # noqa: B027 - an optional hook, so not abstract
+        for sink in self.sinks:
+            sink.close()
+
+    @property
+    def total_count(self) -> int:
+        """Total number of issues received."""
+        return self.error_count + self.warning_count
+
+    def get_code_counts(self) -> dict[str, int]:
+        """Return the number of issues received for each code.
+
+        Returns:
+            dict[str, int]: Error codes as keys and their occurrence counts as values.
+        """
+        total_counts = defaultdict(int)
+        for code_counts in self._file_code_counts.values():
+            for code, count in code_counts.items():
+                total_counts[code] += count
+        return dict(total_counts)
+
+
+def send_to_sink(issues, issue_sink) -> list[dict]:
+    """Write issues to a sink if there is one and return what the validator should return.
+
+    Parameters:
+        issues (list[dict]): The finished issues for one unit of work.
+        issue_sink (IssueSink or None): The sink to write to.
+
+    Returns:
+        list[dict]: The issues if there is no sink, otherwise an empty list.
+    """
+    if issue_sink is None:
+        return issues
+    issue_sink.write(issues)
+    return []
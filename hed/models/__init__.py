@@ -41,23 +41,31 @@ Key exports
 - :class:`TimeseriesInput` — a continuous time-series file with HED annotations.
 - :class:`DefinitionDict` — a collection of resolved HED Def/Def-expand definitions.
 - :class:`QueryHandler` — compile and execute queries against HED strings.
+- :func:`compile_query` / :class:`QueryPlan` — cached, picklable compiled query expressions.
 - :func:`get_query_handlers` / :func:`search_hed_objs` — convenience helpers for
   batch querying.
 - :func:`convert_to_form`, :func:`shrink_defs`, :func:`expand_defs`,
   :func:`process_def_expands` — DataFrame-level HED transformation utilities.
 """
 
-from .base_input import BaseInput
-from .column_metadata import ColumnMetadata, ColumnType
-from .definition_dict import DefinitionDict
-from .model_constants import DefTagNames, TopTagReturnType
-from .query_handler import QueryHandler
-from .query_service import get_query_handlers, search_hed_objs
-from .hed_group import HedGroup
-from .spreadsheet_input import SpreadsheetInput
-from .hed_string import HedString
-from .hed_tag import HedTag
-from .sidecar import Sidecar
-from .tabular_input import TabularInput
-from .timeseries_input import TimeseriesInput
-from .df_util import convert_to_form, shrink_defs, expand_defs, process_def_expands
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "base_input": ["BaseInput"],
+        "column_metadata": ["ColumnMetadata", "ColumnType"],
+        "definition_dict": ["DefinitionDict"],
+        "model_constants": ["DefTagNames", "TopTagReturnType"],
+        "query_handler": ["QueryHandler", "QueryPlan", "compile_query"],
+        "query_service": ["get_query_handlers", "search_hed_objs"],
+        "hed_group": ["HedGroup"],
+        "spreadsheet_input": ["SpreadsheetInput"],
+        "hed_string": ["HedString"],
+        "hed_tag": ["HedTag"],
+        "sidecar": ["Sidecar"],
+        "tabular_input": ["TabularInput"],
+        "timeseries_input": ["TimeseriesInput"],
+        "df_util": ["convert_to_form", "shrink_defs", "expand_defs", "process_def_expands"],
+    },
+)
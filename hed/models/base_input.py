@@ -2,17 +2,26 @@
 Superclass representing a basic columnar file.
 """
 
+from __future__ import annotations
+
+import io
 import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
-import openpyxl
+import numpy as np
 import pandas as pd
 
 from hed.errors.exceptions import HedExceptions, HedFileError
+from hed.models import tabular_cache
 from hed.models.column_mapper import ColumnMapper
 from hed.models.column_metadata import ColumnMetadata
 from hed.models.definition_dict import DefinitionDict
 from hed.models.df_util import _handle_curly_braces_refs, filter_series_by_onset
 
+if TYPE_CHECKING:
+    import openpyxl
+
 
 class BaseInput:
     """Superclass representing a basic columnar file."""
@@ -63,10 +72,17 @@ class BaseInput:
         self._mapper = mapper
         self._has_column_names = has_column_names
         self._name = name
-        # This is the loaded workbook if we loaded originally from an Excel file.
+        # This is the loaded workbook if we loaded originally from an Excel file. It is loaded on first use.
         self._loaded_workbook = None
+        # The Excel file (a path or its bytes) to load the full workbook from when it is needed.
+        self._workbook_source = None
         self._worksheet_name = worksheet_name
         self._dataframe = None
+        # Assembled results, along with the data and mapping state they were built from (see _caching_assembly).
+        self._assembly_cache = None
+        # Key of the file contents in the tabular cache, and the dataframe that was loaded with that key.
+        self._cache_key = None
+        self._cache_dataframe = None
 
         input_type = file_type
         if isinstance(file, str):
@@ -97,6 +113,8 @@ class BaseInput:
         self._mapper = new_mapper
         if not self._mapper:
             self._mapper = ColumnMapper()
+        if self._assembly_cache:
+            self._assembly_cache.clear()
 
         if self._dataframe is not None and self._has_column_names:
             columns = self._dataframe.columns
@@ -123,8 +141,45 @@ class BaseInput:
         Returns:
             pd.Series: the assembled dataframe with columns merged.
         """
+        if self._assembly_cache is None:
+            return self._get_assembled_series()
+        state = self._get_assembly_state(self._mapper)
+        cached = self._assembly_cache.get("series")
+        if cached is None or not self._same_assembly_state(cached[0], state):
+            cached = (state, self._get_assembled_series())
+            self._assembly_cache["series"] = cached
+        return cached[1].copy()
+
+    def _get_assembled_series(self) -> pd.Series:
+        """Return the assembled series, from the tabular cache if it was stored there by an earlier load."""
+        file_key = self._get_file_cache_key()
+        sidecar_key = self._get_sidecar_cache_key() if file_key else None
+        if sidecar_key:
+            series = tabular_cache.load_series(file_key, sidecar_key)
+            if series is not None and len(series) == len(self._dataframe):
+                series.index = self._dataframe.index
+                return series
+        series = self.combine_dataframe(self.assemble())
+        if sidecar_key:
+            tabular_cache.save_series(file_key, sidecar_key, series)
+        return series
+
+    def _get_file_cache_key(self) -> str | None:
+        """Return the tabular cache key of the file, or None if the dataframe no longer holds the file's data.
+
+        Notes:
+            - A copy may replace the dataframe (e.g. with rows sorted by onset), and callers may edit the
+              dataframe in place, so it must be the object loaded from the file and still equal the stored data.
+        """
+        if not self._cache_key or self._dataframe is not self._cache_dataframe:
+            return None
+        if not self._dataframe.equals(tabular_cache.load_dataframe(self._cache_key)):
+            return None
+        return self._cache_key
 
-        return self.combine_dataframe(self.assemble())
+    def _get_sidecar_cache_key(self) -> str | None:
+        """Return the tabular cache key of the sidecar used for assembly, or None if the series is not cached."""
+        return None
 
     @property
     def series_filtered(self) -> pd.Series | None:
@@ -149,7 +204,7 @@ class BaseInput:
         """Return True if this both has an onset column, and it needs sorting."""
         onsets = self.onsets
         if onsets is not None:
-            onsets = pd.to_numeric(self.dataframe["onset"], errors="coerce")
+            onsets = pd.to_numeric(self._dataframe["onset"], errors="coerce")
             return not onsets.is_monotonic_increasing
         else:
             return False
@@ -166,7 +221,17 @@ class BaseInput:
 
     @property
     def loaded_workbook(self):
-        """The underlying loaded workbooks."""
+        """The underlying loaded workbook, or None if this was not loaded from an Excel file.
+
+        Notes:
+            - The data is read in read-only mode, so the full workbook is only loaded when it is first requested.
+        """
+        if self._loaded_workbook is None and self._workbook_source is not None:
+            import openpyxl
+
+            source = self._workbook_source
+            self._loaded_workbook = openpyxl.load_workbook(io.BytesIO(source) if isinstance(source, bytes) else source)
+            self._workbook_source = None
         return self._loaded_workbook
 
     @property
@@ -174,55 +239,70 @@ class BaseInput:
         """The worksheet name."""
         return self._worksheet_name
 
-    def convert_to_form(self, hed_schema, tag_form):
+    def convert_to_form(self, hed_schema, tag_form, jobs=1):
         """Convert all tags in underlying dataframe to the specified form.
 
         Parameters:
             hed_schema (HedSchema): The schema to use to convert tags.
             tag_form (str): HedTag property to convert tags to.
                 Most cases should use convert_to_short or convert_to_long below.
+            jobs (int or None): Number of worker processes for the distinct strings. If 1 (default), convert in
+                this process. If 0 or None, use one per CPU.
         """
         from hed.models.df_util import convert_to_form
 
-        convert_to_form(self._dataframe, hed_schema, tag_form, self._mapper.get_tag_columns())
+        convert_to_form(self._dataframe, hed_schema, tag_form, self._mapper.get_tag_columns(), jobs=jobs)
+        self._data_changed()
 
-    def convert_to_short(self, hed_schema):
+    def convert_to_short(self, hed_schema, jobs=1):
         """Convert all tags in underlying dataframe to short form.
 
         Parameters:
             hed_schema (HedSchema): The schema to use to convert tags.
+            jobs (int or None): Number of worker processes, as in convert_to_form.
 
         """
-        self.convert_to_form(hed_schema, "short_tag")
+        self.convert_to_form(hed_schema, "short_tag", jobs=jobs)
 
-    def convert_to_long(self, hed_schema):
+    def convert_to_long(self, hed_schema, jobs=1):
         """Convert all tags in underlying dataframe to long form.
 
         Parameters:
             hed_schema (HedSchema or None): The schema to use to convert tags.
+            jobs (int or None): Number of worker processes, as in convert_to_form.
         """
-        self.convert_to_form(hed_schema, "long_tag")
+        self.convert_to_form(hed_schema, "long_tag", jobs=jobs)
 
-    def shrink_defs(self, hed_schema):
+    def shrink_defs(self, hed_schema, jobs=1):
         """Shrinks any def-expand found in the underlying dataframe.
 
         Parameters:
             hed_schema (HedSchema or None): The schema to use to identify defs.
+            jobs (int or None): Number of worker processes, as in convert_to_form.
         """
-        from df_util import shrink_defs
+        from hed.models.df_util import shrink_defs
 
-        shrink_defs(self._dataframe, hed_schema=hed_schema, columns=self._mapper.get_tag_columns())
+        shrink_defs(self._dataframe, hed_schema=hed_schema, columns=self._mapper.get_tag_columns(), jobs=jobs)
+        self._data_changed()
 
-    def expand_defs(self, hed_schema, def_dict):
-        """Shrinks any def-expand found in the underlying dataframe.
+    def expand_defs(self, hed_schema, def_dict, jobs=1):
+        """Expands any def tags found in the underlying dataframe.
 
         Parameters:
             hed_schema (HedSchema or None): The schema to use to identify defs.
             def_dict (DefinitionDict): The definitions to expand.
+            jobs (int or None): Number of worker processes, as in convert_to_form.
         """
-        from df_util import expand_defs
-
-        expand_defs(self._dataframe, hed_schema=hed_schema, def_dict=def_dict, columns=self._mapper.get_tag_columns())
+        from hed.models.df_util import expand_defs
+
+        expand_defs(
+            self._dataframe,
+            hed_schema=hed_schema,
+            def_dict=def_dict,
+            columns=self._mapper.get_tag_columns(),
+            jobs=jobs,
+        )
+        self._data_changed()
 
     def to_excel(self, file):
         """Output to an Excel file.
@@ -238,7 +318,7 @@ class BaseInput:
             raise ValueError("Empty file name or object passed in to BaseInput.save.")
 
         dataframe = self._dataframe
-        if self._loaded_workbook:
+        if self.loaded_workbook:
             old_worksheet = self.get_worksheet(self._worksheet_name)
             # Excel spreadsheets are 1 based, then add another 1 for column names if present
             adj_row_for_col_names = 1
@@ -288,7 +368,7 @@ class BaseInput:
             columns = list(self._dataframe.columns)
         return columns
 
-    def column_metadata(self) -> dict[int, "ColumnMetadata"]:
+    def column_metadata(self) -> dict[int, ColumnMetadata]:
         """Return the metadata for each column.
 
         Returns:
@@ -320,6 +400,7 @@ class BaseInput:
 
         new_text = new_string_obj.get_as_form(tag_form)
         self._dataframe.iloc[row_number, column_number] = new_text
+        self._data_changed()
 
     def get_worksheet(self, worksheet_name=None) -> openpyxl.workbook.Workbook | None:
         """Get the requested worksheet.
@@ -336,11 +417,12 @@ class BaseInput:
         Raises:
             KeyError: If the specified worksheet name does not exist.
         """
-        if worksheet_name and self._loaded_workbook:
-            # return self._loaded_workbook.get_sheet_by_name(worksheet_name)
-            return self._loaded_workbook[worksheet_name]
-        elif self._loaded_workbook:
-            return self._loaded_workbook.worksheets[0]
+        workbook = self.loaded_workbook
+        if worksheet_name and workbook:
+            # return workbook.get_sheet_by_name(worksheet_name)
+            return workbook[worksheet_name]
+        elif workbook:
+            return workbook.worksheets[0]
         else:
             return None
 
@@ -355,17 +437,37 @@ class BaseInput:
         Returns:
             pd.DataFrame: The converted data frame.
 
+        Notes:
+            - Read-only worksheets are streamed row by row. Their stored dimensions may be wrong,
+              so trailing empty rows are dropped and short rows are padded with None.
+
         """
+        data = list(BaseInput._get_worksheet_rows(worksheet))
+        width = max([len(row) for row in data], default=0)
+        data = [row + (None,) * (width - len(row)) if len(row) < width else row for row in data]
         if has_headers:
-            data = worksheet.values
             # first row is columns
-            cols = next(data)
-            data = list(data)
-            return pd.DataFrame(data, columns=cols, dtype=str)
+            return pd.DataFrame(data[1:], columns=data[0], dtype=str)
         else:
-            return pd.DataFrame(worksheet.values, dtype=str)
+            return pd.DataFrame(data, dtype=str)
 
-    def validate(self, hed_schema, extra_def_dicts=None, name=None, error_handler=None) -> list[dict]:
+    @staticmethod
+    def _get_worksheet_rows(worksheet):
+        """Yield the value tuples of the rows of a worksheet, without trailing empty rows of a read-only worksheet."""
+        if not hasattr(worksheet, "reset_dimensions"):
+            yield from worksheet.values
+            return
+        worksheet.reset_dimensions()
+        blank_rows = 0
+        for row in worksheet.iter_rows(values_only=True):
+            if all(value is None for value in row):
+                blank_rows += 1
+                continue
+            yield from [()] * blank_rows
+            blank_rows = 0
+            yield tuple(row)
+
+    def validate(self, hed_schema, extra_def_dicts=None, name=None, error_handler=None, issue_sink=None) -> list[dict]:
         """Creates a SpreadsheetValidator and returns all issues with this file.
 
         Parameters:
@@ -373,9 +475,10 @@ class BaseInput:
             extra_def_dicts (list of DefDict or DefDict): All definitions to use for validation.
             name (str): The name to report errors from this file as.
             error_handler (ErrorHandler): Error context to use. Creates a new one if None.
+            issue_sink (IssueSink or None): If given, the issues are written to this sink instead of returned.
 
         Returns:
-            list[dict]: A list of issues for a HED string.
+            list[dict]: A list of issues for a HED string (empty if an issue_sink is given).
         """
         from hed.validator.spreadsheet_validator import SpreadsheetValidator
 
@@ -383,7 +486,11 @@ class BaseInput:
             name = self.name
         tab_validator = SpreadsheetValidator(hed_schema)
         validation_issues = tab_validator.validate(
-            self, self._mapper.get_def_dict(hed_schema, extra_def_dicts), name, error_handler=error_handler
+            self,
+            self._mapper.get_def_dict(hed_schema, extra_def_dicts),
+            name,
+            error_handler=error_handler,
+            issue_sink=issue_sink,
         )
         return validation_issues
 
@@ -403,17 +510,83 @@ class BaseInput:
 
         Returns:
             pd.Dataframe: The assembled dataframe.
+
+        Notes:
+            - Within _caching_assembly the result is cached and a copy is returned. Otherwise the strings are
+              assembled on every call, so changes made to the dataframe are always picked up.
         """
         if mapper is None:
             mapper = self._mapper
 
-        all_columns = self._handle_transforms(mapper)
-        if skip_curly_braces:
-            return all_columns
-        transformers, _ = mapper.get_transformers()
-        refs = self.get_column_refs()
-        column_names = list(transformers)
-        return _handle_curly_braces_refs(all_columns, refs, column_names)
+        if self._assembly_cache is None:
+            all_columns = self._handle_transforms(mapper)
+            if skip_curly_braces:
+                return all_columns
+            transformers, _ = mapper.get_transformers()
+            return _handle_curly_braces_refs(all_columns, self.get_column_refs(), list(transformers))
+        state = self._get_assembly_state(mapper)
+        cached = self._assembly_cache.get(skip_curly_braces)
+        if cached is None or not self._same_assembly_state(cached[0], state):
+            all_columns = self._handle_transforms(mapper)
+            if not skip_curly_braces:
+                transformers, _ = mapper.get_transformers()
+                all_columns = _handle_curly_braces_refs(all_columns, state[-1], list(transformers))
+            cached = (state, all_columns)
+            self._assembly_cache[skip_curly_braces] = cached
+        return cached[1].copy()
+
+    @contextmanager
+    def _caching_assembly(self):
+        """Cache the assembled results of series_a and assemble within a block.
+
+        Notes:
+            - Used by validation, which reads the assembled results several times and does not hand out the
+              dataframe meanwhile. Changes made through this class still clear the cache.
+        """
+        if self._assembly_cache is not None:
+            yield
+            return
+        self._assembly_cache = {}
+        try:
+            yield
+        finally:
+            self._assembly_cache = None
+
+    def _get_assembly_state(self, mapper) -> tuple:
+        """Return the objects that the assembled results depend on.
+
+        Parameters:
+            mapper (ColumnMapper): The mapper used for assembly.
+
+        Returns:
+            tuple: The dataframe, the mapper, its column maps, and the column refs.
+
+        Notes:
+            - The mapper replaces its column maps whenever the mapping changes, so they are compared by identity.
+        """
+        return self._dataframe, mapper, mapper._final_column_map, mapper._column_map, self.get_column_refs()
+
+    def _data_changed(self):
+        """Clear the cached results after the dataframe is changed through this class."""
+        if self._assembly_cache:
+            self._assembly_cache.clear()
+        self._cache_key = None
+
+    @staticmethod
+    def _same_assembly_state(old_state, new_state) -> bool:
+        """Return True if the cached results built from old_state are still valid for new_state."""
+        *old_objects, old_refs = old_state
+        *new_objects, new_refs = new_state
+        return all(old is new for old, new in zip(old_objects, new_objects, strict=True)) and old_refs == new_refs
+
+    def __getstate__(self):
+        # The cached results are not copied or pickled; they are rebuilt on demand.
+        # Copies do not use the tabular cache, since their dataframe may be replaced.
+        state = self.__dict__.copy()
+        state["_assembly_cache"] = None
+        state["_cache_key"] = None
+        state["_cache_dataframe"] = None
+        return state
 
     def _handle_transforms(self, mapper) -> pd.DataFrame:
         """Apply transformations to the dataframe using the provided mapper.
@@ -425,25 +598,20 @@ class BaseInput:
             pd.DataFrame: The transformed dataframe with all transformations applied.
 
         Notes:
-            - Handles categorical column conversions before and after transformations
             - Returns original dataframe if no transformers are defined
-            - Categorical columns are temporarily converted to 'category' type for processing
-              then converted back to 'str' type after transformation
+            - Each transformer is applied once per distinct value in its column, rather than once per row.
+            - The underlying dataframe is not modified.
         """
-        transformers, need_categorical = mapper.get_transformers()
-        if transformers:
-            all_columns = self._dataframe
-            if need_categorical:
-                all_columns[need_categorical] = all_columns[need_categorical].astype("category")
-
-            all_columns = all_columns.transform(transformers)
-
-            if need_categorical:
-                all_columns[need_categorical] = all_columns[need_categorical].astype("str")
-        else:
-            all_columns = self._dataframe
+        transformers, _ = mapper.get_transformers()
+        if not transformers:
+            return self._dataframe
 
-        return all_columns
+        all_columns = {}
+        for column_name, transformer in transformers.items():
+            codes, uniques = pd.factorize(self._dataframe[column_name], use_na_sentinel=False)
+            transformed = np.array([transformer(value) for value in uniques], dtype=object)
+            all_columns[column_name] = transformed[codes]
+        return pd.DataFrame(all_columns, index=self._dataframe.index)
 
     @staticmethod
     def combine_dataframe(dataframe) -> pd.Series:
@@ -455,11 +623,25 @@ class BaseInput:
 
         Returns:
             pd.Series: The assembled series.
-        """
-        dataframe = dataframe.apply(lambda x: ", ".join(filter(lambda e: bool(e) and e != "n/a", map(str, x))), axis=1)
-        return dataframe
 
-    def get_def_dict(self, hed_schema, extra_def_dicts=None) -> "DefinitionDict":
+        Notes:
+            - Each column is joined in as a whole, with the empty and n/a values masked out.
+        """
+        combined = np.full(len(dataframe), "", dtype=object)
+        has_text = np.zeros(len(dataframe), dtype=bool)
+        for _, column in dataframe.items():
+            codes, uniques = pd.factorize(column, use_na_sentinel=False)
+            texts = np.array([str(value) for value in uniques], dtype=object)
+            keep = np.array([bool(text) and text != "n/a" for text in texts], dtype=bool)
+            texts, keep = texts[codes], keep[codes]
+            append = keep & has_text
+            combined[append] = combined[append] + ", " + texts[append]
+            first = keep & ~has_text
+            combined[first] = texts[first]
+            has_text |= keep
+        return pd.Series(combined, index=dataframe.index)
+
+    def get_def_dict(self, hed_schema, extra_def_dicts=None) -> DefinitionDict:
         """Return the definition dict for this file.
 
         Note: Baseclass implementation returns just extra_def_dicts.
@@ -544,7 +726,7 @@ class BaseInput:
 
         This method loads an Excel workbook using openpyxl, retrieves the specified
         worksheet (or the first one if none specified), and converts it to a pandas
-        DataFrame. The loaded workbook is stored for potential later use in saving.
+        DataFrame. The full workbook is loaded later, only if it is needed for saving.
 
         Parameters:
             file (str or file-like): Path to the Excel file or file-like object to load.
@@ -558,16 +740,26 @@ class BaseInput:
                 The original exception is chained for debugging purposes.
 
         Notes:
-            - Uses openpyxl library for Excel file handling
-            - Stores the loaded workbook in self._loaded_workbook for later use
+            - Uses openpyxl library for Excel file handling, in read-only mode so the rows are streamed
+              and only the needed worksheet is parsed
+            - Keeps the path (or the bytes of a file-like object) so loaded_workbook can load the full workbook
             - Retrieves worksheet using self._worksheet_name (or first sheet if None)
             - Converts worksheet data to DataFrame using _get_dataframe_from_worksheet
             - All data is converted to string type for consistency
         """
         try:
-            self._loaded_workbook = openpyxl.load_workbook(file)
-            loaded_worksheet = self.get_worksheet(self._worksheet_name)
-            self._dataframe = self._get_dataframe_from_worksheet(loaded_worksheet, has_column_names)
+            import openpyxl
+
+            source = file if isinstance(file, (str, os.PathLike)) else file.read()
+            workbook = openpyxl.load_workbook(
+                io.BytesIO(source) if isinstance(source, bytes) else source, read_only=True
+            )
+            try:
+                worksheet = workbook[self._worksheet_name] if self._worksheet_name else workbook.worksheets[0]
+                self._dataframe = self._get_dataframe_from_worksheet(worksheet, has_column_names)
+            finally:
+                workbook.close()
+            self._workbook_source = source
         except Exception as e:
             raise HedFileError(
                 HedExceptions.INVALID_FILE_FORMAT, f"Failed to load Excel file: {str(e)}", self.name
@@ -600,11 +792,19 @@ class BaseInput:
             - Skips blank lines during parsing
             - Uses specific na_values configuration ("", "null")
             - Handles pandas.errors.EmptyDataError for files with no data
+            - If the tabular cache is enabled, files with stored contents are opened from it (see tabular_cache)
         """
         if isinstance(file, str) and os.path.exists(file) and os.path.getsize(file) == 0:
             self._dataframe = pd.DataFrame()  # Handle empty file
             return
 
+        if isinstance(file, str) and os.path.isfile(file) and tabular_cache.get_tabular_cache_folder():
+            self._cache_key = tabular_cache.get_file_key(file, pandas_header is not None)
+            dataframe = tabular_cache.load_dataframe(self._cache_key)
+            if dataframe is not None:
+                self._dataframe = self._cache_dataframe = dataframe
+                return
+
         try:
             self._dataframe = pd.read_csv(
                 file,
@@ -623,3 +823,6 @@ class BaseInput:
             raise HedFileError(
                 HedExceptions.INVALID_FILE_FORMAT, f"Failed to load text file: {str(e)}", self.name
             ) from e
+        if self._cache_key:
+            self._cache_dataframe = self._dataframe
+            tabular_cache.save_dataframe(self._cache_key, self._dataframe)
@@ -6,6 +6,7 @@ import re
 from collections import defaultdict
 from itertools import combinations, product
 
+import numpy as np
 import pandas as pd
 
 
@@ -48,49 +49,48 @@ def find_matching(series, search_string, regex=False):
         anywhere_words += specific_words
         specific_words = []
     delimiter_map = construct_delimiter_map(search_string, specific_words)
-    candidate_indexes = _verify_basic_words(series, anywhere_words, negative_words)
 
-    # do a basic check for all specific words(this doesn't verify word delimiters)
-    for word in specific_words:
-        matches = series.str.contains(word, regex=True)
-        current_word_indexes = set(matches[matches].index.tolist())
+    # Lines are usually highly repetitive, so each check runs once per distinct line.
+    codes, values = pd.factorize(series.to_numpy(dtype=object))
 
-        candidate_indexes &= current_word_indexes
+    # A single pass with the combined prefilter checks the anywhere, negative and (undelimited) specific words.
+    prefilter = _get_prefilter(anywhere_words, negative_words, specific_words)
+    mask = np.zeros(len(values) + 1, dtype=bool)
+    mask[:-1] = [isinstance(value, str) and prefilter.match(value) is not None for value in values]
 
-        if not candidate_indexes:
-            break
+    # Only the surviving lines need the more expensive delimiter check.
+    if specific_words and mask.any():
+        word_patterns = [(word, _get_word_pattern(word)) for word in specific_words]
+        candidates = np.flatnonzero(mask)
+        mask[candidates] = [_verify_delimiters(values[pos], word_patterns, delimiter_map) for pos in candidates]
 
-    candidate_indexes = sorted(candidate_indexes)
+    # Missing values have code -1, which picks the trailing False entry.
+    return pd.Series(mask[codes], index=series.index, dtype=bool)
 
-    full_mask = pd.Series(False, index=series.index, dtype=bool)
-
-    if candidate_indexes:
-        if specific_words:
-            candidate_series = series[candidate_indexes]
-            mask = candidate_series.apply(verify_search_delimiters, args=(specific_words, delimiter_map))
-            full_mask.loc[candidate_indexes] = mask
-        else:
-            full_mask.loc[candidate_indexes] = True
-
-    return full_mask
 
+def _get_word_pattern(word):
+    """Return the compiled pattern matching word as a whole term, with the word as group 1."""
+    return re.compile(r"(?:[ ,()]|^)(" + word + r")(?:[ ,()]|$)")
 
-def _get_word_indexes(series, word):
-    pattern = r"(?:[ ,()]|^)" + word + r"(?:[ ,()]|$)"
-    matches = series.str.contains(pattern, regex=True)
-    return set(matches[matches].index.tolist())
 
+def _get_prefilter(anywhere_words, negative_words, specific_words):
+    """Return one compiled regex that matches a line only if it passes all the basic word checks.
 
-def _verify_basic_words(series, anywhere_words, negative_words):
-    candidate_indexes = set(series.index)
-    for word in anywhere_words:
-        current_word_indexes = _get_word_indexes(series, word)
-        candidate_indexes &= current_word_indexes
+    Parameters:
+        anywhere_words (list): Words that must appear as whole terms.
+        negative_words (list): Words that must not appear as whole terms.
+        specific_words (list): Words that must appear, possibly as part of a longer term.
 
-    for word in negative_words:
-        current_word_indexes = _get_word_indexes(series, word)
-        candidate_indexes -= current_word_indexes
-    return candidate_indexes
+    Returns:
+        re.Pattern: A pattern to be applied with match, built from one lookahead per required word
+                    and one negative lookahead for the alternation of all the negative words.
+    """
+    parts = [r"(?=[\s\S]*?(?:[ ,()]|^)(?:" + word + r")(?:[ ,()]|$))" for word in anywhere_words]
+    parts += [r"(?=[\s\S]*?(?:" + word + r"))" for word in specific_words]
+    if negative_words:
+        alternation = "|".join(f"(?:{word})" for word in negative_words)
+        parts.append(r"(?![\s\S]*?(?:[ ,()]|^)(?:" + alternation + r")(?:[ ,()]|$))")
+    return re.compile("".join(parts))
 
 
 def find_words(search_string):
@@ -221,19 +221,34 @@ def verify_search_delimiters(text, specific_words, delimiter_map):
         specific_words (list of str): Words that must appear relative to other words in the text.
         delimiter_map (dict): A dictionary specifying expected delimiters between pairs of specific words.
 
+    Returns:
+        bool: True if all conditions are met, otherwise False.
+    """
+    word_patterns = [(word, _get_word_pattern(word)) for word in specific_words]
+    return _verify_delimiters(text, word_patterns, delimiter_map)
+
+
+def _verify_delimiters(text, word_patterns, delimiter_map):
+    """Verify the delimiters between words using patterns compiled once per search.
+
+    Parameters:
+        text (str): The text to search in.
+        word_patterns (list): (word, compiled whole-word pattern) pairs for the specific words.
+        delimiter_map (dict): A dictionary specifying expected delimiters between pairs of specific words.
+
     Returns:
         bool: True if all conditions are met, otherwise False.
     """
     locations = defaultdict(list)
 
     # Find all locations for each word in the text
-    for word in specific_words:
-        for match in re.finditer(r"(?:[ ,()]|^)(" + word + r")(?:[ ,()]|$)", text):
+    for word, pattern in word_patterns:
+        for match in pattern.finditer(text):
             start_index = match.start(1)
             matched_word = match.group(1)
             locations[word].append((start_index, len(matched_word), word))
 
-    if len(locations) != len(specific_words):
+    if len(locations) != len(word_patterns):
         return False
 
     # Generate all possible combinations of word sequences
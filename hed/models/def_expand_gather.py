@@ -2,11 +2,14 @@
 Classes to resolve ambiguities, gather, expand definitions.
 """
 
+from functools import partial
+
 import pandas as pd
 
 from hed.models.definition_dict import DefinitionDict
 from hed.models.definition_entry import DefinitionEntry
 from hed.models.hed_string import HedString
+from hed.models.parallel_util import map_items
 
 
 class AmbiguousDef:
@@ -137,16 +140,24 @@ class DefExpandGatherer:
         self.errors = errors if errors else {}
         self.def_dict = DefinitionDict(known_defs, self.hed_schema)
 
-    def process_def_expands(self, hed_strings, known_defs=None) -> tuple["DefinitionDict", dict, dict]:
+    def process_def_expands(self, hed_strings, known_defs=None, jobs=1) -> tuple["DefinitionDict", dict, dict]:
         """Process the HED strings containing def-expand tags.
 
         Parameters:
             hed_strings (pd.Series or list): A Pandas Series or list of HED strings to be processed.
             known_defs (dict, optional): A dictionary of known definitions to be added.
+            jobs (int or None): Number of worker processes used to parse the distinct strings. If 1 (default),
+                parse in this process. If 0 or None, use one per CPU.
 
         Returns:
             tuple [DefinitionDict, dict, dict]: A tuple containing the DefinitionDict, ambiguous definitions, and a
                                             dictionary of error lists keyed by definition name
+
+        Notes:
+            - Each distinct string is parsed and sorted once, and each distinct def-expand group is parsed once.
+              The def-expands are still gathered once per occurrence and in row order, so the results are
+              the same as processing the strings one at a time.
+            - To gather definitions from a whole dataset, pass the strings of all its files in one call.
         """
         if not isinstance(hed_strings, pd.Series):
             hed_strings = pd.Series(hed_strings)
@@ -155,26 +166,38 @@ class DefExpandGatherer:
 
         if known_defs:
             self.def_dict.add_definitions(known_defs, self.hed_schema)
-        for i in hed_strings[def_expand_mask].index:
-            string = hed_strings.loc[i]
-            self._process_def_expand(string)
+        codes, unique_strings = pd.factorize(hed_strings[def_expand_mask])
+        found_groups = map_items(
+            partial(_find_def_expand_groups, hed_schema=self.hed_schema), list(unique_strings), jobs
+        )
+        group_cache = {}
+        # Known definitions are never replaced during gathering, so a group that matched one will always match it.
+        known_matches = set()
+        for code in codes:
+            for group_key in found_groups[code]:
+                if group_key in known_matches:
+                    continue
+                group_text, tag_index = group_key
+                def_expand_group = group_cache.get(group_text)
+                if def_expand_group is None:
+                    def_expand_group = HedString(group_text, self.hed_schema).children[0]
+                    group_cache[group_text] = def_expand_group
+                def_tag = def_expand_group.tags()[tag_index]
+                self._process_def_expand_group(def_tag, def_expand_group)
+                if self.def_dict._get_definition_contents(def_tag) == def_expand_group:
+                    known_matches.add(group_key)
         self._resolve_ambiguous()
         return self.def_dict, self.ambiguous_defs, self.errors
 
-    def _process_def_expand(self, string):
-        """Process a single HED string to extract definitions and handle known and ambiguous definitions.
+    def _process_def_expand_group(self, def_tag, def_expand_group):
+        """Handle a single def-expand group as either a known or an ambiguous definition.
 
         Parameters:
-            string (str): The HED string to be processed.
+            def_tag (HedTag): The def-expand tag.
+            def_expand_group (HedGroup): The sorted group containing the def-expand tag and its contents.
         """
-        hed_str = HedString(string, self.hed_schema)
-        hed_str.sort()
-        for def_tag, def_expand_group, _def_group in hed_str.find_def_tags(recursive=True):
-            if def_tag == def_expand_group:
-                continue
-
-            if not self._handle_known_definition(def_tag, def_expand_group):
-                self._handle_ambiguous_definition(def_tag, def_expand_group)
+        if not self._handle_known_definition(def_tag, def_expand_group):
+            self._handle_ambiguous_definition(def_tag, def_expand_group)
 
     def _handle_known_definition(self, def_tag, def_expand_group):
         """Handle known def-expand tag in a HED string.
@@ -255,3 +278,25 @@ class DefExpandGatherer:
 
         for def_name in delete_list:
             del self.ambiguous_defs[def_name]
+
+
+def _find_def_expand_groups(hed_string, hed_schema):
+    """Return the def-expand groups of a HED string, in the order they are processed.
+
+    Parameters:
+        hed_string (str): The HED string to search.
+        hed_schema (HedSchema): The schema used to parse the string.
+
+    Returns:
+        list[tuple[str, int]]: The text of each sorted def-expand group and the position of its
+                               def-expand tag among the group's tags.
+    """
+    hed_str = HedString(hed_string, hed_schema)
+    hed_str.sort()
+    found = []
+    for def_tag, def_expand_group, _def_group in hed_str.find_def_tags(recursive=True):
+        if def_tag == def_expand_group:
+            continue
+        tag_index = next(index for index, tag in enumerate(def_expand_group.tags()) if tag is def_tag)
+        found.append((str(def_expand_group), tag_index))
+    return found
@@ -1,18 +1,19 @@
 """Utilities for assembly and conversion of HED strings to different forms."""
 
-import math
 import re
 from collections import defaultdict
 from functools import partial
 
+import numpy as np
 import pandas as pd
 
 from hed.models.definition_dict import DefinitionDict
 from hed.models.hed_string import HedString
 from hed.models.model_constants import DefTagNames
+from hed.models.parallel_util import map_items
 
 
-def convert_to_form(df, hed_schema, tag_form, columns=None):
+def convert_to_form(df, hed_schema, tag_form, columns=None, jobs=1):
     """Convert all tags in underlying dataframe to the specified form (in place).
 
     Parameters:
@@ -20,40 +21,30 @@ def convert_to_form(df, hed_schema, tag_form, columns=None):
         hed_schema (HedSchema): The schema to use to convert tags.
         tag_form (str): HedTag property to convert tags to.
         columns (list): The columns to modify on the dataframe.
+        jobs (int or None): Number of worker processes for the distinct strings. If 1 (default), convert in this
+            process. If 0 or None, use one per CPU.
 
-    """
-    if isinstance(df, pd.Series):
-        df[:] = df.apply(partial(_convert_to_form, hed_schema=hed_schema, tag_form=tag_form))
-    else:
-        if columns is None:
-            columns = df.columns
+    Notes:
+        - Each distinct string is converted once and the result is broadcast to every row containing it.
 
-        for column in columns:
-            df[column] = df[column].apply(partial(_convert_to_form, hed_schema=hed_schema, tag_form=tag_form))
+    """
+    _transform_in_place(df, partial(_convert_to_form, hed_schema=hed_schema, tag_form=tag_form), columns, jobs=jobs)
 
 
-def shrink_defs(df, hed_schema, columns=None):
+def shrink_defs(df, hed_schema, columns=None, jobs=1):
     """Shrink (in place) any def-expand tags found in the specified columns in the dataframe.
 
     Parameters:
         df (pd.Dataframe or pd.Series): The dataframe or series to modify.
         hed_schema (HedSchema or None): The schema to use to identify defs.
         columns (list or None): The columns to modify on the dataframe.
+        jobs (int or None): Number of worker processes for the distinct strings, as in convert_to_form.
 
     """
-    if isinstance(df, pd.Series):
-        mask = df.str.contains("Def-expand/", case=False)
-        df[mask] = df[mask].apply(partial(_shrink_defs, hed_schema=hed_schema))
-    else:
-        if columns is None:
-            columns = df.columns
+    _transform_in_place(df, partial(_shrink_defs, hed_schema=hed_schema), columns, "def-expand/", jobs)
 
-        for column in columns:
-            mask = df[column].str.contains("Def-expand/", case=False)
-            df.loc[mask, column] = df[column][mask].apply(partial(_shrink_defs, hed_schema=hed_schema))
 
-
-def expand_defs(df, hed_schema, def_dict, columns=None):
+def expand_defs(df, hed_schema, def_dict, columns=None, jobs=1):
     """Expands any def tags found in the dataframe.
 
         Converts in place
@@ -63,19 +54,57 @@ def expand_defs(df, hed_schema, def_dict, columns=None):
         hed_schema (HedSchema or None): The schema to use to identify defs.
         def_dict (DefinitionDict): The definitions to expand.
         columns (list or None): The columns to modify on the dataframe.
+        jobs (int or None): Number of worker processes for the distinct strings, as in convert_to_form.
+    """
+    _transform_in_place(df, partial(_expand_defs, hed_schema=hed_schema, def_dict=def_dict), columns, "def/", jobs)
+
+
+def _transform_in_place(df, func, columns=None, contains=None, jobs=1):
+    """Apply a string transform to a series or to columns of a dataframe (in place).
+
+    Parameters:
+        df (pd.Dataframe or pd.Series): The dataframe or series to modify.
+        func (callable): Function taking and returning a single HED string.
+        columns (list or None): The columns to modify on the dataframe. If None, all columns.
+        contains (str or None): If given, only strings containing this casefolded text are transformed.
+        jobs (int or None): Number of worker processes for the distinct strings.
     """
     if isinstance(df, pd.Series):
-        mask = df.str.contains("Def/", case=False)
-        df[mask] = df[mask].apply(partial(_expand_defs, hed_schema=hed_schema, def_dict=def_dict))
-    else:
-        if columns is None:
-            columns = df.columns
+        rows, values = _transform_unique(df, func, contains, jobs)
+        df[rows] = values
+        return
+    if columns is None:
+        columns = df.columns
+    for column in columns:
+        rows, values = _transform_unique(df[column], func, contains, jobs)
+        df.loc[rows, column] = values
 
-        for column in columns:
-            mask = df[column].str.contains("Def/", case=False)
-            df.loc[mask, column] = df.loc[mask, column].apply(
-                partial(_expand_defs, hed_schema=hed_schema, def_dict=def_dict)
-            )
+
+def _transform_unique(series, func, contains=None, jobs=1):
+    """Apply func once per distinct string in series.
+
+    Parameters:
+        series (pd.Series): The strings to transform.
+        func (callable): Function taking and returning a single HED string.
+        contains (str or None): If given, only strings containing this casefolded text are transformed.
+        jobs (int or None): Number of worker processes for the distinct strings.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+        - Boolean mask of the rows that were transformed.
+        - The new values of those rows, in row order.
+    """
+    codes, uniques = pd.factorize(series)
+    selected = np.array(
+        [isinstance(value, str) and (contains is None or contains in value.casefold()) for value in uniques],
+        dtype=bool,
+    )
+    positions = np.flatnonzero(selected)
+    results = np.empty(len(uniques), dtype=object)
+    results[positions] = map_items(func, [uniques[pos] for pos in positions], jobs)
+    # Missing values have code -1 and are never selected.
+    rows = np.append(selected, False)[codes]
+    return rows, results[codes[rows]]
 
 
 def _convert_to_form(hed_string, hed_schema, tag_form):
@@ -91,7 +120,7 @@ def _expand_defs(hed_string, hed_schema, def_dict):
 
 
 def process_def_expands(
-    hed_strings, hed_schema, known_defs=None, ambiguous_defs=None
+    hed_strings, hed_schema, known_defs=None, ambiguous_defs=None, jobs=1
 ) -> tuple["DefinitionDict", dict, dict]:
     """Gather def-expand tags in the strings/compare with known definitions to find any differences.
 
@@ -103,6 +132,7 @@ def process_def_expands(
             match perfectly.
         ambiguous_defs (dict): A dictionary containing ambiguous definitions.
             format TBD. Currently def name key: list of lists of HED tags values
+        jobs (int or None): Number of worker processes for parsing the distinct strings, as in convert_to_form.
 
     Returns:
         tuple [DefinitionDict, dict, dict]: A tuple containing the DefinitionDict, ambiguous definitions, and a
@@ -111,7 +141,7 @@ def process_def_expands(
     from hed.models.def_expand_gather import DefExpandGatherer
 
     def_gatherer = DefExpandGatherer(hed_schema, known_defs, ambiguous_defs)
-    return def_gatherer.process_def_expands(hed_strings)
+    return def_gatherer.process_def_expands(hed_strings, jobs=jobs)
 
 
 def sort_dataframe_by_onsets(df):
@@ -245,22 +275,27 @@ def split_delay_tags(series, hed_schema, onsets):
         for (i, hed_string) in series.items()
         if "delay/" in hed_string.casefold()
     ]
-    delay_groups = []
+    # The delayed groups are collected and appended in one step, rather than growing the dataframe row by row.
+    delayed_hed, delayed_onsets, delayed_index = [], [], []
+    updated_index, updated_hed = [], []
     for i, delay_string in delay_strings:
         duration_tags = delay_string.find_top_level_tags({DefTagNames.DELAY_KEY})
         to_remove = []
         for tag, group in duration_tags:
-            onset_mod = tag.value_as_default_unit() + float(onsets[i])
+            delayed_hed.append(str(group))
+            delayed_onsets.append(tag.value_as_default_unit() + float(onsets[i]))
+            delayed_index.append(i)
             to_remove.append(group)
-            insert_index = split_df["original_index"].index.max() + 1
-            split_df.loc[insert_index] = {"HED": str(group), "onset": onset_mod, "original_index": i}
         delay_string.remove(to_remove)
-        # update the old string with the removals done
-        split_df.at[i, "HED"] = str(delay_string)
-
-    for i, onset_mod, group in delay_groups:
-        insert_index = split_df["original_index"].index.max() + 1
-        split_df.loc[insert_index] = {"HED": str(group), "onset": onset_mod, "original_index": i}
+        updated_index.append(i)
+        updated_hed.append(str(delay_string))
+
+    if updated_index:
+        # update the old strings with the removals done
+        split_df.loc[updated_index, "HED"] = updated_hed
+    if delayed_hed:
+        delayed_df = pd.DataFrame({"onset": delayed_onsets, "HED": delayed_hed, "original_index": delayed_index})
+        split_df = pd.concat([split_df, delayed_df], ignore_index=True)
     split_df = sort_dataframe_by_onsets(split_df)
     split_df.reset_index(drop=True, inplace=True)
 
@@ -278,42 +313,103 @@ def filter_series_by_onset(series, onsets):
     Returns:
         Union[Series, Dataframe]: the series with rows filtered together.
     """
-
-    indexed_dict = _indexed_dict_from_onsets(pd.to_numeric(onsets, errors="coerce"))
-    y = _filter_by_index_list(series, indexed_dict=indexed_dict)
-    return y
+    group_codes, _ = _group_codes_from_onsets(pd.to_numeric(onsets, errors="coerce"))
+    return _join_by_group_codes(series, group_codes)
 
 
 def _indexed_dict_from_onsets(onsets):
     """Finds series of consecutive lines with the same (or close enough) onset."""
-    current_onset = -1000000.0
-    tol = 1e-9
+    group_codes, group_onsets = _group_codes_from_onsets(onsets)
     indexed_dict = defaultdict(list)
+    for i in np.flatnonzero(group_codes >= 0):
+        indexed_dict[float(group_onsets[group_codes[i]])].append(int(i))
+    return indexed_dict
 
-    for i, onset in enumerate(onsets):
-        if math.isnan(onset):  # Ignore NaNs
-            continue
-        if abs(onset - current_onset) > tol:
-            current_onset = onset
-        indexed_dict[current_onset].append(i)
 
-    return indexed_dict
+def _group_codes_from_onsets(onsets, tol=1e-9):
+    """Number the runs of consecutive lines with the same (or close enough) onset.
+
+    Parameters:
+        onsets (array-like): The numeric onsets, NaN for lines without an onset.
+        tol (float): Onsets within this distance of the first onset of a run are part of the run.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+        - The group code of each line, with -1 for lines with a NaN onset.
+        - The onset starting each group, indexed by group code.
+
+    Notes:
+        - Runs that start with the same onset share a code, so their lines are joined together.
+        - Codes are numbered in order of first appearance.
+    """
+    onset_values = np.asarray(onsets, dtype=float)
+    group_codes = np.full(len(onset_values), -1, dtype=np.intp)
+    valid = np.flatnonzero(~np.isnan(onset_values))
+    # The leading sentinel starts the first run.
+    values = np.concatenate(([-1000000.0], onset_values[valid]))
+    steps = np.abs(np.diff(values))
+    if np.any((steps > 0) & (steps <= tol)):
+        # Some onsets drift within tolerance, so compare each one against the start of its run.
+        run_starts = values.copy()
+        for pos in range(1, len(values)):
+            if abs(values[pos] - run_starts[pos - 1]) <= tol:
+                run_starts[pos] = run_starts[pos - 1]
+    else:
+        # Every run holds one exact value, so a run starts wherever consecutive onsets differ.
+        is_start = np.concatenate(([True], steps > tol))
+        run_starts = values[np.flatnonzero(is_start)[np.cumsum(is_start) - 1]]
+    group_codes[valid], group_onsets = pd.factorize(run_starts[1:])
+    return group_codes, group_onsets
 
 
 def _filter_by_index_list(original_data, indexed_dict):
     """Filters a series or dataframe by the indexed_dict, joining lines as indicated"""
+    group_codes = np.full(len(_get_hed_series(original_data)), -1, dtype=np.intp)
+    for code, indices in enumerate(indexed_dict.values()):
+        group_codes[indices] = code
+    return _join_by_group_codes(original_data, group_codes)
+
+
+def _get_hed_series(original_data):
+    """Return the series itself, or the HED column of a dataframe."""
     if isinstance(original_data, pd.Series):
-        data_series = original_data
+        return original_data
     elif isinstance(original_data, pd.DataFrame):
-        data_series = original_data["HED"]
-    else:
-        raise TypeError("Input must be a pandas Series or DataFrame")
+        return original_data["HED"]
+    raise TypeError("Input must be a pandas Series or DataFrame")
+
+
+def _join_by_group_codes(original_data, group_codes):
+    """Join the HED strings of each group into the first line of the group, leaving the other lines empty.
 
-    new_series = pd.Series([""] * len(data_series), dtype=data_series.dtype)
-    for _onset, indices in indexed_dict.items():
-        if indices:
-            first_index = indices[0]
-            new_series.iloc[first_index] = ",".join([str(data_series.iloc[i]) for i in indices])
+    Parameters:
+        original_data (pd.Series or pd.DataFrame): The strings to join. If dataframe, it joins the "HED" column.
+        group_codes (np.ndarray): The group code of each line, -1 for lines that are not part of any group.
+
+    Returns:
+        Union[pd.Series, pd.DataFrame]: The joined series, or a copy of the dataframe with the HED column joined.
+
+    Raises:
+        TypeError: If original_data is not a Series or DataFrame.
+    """
+    data_series = _get_hed_series(original_data)
+    joined = np.full(len(data_series), "", dtype=object)
+    grouped = np.flatnonzero(group_codes >= 0)
+    if len(grouped):
+        codes = group_codes[grouped]
+        group_sizes = np.bincount(codes)
+        present_codes, first_positions = np.unique(codes, return_index=True)
+        is_single = group_sizes[present_codes] == 1
+        # Most groups are single lines, which are copied directly; only the rest go through a grouped join.
+        singles = grouped[first_positions[is_single]]
+        joined[singles] = [str(value) for value in data_series.iloc[singles]]
+        if not is_single.all():
+            multiple = grouped[group_sizes[codes] > 1]
+            texts = pd.Series([str(value) for value in data_series.iloc[multiple]], dtype=object)
+            joined_groups = texts.groupby(group_codes[multiple], sort=False).agg(",".join)
+            first_rows = grouped[first_positions[~is_single]]
+            joined[first_rows] = joined_groups.loc[present_codes[~is_single]].to_numpy()
+    new_series = pd.Series(joined, dtype=data_series.dtype)
 
     if isinstance(original_data, pd.Series):
         return new_series
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from hed.models.model_constants import DefTagNames
 from hed.schema.hed_schema_constants import HedKey
+from hed.schema.term_ids import NO_TERM_IDS, get_known_term_ids
 
 if TYPE_CHECKING:
     from hed.models.hed_group import HedGroup
@@ -361,8 +362,7 @@ class HedTag:
             'Duration/3 ms' will return ('3', 'ms')
 
         """
-        tag_unit_classes = self.unit_classes
-        stripped_value, units, match = HedTag._get_tag_units_portion(extension_text, tag_unit_classes)
+        stripped_value, units, match, _ = self._get_units_portion(extension_text)
         if stripped_value and match:
             return stripped_value, units
         elif units and not match:
@@ -379,14 +379,13 @@ class HedTag:
             'Duration/300 ms' will return .3
 
         """
-        tag_unit_classes = self.unit_classes
-        stripped_value, unit, unit_entry = HedTag._get_tag_units_portion(self.extension, tag_unit_classes)
+        stripped_value, unit, unit_entry, conversion_factor = self._get_units_portion(self.extension)
         if not stripped_value:
             return None
         if unit and not unit_entry:
             return None
-        if unit and unit_entry and unit_entry.get_conversion_factor(unit) is not None:
-            return float(stripped_value) * unit_entry.get_conversion_factor(unit)
+        if conversion_factor is not None:
+            return float(stripped_value) * conversion_factor
         return float(stripped_value)
 
     @property
@@ -534,6 +533,17 @@ class HedTag:
             default_unit = first_unit_class_entry.has_attribute(HedKey.DefaultUnits, return_value=True)
             return first_unit_class_entry.units.get(default_unit, None)
 
+    @property
+    def tag_flags(self) -> int:
+        """The TagFlags bits precomputed on the schema entry of this tag.
+
+        Returns:
+            int: A combination of TagFlags values, or 0 if the tag is not in the schema.
+        """
+        if not self._schema_entry:
+            return 0
+        return self._schema_entry.tag_flags
+
     def base_tag_has_attribute(self, tag_attribute) -> bool:
         """Check to see if the tag has a specific attribute.
 
@@ -572,6 +582,27 @@ class HedTag:
             return org_tag[: first_colon + 1]
         return ""
 
+    def _get_units_portion(self, extension_text):
+        """Split a value portion into value, units, its valid unitEntry (if any) and conversion factor.
+
+        Parameters:
+            extension_text (str): A string representing the value portion of this tag.
+
+        Returns:
+            tuple: The values returned by _get_tag_units_portion followed by the conversion factor
+                   of the units (None if there is no match or the unit has no conversion factor).
+
+        Notes:
+            - The units are looked up in the unit table precomputed on the schema entry.
+        """
+        value, _, units = extension_text.partition(" ")
+        if not units:
+            return value, None, None, None
+        if not self._schema_entry:
+            return value, units, None, None
+        unit_entry, conversion_factor = self._schema_entry.get_unit_entry(units)
+        return value, units, unit_entry, conversion_factor
+
     @staticmethod
     def _get_tag_units_portion(extension_text, tag_unit_classes):
         """Split a value portion into value, units and its valid unitEntry (if any).
@@ -661,6 +692,22 @@ class HedTag:
             return True
         return False
 
+    @property
+    def tag_term_ids(self) -> frozenset:
+        """Return the integer ids of the tag_terms, which bare-term queries match against.
+
+        Returns:
+            frozenset[int]: The ids, read from the schema entry (see hed.schema.term_ids).
+
+        Notes:
+            - If tag_terms were set to something other than the schema entry's terms, only the terms
+              that already have an id are included.
+        """
+        entry = self._schema_entry
+        if entry is not None and self.tag_terms is entry.tag_terms:
+            return entry.tag_term_ids
+        return get_known_term_ids(self.tag_terms) if self.tag_terms else NO_TERM_IDS
+
     def __deepcopy__(self, memo):
         # Check if the object has already been copied.
         if id(self) in memo:
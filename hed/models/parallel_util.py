@@ -0,0 +1,54 @@
+"""Utilities for running work on lists of items in a pool of worker processes."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+
+def map_chunks(chunk_func, items, jobs=1) -> list:
+    """Apply a function to consecutive chunks of a list of items, in worker processes if jobs is not 1.
+
+    Parameters:
+        chunk_func (callable): Takes a list of items and returns a result. Must be picklable if jobs is not 1.
+        items (list): The items to split into chunks.
+        jobs (int or None): Number of worker processes. If 1 (default), chunk_func is called once on all
+            the items in this process. If 0 or None, one worker per CPU is used.
+
+    Returns:
+        list: The results of chunk_func for each chunk, in the order of the items.
+
+    Notes:
+        - Several chunks are made per worker, so that chunk_func and its arguments are pickled a few times
+          rather than once per item, and a few slow items do not leave the other workers idle.
+
+    """
+    items = list(items)
+    if not jobs or jobs < 1:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(items))
+    if jobs <= 1:
+        return [chunk_func(items)]
+    chunk_size = -(-len(items) // (jobs * 4))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(chunk_func, chunks))
+
+
+def map_items(func, items, jobs=1) -> list:
+    """Return [func(item) for item in items], computed by worker processes if jobs is not 1.
+
+    Parameters:
+        func (callable): Takes an item and returns a result. Must be picklable if jobs is not 1.
+        items (list): The items to apply func to.
+        jobs (int or None): Number of worker processes, as in map_chunks.
+
+    Returns:
+        list: The result of func for each item, in order.
+    """
+    return [result for chunk_results in map_chunks(partial(_map_chunk, func), items, jobs) for result in chunk_results]
+
+
+def _map_chunk(func, items):
+    return [func(item) for item in items]
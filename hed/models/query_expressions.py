@@ -1,6 +1,7 @@
 """Classes representing parsed query expressions."""
 
 from hed.models.query_util import SearchResult
+from hed.schema.term_ids import get_term_id
 
 
 class Expression:
@@ -25,6 +26,26 @@ class Expression:
         if "*" in token.text:
             self._match_mode = Expression.MATCH_WILDCARD
             token.text = token.text.replace("*", "")
+        # Bare terms are matched by integer id against each tag's tag_term_ids, once a schema term has the id.
+        self._term_id = None
+
+    def _get_term_id(self):
+        """Return the id of the bare term, or None if no schema term has it, in which case it is matched as text."""
+        if self._term_id is None:
+            self._term_id = get_term_id(self.token.text)
+        return self._term_id
+
+    @staticmethod
+    def _get_child_ids(children) -> frozenset:
+        """Return the ids of the children of a result, as SearchResult(group, children) would hold them."""
+        if not isinstance(children, list):
+            children = [children]
+        return frozenset(id(child) for child in children if child is not None)
+
+    @staticmethod
+    def _get_parent_pairs(pairs) -> list:
+        """Return the (group, child ids) pairs that _get_parent_groups would return as results."""
+        return [(group._parent, frozenset((id(group),))) for group, _ in pairs if group.is_group and group._parent]
 
     @staticmethod
     def _get_parent_groups(search_results):
@@ -56,12 +77,67 @@ class Expression:
             hed_group(HedGroup): The object to search
             exact(bool): If True, we are only looking for groups containing this term directly, not descendants.
         """
+        groups_found = self._find_tags(hed_group)
+
+        # If we're checking for all groups, also need to add parents.
+        if exact:
+            all_found_groups = [SearchResult(group, tag) for tag, group in groups_found]
+        else:
+            all_found_groups = []
+            for tag, group in groups_found:
+                while group:
+                    all_found_groups.append(SearchResult(group, tag))
+                    # This behavior makes it eat higher level groups at higher levels
+                    tag = group
+                    group = group._parent
+        return all_found_groups
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        """Return the results of handle_expr as (group, child ids) pairs, without building SearchResult objects.
+
+        Parameters:
+            hed_group (HedGroup): The object to search.
+            exact (bool): If True, we are only looking for groups containing this term directly, not descendants.
+
+        Returns:
+            list: A (HedGroup, frozenset) pair for each result, holding its group and the ids of its children.
+
+        Notes:
+            - Used by has_match of the AND and other compound expressions, which only need to know whether
+              results in the same group have disjoint children.
+        """
+        pairs = []
+        for tag, group in self._find_tags(hed_group):
+            pairs.append((group, self._get_child_ids(tag)))
+            if exact:
+                continue
+            tag, group = group, group._parent
+            while group:
+                pairs.append((group, frozenset((id(tag),))))
+                tag, group = group, group._parent
+        return pairs
+
+    def _find_tags(self, hed_group) -> list:
+        """Return a (tag, containing group) pair for each tag matching this term.
+
+        Parameters:
+            hed_group (HedGroup): The object to search.
+
+        Returns:
+            list: The (tag, group) pairs, or ([], group) for every group if a term that must not be in the line is absent.
+        """
         if self._match_mode == Expression.MATCH_WILDCARD:
             groups_found = hed_group.find_wildcard_tags([self.token.text], recursive=True, include_groups=2)
         elif self._match_mode == Expression.MATCH_EXACT:
             groups_found = hed_group.find_exact_tags([self.token.text], recursive=True, include_groups=2)
         else:
-            groups_found = hed_group.find_tags_with_term(self.token.text, recursive=True, include_groups=2)
+            # Same as find_tags_with_term(self.token.text, recursive=True, include_groups=2), but by term id.
+            term_id = self._get_term_id()
+            if term_id is None:
+                term = self.token.text
+                groups_found = [(tag, tag._parent) for tag in hed_group.get_all_tags() if term in tag.tag_terms]
+            else:
+                groups_found = [(tag, tag._parent) for tag in hed_group.get_all_tags() if term_id in tag.tag_term_ids]
 
         if self._must_not_be_in_line:
             # If we found this, and it cannot be in the line.
@@ -69,19 +145,33 @@ class Expression:
                 groups_found = []
             else:
                 groups_found = [([], group) for group in hed_group.get_all_groups()]
+        return groups_found
 
-        # If we're checking for all groups, also need to add parents.
-        if exact:
-            all_found_groups = [SearchResult(group, tag) for tag, group in groups_found]
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if handle_expr would find any result, without building the results.
+
+        Parameters:
+            hed_group (HedGroup): The object to search.
+            exact (bool): Accepted for consistency with handle_expr. It does not change whether a term is found.
+
+        Returns:
+            bool: True if the expression matches somewhere in the group.
+        """
+        search_text = self.token.text.casefold()
+        if self._match_mode == Expression.MATCH_WILDCARD:
+            found = any(tag.short_tag.casefold().startswith(search_text) for tag in hed_group.get_all_tags())
+        elif self._match_mode == Expression.MATCH_EXACT:
+            found = any(tag == search_text for tag in hed_group.get_all_tags())
         else:
-            all_found_groups = []
-            for tag, group in groups_found:
-                while group:
-                    all_found_groups.append(SearchResult(group, tag))
-                    # This behavior makes it eat higher level groups at higher levels
-                    tag = group
-                    group = group._parent
-        return all_found_groups
+            term_id = self._get_term_id()
+            if term_id is None:
+                found = any(search_text in tag.tag_terms for tag in hed_group.get_all_tags())
+            else:
+                found = any(term_id in tag.tag_term_ids for tag in hed_group.get_all_tags())
+
+        if self._must_not_be_in_line:
+            return not found and bool(hed_group.get_all_groups())
+        return found
 
 
 class ExpressionAnd(Expression):
@@ -108,6 +198,50 @@ class ExpressionAnd(Expression):
 
         return self.merge_and_groups(groups1, groups2)
 
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if handle_expr would find any result, stopping at the first compatible pair.
+
+        Parameters:
+            hed_group (HedGroup): The HED group to search within.
+            exact (bool): If True, require exact child matching.
+
+        Returns:
+            bool: True if both sub-expressions match within the same group without sharing children.
+
+        Notes:
+            - The operands are evaluated as (group, child ids) pairs, so no SearchResult objects are built.
+        """
+        pairs1 = self.left._find_pairs(hed_group, exact=exact)
+        if not pairs1:
+            return False
+        pairs2 = self.right._find_pairs(hed_group, exact=exact)
+        return any(True for _ in ExpressionAnd._merge_pairs(pairs1, pairs2))
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        pairs1 = self.left._find_pairs(hed_group, exact=exact)
+        if not pairs1:
+            return pairs1
+        return list(ExpressionAnd._merge_pairs(pairs1, self.right._find_pairs(hed_group, exact=exact)))
+
+    @staticmethod
+    def _merge_pairs(pairs1, pairs2):
+        """Yield the merged (group, child ids) pairs that merge_and_groups would return as results.
+
+        Parameters:
+            pairs1 (list): (group, child ids) pairs from Expression._find_pairs.
+            pairs2 (list): (group, child ids) pairs from Expression._find_pairs.
+
+        Yields:
+            tuple: The group and the combined child ids of each pair of results in the same group with disjoint children.
+        """
+        buckets = {}
+        for group, child_ids in pairs2:
+            buckets.setdefault(id(group), []).append(child_ids)
+        for group, child_ids in pairs1:
+            for other_ids in buckets.get(id(group), ()):
+                if child_ids.isdisjoint(other_ids):
+                    yield group, child_ids | other_ids
+
     @staticmethod
     def merge_and_groups(groups1, groups2):
         """Finds any shared results
@@ -121,20 +255,42 @@ class ExpressionAnd(Expression):
         """
         return_list = []
         seen = set()
-        for group in groups1:
-            for other_group in groups2:
-                if group.group is other_group.group:
-                    # At this point any shared children between the two groups invalidates it.
-                    if any(tag is tag2 and tag is not None for tag in group.children for tag2 in other_group.children):
-                        continue
-                    # Merge the two groups' children into one new result, now that we've verified they're unique
-                    merged_result = group.merge_and_result(other_group)
-                    if merged_result not in seen:
-                        seen.add(merged_result)
-                        return_list.append(merged_result)
+        for group, other_group in ExpressionAnd._compatible_pairs(groups1, groups2):
+            # Merge the two groups' children into one new result, now that we've verified they're unique
+            merged_result = group.merge_and_result(other_group)
+            if merged_result not in seen:
+                seen.add(merged_result)
+                return_list.append(merged_result)
 
         return return_list
 
+    @staticmethod
+    def _compatible_pairs(groups1, groups2):
+        """Yield the pairs of results that are in the same group and share no children.
+
+        Parameters:
+            groups1 (list): A list of search results.
+            groups2 (list): A list of search results.
+
+        Yields:
+            tuple: (result from groups1, result from groups2), in the order of groups1 and then groups2.
+
+        Notes:
+            - The results in groups2 are bucketed by group identity, so only results in the same group are compared.
+        """
+        buckets = {}
+        for other_group in groups2:
+            buckets.setdefault(id(other_group.group), []).append(other_group)
+        for group in groups1:
+            others = buckets.get(id(group.group))
+            if not others:
+                continue
+            child_ids = {id(tag) for tag in group.children if tag is not None}
+            for other_group in others:
+                # At this point any shared children between the two groups invalidates it.
+                if not any(id(tag) in child_ids for tag in other_group.children):
+                    yield group, other_group
+
     def __str__(self):
         output_str = "("
         if self.left:
@@ -165,6 +321,15 @@ class ExpressionWildcardNew(Expression):
             list: :class:`~hed.models.query_util.SearchResult` objects for each matching child.
 
         """
+        # Wildcards are only found in containing groups — not propagated to every parent level.
+        all_found_groups = [SearchResult(group, tag) for tag, group in self._find_children(hed_group)]
+        return all_found_groups
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        return [(group, frozenset((id(child),))) for child, group in self._find_children(hed_group)]
+
+    def _find_children(self, hed_group) -> list:
+        """Return a (child, containing group) pair for each child matching the wildcard token."""
         groups_found = []
         if self.token.text == "?":
             # Any tag or group
@@ -183,10 +348,25 @@ class ExpressionWildcardNew(Expression):
             for group in groups_searching:
                 for child in group.groups():
                     groups_found.append((child, group))
+        return groups_found
 
-        # Wildcards are only found in containing groups — not propagated to every parent level.
-        all_found_groups = [SearchResult(group, tag) for tag, group in groups_found]
-        return all_found_groups
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if some group has a child that matches the wildcard token.
+
+        Parameters:
+            hed_group (HedGroup): The HED group to search within.
+            exact (bool): Unused; present for API consistency with :meth:`Expression.handle_expr`.
+
+        Returns:
+            bool: True if handle_expr would find any result.
+        """
+        if self.token.text == "?":
+            return any(group.children for group in hed_group.get_all_groups())
+        elif self.token.text == "??":
+            return any(group.tags() for group in hed_group.get_all_groups())
+        elif self.token.text == "???":
+            return any(group.groups() for group in hed_group.get_all_groups())
+        return False
 
 
 class ExpressionOr(Expression):
@@ -214,6 +394,22 @@ class ExpressionOr(Expression):
         groups1 = [g for g in groups1 if g not in groups2_set]
         return groups1 + groups2
 
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if either sub-expression matches, checking the right one only if needed.
+
+        Parameters:
+            hed_group (HedGroup): The HED group to search within.
+            exact (bool): If True, require exact child matching.
+
+        Returns:
+            bool: True if handle_expr would find any result.
+        """
+        return self.left.has_match(hed_group, exact=exact) or self.right.has_match(hed_group, exact=exact)
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        # Duplicate results do not change whether a match exists, so they are not removed as in handle_expr.
+        return self.left._find_pairs(hed_group, exact=exact) + self.right._find_pairs(hed_group, exact=exact)
+
     def __str__(self):
         output_str = "("
         if self.left:
@@ -250,6 +446,22 @@ class ExpressionNegation(Expression):
 
         return negated_groups
 
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if some group does not satisfy the right sub-expression.
+
+        Parameters:
+            hed_group (HedGroup): The HED group to search within.
+            exact (bool): If True, require exact child matching.
+
+        Returns:
+            bool: True if handle_expr would find any result.
+        """
+        return bool(self._find_pairs(hed_group, exact=exact))
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        found_group_ids = {id(group) for group, _ in self.right._find_pairs(hed_group, exact=exact)}
+        return [(group, frozenset()) for group in hed_group.get_all_groups() if id(group) not in found_group_ids]
+
 
 class ExpressionDescendantGroup(Expression):
     """Query expression node that searches within descendant groups.
@@ -273,6 +485,21 @@ class ExpressionDescendantGroup(Expression):
         found_parent_groups = self._get_parent_groups(found_groups)
         return found_parent_groups
 
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if some descendant match has a containing parent group.
+
+        Parameters:
+            hed_group (HedGroup): The HED group to search within.
+            exact (bool): Unused; present for API consistency with :meth:`Expression.handle_expr`.
+
+        Returns:
+            bool: True if handle_expr would find any result.
+        """
+        return bool(self._find_pairs(hed_group, exact=exact))
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        return self._get_parent_pairs(self.right._find_pairs(hed_group))
+
 
 class ExpressionExactMatch(Expression):
     """Query expression node that requires an exact (curly-brace) group match.
@@ -323,3 +550,35 @@ class ExpressionExactMatch(Expression):
             return self._get_parent_groups(filtered_list)
 
         return []
+
+    def has_match(self, hed_group, exact=False) -> bool:
+        """Return True if some group exactly matches the required (and optional) sub-expressions.
+
+        Parameters:
+            hed_group (HedGroup): The HED group to search within.
+            exact (bool): Propagated to sub-expression matching; always True internally.
+
+        Returns:
+            bool: True if handle_expr would find any result.
+        """
+        return bool(self._find_pairs(hed_group, exact=exact))
+
+    def _find_pairs(self, hed_group, exact=False) -> list:
+        found_pairs = self.right._find_pairs(hed_group, exact=True)
+        if self.optional == "any":
+            return self._get_parent_pairs(found_pairs)
+
+        filtered_pairs = [
+            (group, child_ids) for group, child_ids in found_pairs if len(group.children) == len(child_ids)
+        ]
+        if filtered_pairs:
+            return self._get_parent_pairs(filtered_pairs)
+
+        if self.left:
+            optional_pairs = self.left._find_pairs(hed_group, exact=True)
+            found_pairs = list(ExpressionAnd._merge_pairs(found_pairs, optional_pairs))
+
+        filtered_pairs = [
+            (group, child_ids) for group, child_ids in found_pairs if len(group.children) == len(child_ids)
+        ]
+        return self._get_parent_pairs(filtered_pairs)
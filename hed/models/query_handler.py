@@ -1,5 +1,6 @@
 """Holder for and manipulation of search results."""
 
+import functools
 import re
 
 from hed.errors.exceptions import HedQueryError
@@ -13,6 +14,29 @@ from hed.models.query_expressions import (
     ExpressionWildcardNew,
 )
 from hed.models.query_util import Token
+from hed.schema.term_ids import get_term_id
+
+QUERY_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(expression_string) -> "QueryPlan":
+    """Return the compiled plan for a query expression, reusing it if it was compiled before.
+
+    Parameters:
+        expression_string (str): The query string.
+
+    Returns:
+        QueryPlan: The compiled plan, shared by all callers using the same expression.
+
+    Raises:
+        HedQueryError: If the expression cannot be parsed.
+
+    Notes:
+        - The most recently used QUERY_CACHE_SIZE plans are kept for the life of the process.
+        - Plans are treated as read only once compiled, so they can be shared between handlers.
+    """
+    return QueryPlan(expression_string)
 
 
 class QueryHandler:
@@ -50,12 +74,18 @@ class QueryHandler:
 
         Parameters:
             expression_string(str): The query string.
+
+        Notes:
+            - The expression is compiled once per process and the resulting plan is shared, see compile_query.
         """
-        self.tokens = []
-        self.at_token = -1
-        self.tree = self._parse(expression_string.casefold())
+        self.plan = compile_query(expression_string)
+        self.tree = self.plan.tree
         self._org_string = expression_string
 
+    def __reduce__(self):
+        # Only the expression is pickled; it is recompiled (or taken from the cache) in the receiving process.
+        return type(self), (self._org_string,)
+
     def search(self, hed_string_obj) -> list:
         """Search for the query in the given HED string.
 
@@ -65,14 +95,132 @@ class QueryHandler:
         Returns:
             list[any]: List of search result. Generally you should just treat this as a bool. True if a match was found.
         """
-        current_node = self.tree
+        if not self.plan.may_match(hed_string_obj):
+            return []
+        return self.tree.handle_expr(hed_string_obj)
 
-        result = current_node.handle_expr(hed_string_obj)
-        return result
+    def has_match(self, hed_string_obj) -> bool:
+        """Return True if the query matches the given HED string, without building the search results.
+
+        Parameters:
+            hed_string_obj (HedString): String to search
+
+        Returns:
+            bool: The same as bool(search(hed_string_obj)), but it stops as soon as a match is certain.
+        """
+        return self.plan.may_match(hed_string_obj) and self.tree.has_match(hed_string_obj)
 
     def __str__(self):
         return str(self.tree)
 
+
+class QueryPlan:
+    """A compiled query expression tree along with metadata about the expression.
+
+    Attributes:
+        expression_string (str): The query string the plan was compiled from.
+        tree (Expression): The root of the parsed expression tree.
+        required_terms (frozenset): Casefolded terms that some tag must have in its tag_terms for any match.
+        uses_wildcards (bool): True if the expression contains ?, ?? or ??? wildcards or * prefix terms.
+        uses_negation (bool): True if the expression contains ~ or @ terms.
+        uses_exact_groups (bool): True if the expression contains {} exact match groups.
+
+    Notes:
+        - Plans pickle as their expression string, so they can be sent to worker processes cheaply.
+    """
+
+    def __init__(self, expression_string):
+        """Parse an expression and compute its metadata.
+
+        Parameters:
+            expression_string (str): The query string.
+
+        Raises:
+            HedQueryError: If the expression cannot be parsed.
+        """
+        self.expression_string = expression_string
+        self.tokens = []
+        self.at_token = -1
+        self.tree = self._parse(expression_string.casefold())
+        self.required_terms = frozenset(self._get_required_terms(self.tree))
+        self._required_term_ids = None
+        self.uses_wildcards = self._expr_has(
+            self.tree,
+            lambda expr: isinstance(expr, ExpressionWildcardNew) or expr._match_mode == Expression.MATCH_WILDCARD,
+        )
+        self.uses_negation = self._expr_has(
+            self.tree, lambda expr: isinstance(expr, ExpressionNegation) or expr._must_not_be_in_line
+        )
+        self.uses_exact_groups = self._expr_has(self.tree, lambda expr: isinstance(expr, ExpressionExactMatch))
+        # A single term already does one pass over the tags, so only check terms up front for compound queries.
+        self._check_terms = bool(self.required_terms) and type(self.tree) is not Expression
+
+    def __reduce__(self):
+        return compile_query, (self.expression_string,)
+
+    def may_match(self, hed_group) -> bool:
+        """Return False if the query cannot match, because a required term is missing from the tags.
+
+        Parameters:
+            hed_group (HedGroup): The HED string or group to be searched.
+
+        Returns:
+            bool: False if the group certainly has no match, otherwise True.
+        """
+        if not self._check_terms:
+            return True
+        missing_ids, missing_terms = self._get_required_term_ids()
+        for tag in hed_group.get_all_tags():
+            missing_ids.difference_update(tag.tag_term_ids)
+            if missing_terms:
+                missing_terms.difference_update(tag.tag_terms)
+            if not missing_ids and not missing_terms:
+                return True
+        return False
+
+    def _get_required_term_ids(self):
+        """Return the ids of the required terms that have one, and the terms that have no id, as new sets.
+
+        The ids are only kept once every required term has one, since terms are not registered by queries.
+        """
+        if self._required_term_ids is not None:
+            return set(self._required_term_ids), set()
+        term_ids, terms = set(), set()
+        for term in self.required_terms:
+            term_id = get_term_id(term)
+            if term_id is None:
+                terms.add(term)
+            else:
+                term_ids.add(term_id)
+        if not terms:
+            self._required_term_ids = frozenset(term_ids)
+        return term_ids, terms
+
+    @staticmethod
+    def _get_required_terms(expr):
+        """Return the terms that must all be present in a string for the expression to match."""
+        if expr is None or isinstance(expr, (ExpressionNegation, ExpressionWildcardNew)):
+            return set()
+        if isinstance(expr, ExpressionOr):
+            return QueryPlan._get_required_terms(expr.left) & QueryPlan._get_required_terms(expr.right)
+        if isinstance(expr, ExpressionAnd):
+            return QueryPlan._get_required_terms(expr.left) | QueryPlan._get_required_terms(expr.right)
+        if isinstance(expr, (ExpressionDescendantGroup, ExpressionExactMatch)):
+            # The left side of an exact match group is optional.
+            return QueryPlan._get_required_terms(expr.right)
+        if expr._match_mode == Expression.MATCH_TERM and not expr._must_not_be_in_line:
+            return {expr.token.text}
+        return set()
+
+    @staticmethod
+    def _expr_has(expr, predicate):
+        """Return True if any node in the expression tree satisfies the predicate."""
+        if expr is None:
+            return False
+        return (
+            predicate(expr) or QueryPlan._expr_has(expr.left, predicate) or QueryPlan._expr_has(expr.right, predicate)
+        )
+
     def _get_next_token(self):
         """Returns the current token and advances the counter"""
         self.at_token += 1
@@ -150,15 +298,7 @@ class QueryHandler:
     @staticmethod
     def _expr_has_wildcard(expr):
         """Return True if the expression tree contains any wildcard node."""
-        if expr is None:
-            return False
-        if isinstance(expr, ExpressionWildcardNew):
-            return True
-        if QueryHandler._expr_has_wildcard(expr.left):
-            return True
-        if QueryHandler._expr_has_wildcard(expr.right):
-            return True
-        return False
+        return QueryPlan._expr_has(expr, lambda node: isinstance(node, ExpressionWildcardNew))
 
     def _handle_grouping_op(self):
         next_token = self._next_token_is([Token.LogicalGroup, Token.DescendantGroup, Token.ExactMatch])
@@ -62,8 +62,6 @@ def search_hed_objs(hed_objs, queries, query_names) -> pd.DataFrame:
     df_factors = pd.DataFrame(0, index=range(len(hed_objs)), columns=query_names)
     for parse_ind, parser in enumerate(queries):
         for index, next_item in enumerate(hed_objs):
-            if next_item:
-                match = parser.search(next_item)
-                if match:
-                    df_factors.at[index, query_names[parse_ind]] = 1
+            if next_item and parser.has_match(next_item):
+                df_factors.at[index, query_names[parse_ind]] = 1
     return df_factors
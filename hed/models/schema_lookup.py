@@ -30,13 +30,29 @@ The lookup dict maps::
 Keys are casefolded short tag names (last slash-component). Values are tuples
 of casefolded path components from the schema root to the tag (inclusive),
 matching exactly what :attr:`~hed.schema.HedTagEntry.tag_terms` contains.
+
+Search workers that should not load a schema at all can get the lookup for a
+schema version directly.  It is generated once per version and kept in the
+HED cache folder in a compact binary form::
+
+    from hed.models.schema_lookup import get_schema_lookup
+
+    lookup = get_schema_lookup("8.4.0")
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import sys
+import tempfile
 from pathlib import Path
 
+LOOKUP_FORMAT = 1
+LOOKUP_FOLDER = "schema_lookups"
+LOOKUP_EXTENSION = "_lookup.json.gz"
+
 
 def generate_schema_lookup(schema):
     """Build a schema lookup table mapping short tag names to their ``tag_terms``.
@@ -127,3 +143,158 @@ def load_schema_lookup(path):
     """
     raw = json.loads(Path(path).read_text(encoding="utf-8"))
     return {k: tuple(v) for k, v in raw.items()}
+
+
+def save_compact_schema_lookup(lookup, path, version=""):
+    """Serialise a schema lookup dict to a compact gzip-compressed file.
+
+    Each distinct term is stored once and the tag paths are stored as a prefix tree of term indices,
+    so the file is a small fraction of the size written by :func:`save_schema_lookup`.
+
+    Parameters:
+        lookup (dict[str, tuple]): The lookup dict from :func:`generate_schema_lookup`.
+        path (str or Path): Destination file path.
+        version (str): The schema version the lookup was generated from, recorded in the file.
+    """
+    term_ids = {}
+    path_ids = {}
+    path_terms = []
+    path_parents = []
+
+    def _get_term_id(term):
+        if term not in term_ids:
+            term_ids[term] = len(term_ids)
+        return term_ids[term]
+
+    def _get_path_id(tag_terms):
+        if tag_terms not in path_ids:
+            parent = _get_path_id(tag_terms[:-1]) if len(tag_terms) > 1 else -1
+            path_terms.append(_get_term_id(tag_terms[-1]))
+            path_parents.append(parent)
+            path_ids[tag_terms] = len(path_ids)
+        return path_ids[tag_terms]
+
+    key_terms = []
+    key_paths = []
+    for key, tag_terms in lookup.items():
+        # Paths are registered first so a parent path always has a lower index than its children.
+        key_paths.append(_get_path_id(tuple(tag_terms)) if tag_terms else -1)
+        key_terms.append(_get_term_id(key))
+    data = {
+        "format": LOOKUP_FORMAT,
+        "version": version,
+        "terms": list(term_ids),
+        "path_terms": path_terms,
+        "path_parents": path_parents,
+        "key_terms": key_terms,
+        "key_paths": key_paths,
+    }
+    Path(path).write_bytes(gzip.compress(json.dumps(data, separators=(",", ":")).encode("utf-8")))
+
+
+def load_compact_schema_lookup(path):
+    """Load a schema lookup dict previously saved with :func:`save_compact_schema_lookup`.
+
+    Parameters:
+        path (str or Path): The file to load.
+
+    Returns:
+        dict[str, tuple[str, ...]]: The schema lookup dict. The terms are interned strings, so each
+            distinct term is held in memory once.
+
+    Raises:
+        OSError: If the file cannot be read or is not a gzip file.
+        ValueError: If the file is not a compact schema lookup of a supported format.
+    """
+    data = json.loads(gzip.decompress(Path(path).read_bytes()).decode("utf-8"))
+    if not isinstance(data, dict) or data.get("format") != LOOKUP_FORMAT:
+        raise ValueError(f"'{path}' is not a schema lookup of format {LOOKUP_FORMAT}")
+    terms = [sys.intern(term) for term in data["terms"]]
+    paths = []
+    for term_id, parent in zip(data["path_terms"], data["path_parents"], strict=True):
+        prefix = paths[parent] if parent >= 0 else ()
+        paths.append((*prefix, terms[term_id]))
+    return {
+        terms[term_id]: paths[path_id] if path_id >= 0 else ()
+        for term_id, path_id in zip(data["key_terms"], data["key_paths"], strict=True)
+    }
+
+
+def get_schema_lookup(xml_version, xml_folder=None) -> dict:
+    """Return the schema lookup for a schema version, without loading the schema if possible.
+
+    Parameters:
+        xml_version (str): A single schema version of the form '[library_name_]X.Y.Z', e.g. '8.4.0' or
+            'score_1.1.0'. Namespace prefixes and comma-separated lists are not supported.
+        xml_folder (str or None): The HED cache folder to use, defaults to the HED cache directory.
+
+    Returns:
+        dict[str, tuple[str, ...]]: The schema lookup dict, as from :func:`generate_schema_lookup`.
+
+    Raises:
+        ValueError: If xml_version is not a single schema version.
+        HedFileError: If there is no stored lookup and the schema version cannot be loaded.
+
+    Notes:
+        - Lookups are stored in the schema_lookups sub-folder of the cache folder, named after the
+          schema XML file. If none is stored, the schema is loaded once and its lookup is saved there.
+        - Use :func:`cache_schema_lookups` to prebuild the lookups for all the cached schemas.
+    """
+    lookup_path = _get_lookup_path(xml_version, xml_folder)
+    try:
+        return load_compact_schema_lookup(lookup_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or damaged, so regenerate it.
+
+    from hed.schema.hed_schema_io import load_schema_version
+
+    lookup = generate_schema_lookup(load_schema_version(xml_version, xml_folder=xml_folder))
+    try:
+        os.makedirs(os.path.dirname(lookup_path), exist_ok=True)
+        # Write to a temporary file and rename, so concurrent workers never read a partial file.
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(lookup_path), suffix=".tmp")
+        os.close(handle)
+        save_compact_schema_lookup(lookup, temp_path, version=xml_version)
+        os.replace(temp_path, lookup_path)
+    except OSError:
+        pass  # The cache folder is not writable, so the lookup is just not persisted.
+    return lookup
+
+
+def cache_schema_lookups(xml_folder=None) -> int:
+    """Generate and store the schema lookups for all the standard and library schemas in the cache.
+
+    Parameters:
+        xml_folder (str or None): The HED cache folder to use, defaults to the HED cache directory.
+
+    Returns:
+        int: The number of schema versions that have a stored lookup.
+
+    Notes:
+        - Library schemas whose partnered standard schema is not available are skipped.
+    """
+    from hed.errors.exceptions import HedFileError
+    from hed.schema import hed_cache
+
+    all_versions = hed_cache.get_hed_versions(xml_folder, library_name="all")
+    count = 0
+    for library_name, versions in all_versions.items():
+        for version in versions:
+            xml_version = f"{library_name}_{version}" if library_name else version
+            try:
+                get_schema_lookup(xml_version, xml_folder)
+            except HedFileError:
+                continue
+            count += 1
+    return count
+
+
+def _get_lookup_path(xml_version, xml_folder=None):
+    """Return the path of the stored lookup for a single schema version."""
+    from hed.schema import hed_cache
+
+    if not xml_version or ":" in xml_version or "," in xml_version:
+        raise ValueError(f"'{xml_version}' is not a single schema version of the form '[library_name_]X.Y.Z'")
+    library_name, _, version = xml_version.rpartition("_")
+    prefix = f"{hed_cache.HED_XML_PREFIX}_{library_name}_" if library_name else hed_cache.HED_XML_PREFIX
+    return os.path.join(hed_cache.get_cache_directory(xml_folder), LOOKUP_FOLDER, prefix + version + LOOKUP_EXTENSION)
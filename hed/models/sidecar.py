@@ -154,7 +154,7 @@ class Sidecar:
             merged_dict.update(loaded_json)
         return merged_dict
 
-    def validate(self, hed_schema, extra_def_dicts=None, name=None, error_handler=None) -> list[dict]:
+    def validate(self, hed_schema, extra_def_dicts=None, name=None, error_handler=None, issue_sink=None) -> list[dict]:
         """Create a SidecarValidator and validate this sidecar with the schema.
 
         Parameters:
@@ -162,9 +162,10 @@ class Sidecar:
             extra_def_dicts (list or DefinitionDict): Extra def dicts in addition to sidecar.
             name (str): The name to report this sidecar as.
             error_handler (ErrorHandler): Error context to use. Creates a new one if None.
+            issue_sink (IssueSink or None): If given, the issues are written to this sink instead of returned.
 
         Returns:
-            list[dict]: A list of issues associated with each level in the HED string.
+            list[dict]: A list of issues associated with each level in the HED string (empty if an issue_sink is given).
         """
         from hed.validator.sidecar_validator import SidecarValidator
 
@@ -172,7 +173,7 @@ class Sidecar:
             error_handler = ErrorHandler()
 
         validator = SidecarValidator(hed_schema)
-        issues = validator.validate(self, extra_def_dicts, name, error_handler=error_handler)
+        issues = validator.validate(self, extra_def_dicts, name, error_handler=error_handler, issue_sink=issue_sink)
         return issues
 
     def _load_json_file(self, fp):
@@ -210,6 +211,9 @@ class Sidecar:
                 error_handler.push_error_context(ErrorContext.SIDECAR_COLUMN_NAME, column_data.column_name)
                 hed_strings = column_data.get_hed_strings()
                 for key_name, hed_string in hed_strings.items():
+                    # Only strings with definitions contribute, so the others are not parsed.
+                    if "definition" not in hed_string.casefold():
+                        continue
                     hed_string_obj = HedString(hed_string, hed_schema)
                     if len(hed_strings) > 1:
                         error_handler.push_error_context(ErrorContext.SIDECAR_KEY_NAME, key_name)
@@ -14,6 +14,8 @@ Key classes:
 - :class:`StringQueryHandler` — subclasses :class:`~hed.models.QueryHandler`,
   overriding :meth:`search` to accept a raw string instead of a
   :class:`~hed.models.HedString`.
+- :func:`search_series` / :func:`string_search` — search a whole column of
+  strings, evaluating each distinct string only once.
 
 Ancestor search support
 -----------------------
@@ -38,8 +40,12 @@ from __future__ import annotations
 
 from collections import deque
 
+import numpy as np
+import pandas as pd
+
 from hed.models.hed_string import HedString
 from hed.models.query_handler import QueryHandler
+from hed.schema.term_ids import get_known_term_ids, get_term_count, get_term_ids
 
 
 class StringNode:
@@ -66,6 +72,7 @@ class StringNode:
     - ``find_exact_tags(exact_tags, ...)`` — casefold-exact tag search.
     - ``find_wildcard_tags(search_tags, ...)`` — prefix tag search.
     - ``tag_terms`` — tuple of casefolded ancestry components (set on leaves).
+    - ``tag_term_ids`` — integer ids of the ``tag_terms``, used by bare-term query matching.
     - ``short_tag`` — casefolded tag text (set on leaves), used by wildcard search.
 
     Parameters:
@@ -87,6 +94,8 @@ class StringNode:
         self.children = []
 
         # --- HedTag duck-typing attributes (set on leaf tag nodes) ---
+        self._tag_term_ids = None
+        self._term_count = -1
         if text is not None and not is_group:
             # short_tag: full casefolded tag text (including any slash/value component).
             # Mirrors HedTag.short_tag which also includes the value, e.g. "Def/DefName".
@@ -98,7 +107,14 @@ class StringNode:
             _short_name = text.rsplit("/", 1)[-1]
             if schema_lookup is not None:
                 # Use lookup table: maps short_name_casefold → tuple(all_ancestor_terms)
-                self.tag_terms = schema_lookup.get(_short_name, (_short_name,))
+                lookup_terms = schema_lookup.get(_short_name)
+                if lookup_terms is not None:
+                    # Lookup terms are schema terms, so they are registered and their ids never change.
+                    self.tag_terms = lookup_terms
+                    self._tag_term_ids = get_term_ids(lookup_terms)
+                    self._term_count = None
+                else:
+                    self.tag_terms = (_short_name,)
             else:
                 # Derive tag_terms from slash-separated path (handles long-form for free).
                 # "event/sensory-event" → ("event", "sensory-event") so bare "Event" matches.
@@ -107,6 +123,25 @@ class StringNode:
             self.short_tag = ""
             self.tag_terms = ()
 
+    @property
+    def tag_term_ids(self) -> frozenset:
+        """Return the integer ids of this node's ``tag_terms`` (see :mod:`hed.schema.term_ids`).
+
+        Returns:
+            frozenset[int]: The ids of the terms that have one.
+
+        Notes:
+            - Terms from the schema lookup are registered. The terms of raw strings can be arbitrary values,
+              so they are not registered, and their ids are recomputed only if terms were registered since.
+        """
+        if self._term_count is None:
+            return self._tag_term_ids
+        term_count = get_term_count()
+        if term_count != self._term_count:
+            self._tag_term_ids = get_known_term_ids(self.tag_terms)
+            self._term_count = term_count
+        return self._tag_term_ids
+
     # ------------------------------------------------------------------
     # HedGroup duck-typing interface
     # ------------------------------------------------------------------
@@ -385,8 +420,53 @@ class StringQueryHandler(QueryHandler):
                 Evaluate as a bool — ``True`` when at least one match was found.
         """
         root = parse_hed_string(raw_string, schema_lookup=schema_lookup)
+        if not self.plan.may_match(root):
+            return []
         return self.tree.handle_expr(root)
 
+    def has_match(self, raw_string, schema_lookup=None):
+        """Return True if the compiled query matches a raw HED string.
+
+        Parameters:
+            raw_string (str): The raw HED string to search.
+            schema_lookup (dict or None): Optional schema lookup dict for ancestor
+                search; see :meth:`search`.
+
+        Returns:
+            bool: The same as ``bool(search(raw_string))``, but no
+                :class:`~hed.models.query_util.SearchResult` lists are kept.
+        """
+        root = parse_hed_string(raw_string, schema_lookup=schema_lookup)
+        return self.plan.may_match(root) and self.tree.has_match(root)
+
+    def search_series(self, strings, schema_lookup=None):
+        """Return a boolean mask of the strings that match the compiled query.
+
+        Parameters:
+            strings (pd.Series or list): Raw HED strings. ``None``, NaN, ``pd.NA``,
+                empty strings and other non-string values never match.
+            schema_lookup (dict or None): Optional schema lookup dict for ancestor
+                search; see :meth:`search`.
+
+        Returns:
+            np.ndarray: One boolean per input string.
+
+        Notes:
+            - The strings are factorized first, so each distinct string is parsed
+              and searched once and the results are broadcast back to every row.
+              Event HED columns are very repetitive, so this is usually a small
+              fraction of the rows.
+        """
+        if not isinstance(strings, pd.Series):
+            strings = pd.Series(list(strings), dtype=object)
+        codes, uniques = pd.factorize(strings)
+        unique_matches = np.zeros(len(uniques) + 1, dtype=bool)
+        for index, value in enumerate(uniques):
+            if isinstance(value, str) and value:
+                unique_matches[index] = self.has_match(value, schema_lookup=schema_lookup)
+        # Missing values have code -1, which picks the trailing False entry.
+        return unique_matches[codes]
+
 
 # ---------------------------------------------------------------------------
 # Convenience: list search
@@ -396,9 +476,9 @@ class StringQueryHandler(QueryHandler):
 def string_search(strings, query, schema_lookup=None):
     """Search a list of HED strings using a query expression.
 
-    Compiles the query once and applies it to every element, returning a
-    list of booleans.  ``None``, ``float('nan')``, and empty strings
-    evaluate to ``False``.
+    Compiles the query once and applies it to each distinct element, returning
+    a list of booleans.  ``None``, ``float('nan')``, and empty strings
+    evaluate to ``False``.  Use :func:`search_series` to get a NumPy mask.
 
     Parameters:
         strings (list[str]): A list of raw HED strings.
@@ -416,7 +496,25 @@ def string_search(strings, query, schema_lookup=None):
         mask = string_search(events["HED"].tolist(), "Sensory-event")
         matching_rows = [row for row, m in zip(events.itertuples(), mask) if m]
     """
-    handler = StringQueryHandler(query)
-    return [
-        bool(handler.search(s, schema_lookup=schema_lookup)) if isinstance(s, str) and s else False for s in strings
-    ]
+    return search_series(strings, query, schema_lookup=schema_lookup).tolist()
+
+
+def search_series(strings, query, schema_lookup=None):
+    """Search a column of HED strings and return a NumPy boolean mask.
+
+    Parameters:
+        strings (pd.Series or list): Raw HED strings, such as the HED column of an events file.
+        query (str or StringQueryHandler): A HED query expression or a handler that has already been compiled.
+        schema_lookup (dict or None): Optional schema lookup dict for ancestor
+            search; see :func:`~hed.models.schema_lookup.generate_schema_lookup`.
+
+    Returns:
+        np.ndarray: One boolean per input string, aligned by position with *strings*.
+
+    Example::
+
+        from hed.models.string_search import search_series
+        matching_rows = events[search_series(events["HED"], "Sensory-event")]
+    """
+    handler = query if isinstance(query, StringQueryHandler) else StringQueryHandler(query)
+    return handler.search_series(strings, schema_lookup=schema_lookup)
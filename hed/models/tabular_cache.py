@@ -0,0 +1,220 @@
+"""On-disk cache of the dataframes of tabular files and of their assembled HED strings.
+
+Analyses are often re-run many times on files that have not changed. When the cache is enabled,
+:class:`~hed.models.tabular_input.TabularInput` (and so the BIDS file groups that use it) stores the
+loaded dataframe of each text file, and the HED strings assembled from it with its sidecar, keyed by
+hashes of the file and sidecar contents. Later loads of the same contents open the stored arrays instead
+of parsing the file and assembling its strings again::
+
+    from hed.models import tabular_cache
+
+    tabular_cache.enable_tabular_cache()  # Uses the tabular_cache sub-folder of the HED cache directory.
+
+Each column is stored as NumPy arrays of integer codes and distinct values. The code arrays are
+memory-mapped when loaded, so a load costs about one array lookup per column. No pickled objects are stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+TABULAR_CACHE_FORMAT = 1
+# Bump whenever a change to how HED strings are assembled would change the stored assembled strings.
+ASSEMBLY_FORMAT = 1
+TABULAR_CACHE_FOLDER = "tabular_cache"
+_INDEX_FILE = "columns.json"
+
+_cache_folder = None
+
+
+def enable_tabular_cache(cache_folder=None) -> str:
+    """Turn on the tabular cache for all TabularInput objects created afterward.
+
+    Parameters:
+        cache_folder (str or None): The folder to store the cached files in. If None, the tabular_cache
+            sub-folder of the HED cache directory.
+
+    Returns:
+        str: The cache folder used.
+    """
+    global _cache_folder
+    if not cache_folder:
+        from hed.schema import hed_cache
+
+        cache_folder = os.path.join(hed_cache.get_cache_directory(), TABULAR_CACHE_FOLDER)
+    _cache_folder = cache_folder
+    return cache_folder
+
+
+def disable_tabular_cache():
+    """Turn off the tabular cache. The stored files are kept."""
+    global _cache_folder
+    _cache_folder = None
+
+
+def get_tabular_cache_folder() -> str | None:
+    """Return the folder of the tabular cache, or None if the cache is not enabled."""
+    return _cache_folder
+
+
+def clear_tabular_cache(cache_folder=None):
+    """Remove all the stored files of the tabular cache.
+
+    Parameters:
+        cache_folder (str or None): The folder to clear. If None, the folder of the enabled cache.
+    """
+    cache_folder = cache_folder or _cache_folder
+    if cache_folder:
+        shutil.rmtree(cache_folder, ignore_errors=True)
+
+
+def get_file_key(file_path, has_column_names=True) -> str:
+    """Return the key of a text file, a hash of its contents and of how it is read.
+
+    Parameters:
+        file_path (str): The path of the file.
+        has_column_names (bool): True if the first line of the file holds the column names.
+
+    Returns:
+        str: A hexadecimal key that changes whenever the contents of the file change.
+    """
+    file_hash = hashlib.sha256(f"{TABULAR_CACHE_FORMAT}:{bool(has_column_names)}:".encode())
+    with open(file_path, "rb") as fp:
+        for block in iter(lambda: fp.read(1 << 20), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def get_sidecar_key(sidecar) -> str:
+    """Return the key of the assembled HED strings of a sidecar, a hash of its contents and of how they are assembled.
+
+    Parameters:
+        sidecar (Sidecar or None): The sidecar used to assemble the HED strings.
+
+    Returns:
+        str: A hexadecimal key that changes whenever the contents of the sidecar, ASSEMBLY_FORMAT,
+        or the hedtools version change.
+
+    Notes:
+        - The version is included so that strings assembled by one release are never reused by another,
+          even if ASSEMBLY_FORMAT was not bumped.
+    """
+    from hed import __version__
+
+    loaded_dict = sidecar.loaded_dict if sidecar else None
+    sidecar_hash = hashlib.sha256(f"{ASSEMBLY_FORMAT}:{__version__}:".encode())
+    sidecar_hash.update(json.dumps(loaded_dict, sort_keys=True).encode())
+    return sidecar_hash.hexdigest()
+
+
+def load_dataframe(file_key) -> pd.DataFrame | None:
+    """Return the stored dataframe of a file, or None if none is stored.
+
+    Parameters:
+        file_key (str): The key of the file, from get_file_key.
+
+    Returns:
+        pd.DataFrame or None: The dataframe, with the string values of the original.
+    """
+    stored = _load_columns(_get_entry_path(file_key, "data"))
+    if stored is None:
+        return None
+    return pd.DataFrame(dict(zip(*stored, strict=True)), columns=stored[0])
+
+
+def save_dataframe(file_key, dataframe):
+    """Store the dataframe of a file. Nothing is stored if the cache is not enabled or not writable.
+
+    Parameters:
+        file_key (str): The key of the file, from get_file_key.
+        dataframe (pd.DataFrame): The loaded dataframe, whose values are strings.
+    """
+    _save_columns(_get_entry_path(file_key, "data"), list(dataframe.columns), [col for _, col in dataframe.items()])
+
+
+def load_series(file_key, sidecar_key) -> pd.Series | None:
+    """Return the stored assembled HED strings of a file with a sidecar, or None if none are stored.
+
+    Parameters:
+        file_key (str): The key of the file, from get_file_key.
+        sidecar_key (str): The key of the sidecar, from get_sidecar_key.
+
+    Returns:
+        pd.Series or None: The assembled HED strings, one per row.
+    """
+    stored = _load_columns(_get_entry_path(file_key, "hed_" + sidecar_key))
+    if stored is None:
+        return None
+    return pd.Series(stored[1][0])
+
+
+def save_series(file_key, sidecar_key, series):
+    """Store the assembled HED strings of a file with a sidecar.
+
+    Parameters:
+        file_key (str): The key of the file, from get_file_key.
+        sidecar_key (str): The key of the sidecar, from get_sidecar_key.
+        series (pd.Series): The assembled HED strings.
+    """
+    _save_columns(_get_entry_path(file_key, "hed_" + sidecar_key), ["HED"], [series])
+
+
+def _get_entry_path(file_key, entry_name):
+    """Return the folder of a stored entry of a file, or None if the cache is not enabled."""
+    if not _cache_folder:
+        return None
+    return os.path.join(_cache_folder, file_key[:2], file_key, entry_name)
+
+
+def _load_columns(entry_path):
+    """Return the column names and the object arrays of the values of a stored entry, or None."""
+    if not entry_path:
+        return None
+    try:
+        with open(os.path.join(entry_path, _INDEX_FILE)) as fp:
+            index = json.load(fp)
+        if index["format"] != TABULAR_CACHE_FORMAT:
+            return None
+        arrays = []
+        for position in range(len(index["columns"])):
+            values = np.load(os.path.join(entry_path, f"values_{position}.npy")).astype(object)
+            codes = np.load(os.path.join(entry_path, f"codes_{position}.npy"), mmap_mode="r")
+            arrays.append(values[codes])
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return None  # Missing or damaged, so the file is read again.
+    return index["columns"], arrays
+
+
+def _save_columns(entry_path, names, columns):
+    """Store columns of strings as code and value arrays in the folder entry_path."""
+    if not entry_path or os.path.exists(entry_path):
+        return
+    encoded = []
+    for column in columns:
+        codes, values = pd.factorize(column, use_na_sentinel=False)
+        # Fixed-width NumPy strings cannot keep other types or trailing NUL characters, so such columns are not stored.
+        if not all(isinstance(value, str) and not value.endswith("\0") for value in values):
+            return
+        encoded.append((codes.astype(np.int32 if len(values) < 2**31 else np.int64), np.array(values, dtype=str)))
+    temp_path = None
+    try:
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # Write to a temporary folder and rename, so concurrent readers never see a partial entry.
+        temp_path = tempfile.mkdtemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+        for position, (codes, values) in enumerate(encoded):
+            np.save(os.path.join(temp_path, f"codes_{position}.npy"), codes)
+            np.save(os.path.join(temp_path, f"values_{position}.npy"), values)
+        with open(os.path.join(temp_path, _INDEX_FILE), "w") as fp:
+            json.dump({"format": TABULAR_CACHE_FORMAT, "columns": names}, fp)
+        os.replace(temp_path, entry_path)
+    except (OSError, TypeError):
+        # The folder is not writable, another process stored the entry first, or the names are not JSON.
+        if temp_path:
+            shutil.rmtree(temp_path, ignore_errors=True)
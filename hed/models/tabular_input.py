@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from hed.models import tabular_cache
 from hed.models.base_input import BaseInput
 from hed.models.column_mapper import ColumnMapper
 from hed.models.sidecar import Sidecar
@@ -33,6 +34,10 @@ class TabularInput(BaseInput):
             - A duplicate or empty column name appears.
         OSError: If it cannot open the indicated file.
         ValueError: If this file has no column names.
+
+        Notes:
+            - If the tabular cache is enabled, the dataframe and the assembled HED strings are stored
+              and reused by later loads of the same file and sidecar contents (see tabular_cache).
         """
         if sidecar and not isinstance(sidecar, Sidecar):
             sidecar = Sidecar(sidecar)
@@ -70,6 +75,12 @@ class TabularInput(BaseInput):
 
         self.reset_mapper(new_mapper)
 
+    def _get_sidecar_cache_key(self) -> str | None:
+        """Return the tabular cache key of the sidecar, or None if it is not a single Sidecar."""
+        if self._sidecar is not None and not isinstance(self._sidecar, Sidecar):
+            return None
+        return tabular_cache.get_sidecar_key(self._sidecar)
+
     def get_def_dict(self, hed_schema, extra_def_dicts=None) -> DefinitionDict:
         """Return the definition dict for this sidecar.
 
@@ -65,14 +65,27 @@ See also
 TabularInput, etc.).
 """
 
-from .hed_schema import HedSchema
-from .hed_schema_group import HedSchemaGroup
-from .hed_schema_io import load_schema, load_schema_version, from_string, get_hed_xml_version, from_dataframes
-from .hed_schema_constants import HedKey, HedSectionKey
-from .hed_cache import (
-    cache_xml_versions,
-    get_hed_versions,
-    get_available_hed_versions,
-    set_cache_directory,
-    get_cache_directory,
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "hed_schema": ["HedSchema"],
+        "hed_schema_group": ["HedSchemaGroup"],
+        "hed_schema_io": [
+            "load_schema",
+            "load_schema_version",
+            "from_string",
+            "get_hed_xml_version",
+            "from_dataframes",
+        ],
+        "hed_schema_constants": ["HedKey", "HedSectionKey"],
+        "hed_cache": [
+            "cache_xml_versions",
+            "get_hed_versions",
+            "get_available_hed_versions",
+            "set_cache_directory",
+            "get_cache_directory",
+        ],
+    },
 )
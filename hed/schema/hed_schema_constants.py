@@ -95,6 +95,25 @@ class HedKeyOld:
     IsInheritedProperty = "isInheritedProperty"
 
 
+class TagFlags:
+    """Bit flags precomputed on each HedTagEntry (as tag_flags) when the schema is finalized.
+
+    The group checks run on every tag of every string, so they test these integer flags rather than
+    looking up schema attributes or reserved tag names each time.
+    """
+
+    # From the schema attributes of the base tag
+    TagGroup = 1 << 0
+    TopLevelTagGroup = 1 << 1
+    # From the reserved tag rules (hed/schema/data/reservedTags.json)
+    Reserved = 1 << 2
+    RequireValue = 1 << 3
+    NoExtension = 1 << 4
+    RequiresDef = 1 << 5
+    RequiresTimeline = 1 << 6
+    NoSpliceInGroup = 1 << 7
+
+
 VERSION_ATTRIBUTE = "version"
 LIBRARY_ATTRIBUTE = "library"
 WITH_STANDARD_ATTRIBUTE = "withStandard"
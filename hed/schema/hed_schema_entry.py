@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
-import inflect
+from hed.schema.hed_schema_constants import HedKey, HedSectionKey, TagFlags
+from hed.schema.reserved_tags import get_reserved_flags
+from hed.schema.term_ids import NO_TERM_IDS, get_term_ids
 
-from hed.schema.hed_schema_constants import HedKey, HedSectionKey
 
-pluralize = inflect.engine()
-pluralize.defnoun("hertz", "hertz")
+@functools.cache
+def _get_pluralizer():
+    """Return the shared inflect engine, importing inflect on first use (it is slow to import)."""
+    import inflect
+
+    pluralize = inflect.engine()
+    pluralize.defnoun("hertz", "hertz")
+    return pluralize
 
 
 class HedSchemaEntry:
@@ -297,7 +305,7 @@ class UnitEntry(HedSchemaEntry):
             base_plural_units = {self.name}
         else:
             base_plural_units = {self.name.lower()}
-            base_plural_units.add(pluralize.plural(self.name.lower()))
+            base_plural_units.add(_get_pluralizer().plural(self.name.lower()))
 
         for derived_unit in base_plural_units:
             derivative_units[derived_unit] = self._get_conversion_factor(None)
@@ -348,6 +356,10 @@ class HedTagEntry(HedSchemaEntry):
         long_tag_name (str): The full slash-separated path from the schema root,
             with any trailing ``/#`` stripped.
         short_tag_name (str): The final component of the tag path (short form).
+        tag_flags (int): TagFlags bits for the base tag, set when the schema is finalized.
+        unit_table (dict[str, tuple[UnitEntry or None, float or None]]): Map from every unit string
+            defined by the unit classes (including SI-prefixed and plural forms) to its unit entry and
+            conversion factor. Built when the schema is finalized.
     """
 
     def __init__(self, *args, **kwargs):
@@ -360,6 +372,11 @@ class HedTagEntry(HedSchemaEntry):
         self.takes_value_child_entry = None  # this is a child takes value tag, if one exists
         self._parent_tag = None
         self.tag_terms = ()
+        self.tag_term_ids = NO_TERM_IDS
+        self.tag_flags = 0
+        self.unit_table = {}
+        # Case-insensitive fallback for unit strings not in unit_table, which never resolves to a unit symbol.
+        self._folded_unit_table = {}
         # During setup, it's better to have attributes shadow inherited before getting its own copy later.
         self.inherited_attributes = self.attributes
         # Descendent tags below this one
@@ -372,6 +389,11 @@ class HedTagEntry(HedSchemaEntry):
             return False
         return True
 
+    def __setstate__(self, state):
+        # Term ids are only valid in the process that registered them, so register the terms again when unpickled.
+        self.__dict__.update(state)
+        self.tag_term_ids = get_term_ids(self.tag_terms) if self.tag_terms else NO_TERM_IDS
+
     def has_attribute(self, attribute, return_value=False):
         """Returns th existence or value of an attribute in this entry.
 
@@ -469,6 +491,15 @@ class HedTagEntry(HedSchemaEntry):
         parent_name, _, child_name = self.name.rpartition("/")
         return parent_name
 
+    def _finalize_tag_flags(self):
+        """Set tag_flags; called once every tag entry in the section has its inherited attributes."""
+        flags = get_reserved_flags().get(self.short_tag_name, 0)
+        if self.base_tag_has_attribute(HedKey.TagGroup):
+            flags |= TagFlags.TagGroup
+        if self.base_tag_has_attribute(HedKey.TopLevelTagGroup):
+            flags |= TagFlags.TopLevelTagGroup
+        self.tag_flags = flags
+
     def _finalize_classes(self, schema, attribute_key, section_key):
         result = {}
         if attribute_key in self.attributes:
@@ -481,8 +512,60 @@ class HedTagEntry(HedSchemaEntry):
     def _finalize_takes_value_tag(self, schema):
         if self.name.endswith("/#"):
             self.unit_classes = self._finalize_classes(schema, HedKey.UnitClass, HedSectionKey.UnitClasses)
+            self._finalize_unit_tables()
             self.value_classes = self._finalize_classes(schema, HedKey.ValueClass, HedSectionKey.ValueClasses)
 
+    def _finalize_unit_tables(self):
+        """Precompute the resolution of every unit string this tag's unit classes define.
+
+        Notes:
+            - The unit classes are finalized before the tags, so their derivative units are complete here.
+            - Each exact entry holds the result of calling get_derivative_unit_entry on each unit class in turn.
+        """
+        unit_table = {}
+        folded_unit_table = {}
+        unit_classes = list(self.unit_classes.values())
+        for unit_class_entry in unit_classes:
+            for units in unit_class_entry.derivative_units:
+                if units in unit_table:
+                    continue
+                unit_table[units] = self._resolve_units(unit_classes, units)
+                for folded_class_entry in unit_classes:
+                    unit_entry = folded_class_entry.derivative_units.get(units)
+                    if unit_entry and not unit_entry.has_attribute(HedKey.UnitSymbol):
+                        folded_unit_table[units] = (unit_entry, unit_entry.get_conversion_factor(units))
+                        break
+        self.unit_table = unit_table
+        self._folded_unit_table = folded_unit_table
+
+    @staticmethod
+    def _resolve_units(unit_classes, units):
+        for unit_class_entry in unit_classes:
+            unit_entry = unit_class_entry.get_derivative_unit_entry(units)
+            if unit_entry:
+                return unit_entry, unit_entry.get_conversion_factor(units)
+        return None, None
+
+    def get_unit_entry(self, units) -> tuple:
+        """Return the unit entry and conversion factor for a unit string accepted by this tag.
+
+        Parameters:
+            units (str): The unit string, which can be plural or include a modifier.
+
+        Returns:
+            tuple[UnitEntry or None, float or None]: The matching unit entry and its conversion factor.
+            The entry is None if no unit class of this tag accepts the units. The factor is None if the
+            unit has no conversion factor.
+
+        Notes:
+            - Unit symbols must match including case, other units match case-insensitively, as in
+              UnitClassEntry.get_derivative_unit_entry.
+        """
+        result = self.unit_table.get(units)
+        if result is None:
+            result = self._folded_unit_table.get(units.casefold(), (None, None))
+        return result
+
     def _finalize_inherited_attributes(self):
         # Replace the list with a copy we can modify.
         self.inherited_attributes = self.attributes.copy()
@@ -510,6 +593,8 @@ class HedTagEntry(HedSchemaEntry):
             self._parent_tag.children[self.short_tag_name] = self
         self.takes_value_child_entry = schema._get_tag_entry(self.name + "/#")
         self.tag_terms = tuple(self.long_tag_name.casefold().split("/"))
+        # Integer ids of the tag_terms, used by bare-term queries (see hed.schema.term_ids).
+        self.tag_term_ids = get_term_ids(self.tag_terms)
 
         self._finalize_inherited_attributes()
         self._finalize_takes_value_tag(schema)
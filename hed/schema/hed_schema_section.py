@@ -359,3 +359,6 @@ class HedSchemaTagSection(HedSchemaSection):
 
         super()._finalize_section(hed_schema)
         self.root_tags = {tag.short_tag_name: tag for tag in self.all_entries if not tag._parent_tag}
+        # The flags look at the parent entries, so they are set once all the entries are finalized.
+        for tag in self.all_entries:
+            tag._finalize_tag_flags()
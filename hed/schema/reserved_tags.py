@@ -0,0 +1,43 @@
+"""The reserved tag rules of reservedTags.json and the TagFlags they set on schema tag entries."""
+
+import functools
+import json
+import os
+
+from hed.schema.hed_schema_constants import TagFlags
+
+RESERVED_TAGS_PATH = os.path.join(os.path.dirname(__file__), "data", "reservedTags.json")
+
+# The reservedTags.json properties that are precomputed as TagFlags on each HedTagEntry.
+PROPERTY_FLAGS = {
+    "requireValue": TagFlags.RequireValue,
+    "noExtension": TagFlags.NoExtension,
+    "requiresDef": TagFlags.RequiresDef,
+    "requiresTimeline": TagFlags.RequiresTimeline,
+    "noSpliceInGroup": TagFlags.NoSpliceInGroup,
+}
+
+
+@functools.cache
+def get_reserved_map() -> dict:
+    """Return the reserved tag rules by short tag name, loading reservedTags.json on first use.
+
+    Returns:
+        dict: The rules of each reserved tag, as in reservedTags.json. The same dict is returned on every call.
+    """
+    with open(RESERVED_TAGS_PATH) as file:
+        return json.load(file)
+
+
+@functools.cache
+def get_reserved_flags() -> dict:
+    """Return the TagFlags of the reserved tags by short tag name.
+
+    Returns:
+        dict: The Reserved flag combined with the flags of the properties set in each tag's rules.
+    """
+    return {
+        value["name"]: TagFlags.Reserved
+        | sum(flag for property_name, flag in PROPERTY_FLAGS.items() if value.get(property_name) is True)
+        for value in get_reserved_map().values()
+    }
@@ -1,3 +1,10 @@
 """Schema IO sub-package: loaders and serializers for all HED schema file formats."""
 
-from hed.schema.schema_io.df_util import save_dataframes, load_dataframes
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "df_util": ["save_dataframes", "load_dataframes"],
+    },
+)
@@ -0,0 +1,62 @@
+"""Process-wide integer ids of the casefolded terms of schema tags, used to match bare-term queries."""
+
+import threading
+
+_term_ids = {}
+_term_id_sets = {}
+_term_id_lock = threading.Lock()
+NO_TERM_IDS = frozenset()
+
+
+def get_term_id(term) -> int | None:
+    """Return the integer id of a casefolded term, or None if no schema or schema lookup term has it.
+
+    Parameters:
+        term (str): A casefolded tag term, e.g. "sensory-event".
+
+    Returns:
+        int or None: A small integer that identifies the term, or None if the term is not registered.
+
+    Notes:
+        - This never registers the term, so looking up arbitrary query or string terms does not grow the registry.
+    """
+    return _term_ids.get(term)
+
+
+def get_term_ids(tag_terms) -> frozenset:
+    """Return the ids of a tuple of schema tag terms, registering any terms that have no id yet.
+
+    Parameters:
+        tag_terms (tuple[str, ...]): The tag_terms of a schema tag entry or schema lookup.
+
+    Returns:
+        frozenset[int]: The ids of the terms. Equal tuples share the same frozenset.
+
+    Notes:
+        - Only use this for terms from a schema or schema lookup, as every distinct term is kept.
+        - Ids depend on the order in which terms are registered, so they are only valid in this process
+          and should not be saved or sent to other processes.
+    """
+    term_ids = _term_id_sets.get(tag_terms)
+    if term_ids is None:
+        with _term_id_lock:
+            term_ids = frozenset(_term_ids.setdefault(term, len(_term_ids)) for term in tag_terms)
+            term_ids = _term_id_sets.setdefault(tag_terms, term_ids)
+    return term_ids
+
+
+def get_term_count() -> int:
+    """Return the number of terms that have an id, which only ever increases."""
+    return len(_term_ids)
+
+
+def get_known_term_ids(tag_terms) -> frozenset:
+    """Return the ids of the terms that already have one, without registering new terms.
+
+    Parameters:
+        tag_terms (tuple[str, ...]): Casefolded tag terms, which may include arbitrary values.
+
+    Returns:
+        frozenset[int]: The ids of the terms that have one.
+    """
+    return frozenset(term_id for term_id in map(_term_ids.get, tag_terms) if term_id is not None)
@@ -35,6 +35,9 @@ Examples:
 
     # Filter to only process files from task 'rest' with all TSV files
     extract_tabular_summary /path/to/data --suffix '*' --filter 'task-rest'
+
+    # Summarize the files with 8 worker processes
+    extract_tabular_summary /path/to/data --jobs 8
 """
 
 import argparse
@@ -133,6 +136,14 @@ def get_parser():
         help="Maximum number of unique values to store for a categorical column; "
         "if a column has more unique values, it will be truncated (default: None, no limit)",
     )
+    column_group.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to summarize the files; 0 uses one per CPU (default: %(default)s)",
+    )
 
     # Output options
     output_group = parser.add_argument_group("Output options")
@@ -250,45 +261,20 @@ def extract_summary(args):
             for file_path in file_list:
                 logger.debug(f"  - {file_path}")
 
-        # Create the overall TabularSummary
-        logger.info("Creating overall tabular summary...")
-        overall_summary = TabularSummary(
+        # Summarize the files, in parallel if more than one job was requested
+        logger.info(f"Processing files with {args.jobs if args.jobs else 'one job per CPU'} job(s)...")
+        overall_summary, failures = TabularSummary.summarize_files(
+            file_list,
             value_cols=args.value_columns,
             skip_cols=args.skip_columns,
             name=f"Summary of {Path(args.data_path).name}",
             categorical_limit=args.categorical_limit,
+            jobs=args.jobs,
         )
-
-        # Process each file
-        logger.info("Processing files...")
-        successful_files = 0
-        failed_files = 0
-
-        for file_path in file_list:
-            try:
-                logger.debug(f"Processing: {file_path}")
-
-                # Create a TabularSummary for this individual file
-                file_summary = TabularSummary(
-                    value_cols=args.value_columns,
-                    skip_cols=args.skip_columns,
-                    name=Path(file_path).name,
-                    categorical_limit=args.categorical_limit,
-                )
-
-                # Update the file summary with the file's data
-                file_summary.update(file_path, name=file_path)
-
-                # Add this file's summary to the overall summary
-                overall_summary.update_summary(file_summary)
-
-                successful_files += 1
-                logger.debug(f"Successfully processed: {file_path}")
-
-            except Exception as e:
-                failed_files += 1
-                logger.warning(f"Failed to process {file_path}: {e}")
-                logger.debug(f"Full exception for {file_path}:", exc_info=True)
+        for file_path, error in failures.items():
+            logger.warning(f"Failed to process {file_path}: {error}")
+        failed_files = len(failures)
+        successful_files = len(file_list) - failed_files
 
         # Log final statistics
         logger.info("Processing complete:")
@@ -61,7 +61,7 @@ def format_validation_results(
 
     Parameters:
         issue_list (list): List of validation issues (HedIssue objects)
-        output_format (str): Output format - 'text', 'json', or 'json_pp' (default: 'text')
+        output_format (str): Output format - 'text', 'json', 'json_pp', or 'jsonl' (default: 'text')
         title_message (str): Title/header for text output (default: 'Validation errors:')
         error_limit (int or None): Maximum errors per code type to include in text output (default: None)
         errors_by_file (bool): Apply error limit per file rather than globally (default: False)
@@ -87,6 +87,10 @@ def format_validation_results(
         serializable_issues = list(iter_errors(issue_list))
         return json.dumps(serializable_issues)
 
+    elif output_format == "jsonl":
+        # One compact JSON object per line
+        return "\n".join(json.dumps(issue) for issue in iter_errors(issue_list))
+
     elif output_format == "text":
         # Human-readable text format with counts and optional filtering
         output = f"Using HEDTools version: {__version__}\n"
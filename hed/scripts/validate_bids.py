@@ -37,6 +37,12 @@ Examples:
 
     # Limit error reporting for large datasets
     validate_bids /path/to/dataset --error_limit 10
+
+    # Fail fast in CI: stop each file at its first error and the whole run after 100 issues
+    validate_bids /path/to/dataset --stop-on-first-error --max-issues 100
+
+    # Stream issues as JSON Lines (one issue per line) while the dataset is validated
+    validate_bids /path/to/dataset --format jsonl --print_output
 """
 
 import argparse
@@ -44,7 +50,7 @@ import logging
 import sys
 
 from hed import __version__
-from hed.errors import ErrorHandler
+from hed.errors import CountingIssueSink, ErrorHandler, JsonLinesIssueSink
 from hed.scripts.script_utils import format_validation_results, setup_logging
 from hed.tools import BidsDataset
 
@@ -107,14 +113,45 @@ def get_parser():
         dest="error_limit",
         type=int,
         default=None,
-        help="Limit the number of errors of each code type to report for text output",
+        help="Limit the number of errors of each code type to report for text and jsonl output",
     )
     validation_group.add_argument(
         "-ef",
         "--errors-by-file",
         action="store_true",
         dest="errors_by_file",
-        help="Apply error limit by file rather than overall for text output",
+        help="Apply error limit by file rather than overall for text and jsonl output",
+    )
+    validation_group.add_argument(
+        "-mi",
+        "--max-issues",
+        dest="max_issues",
+        type=int,
+        default=None,
+        help="Stop validating once this many issues have been found (default: No limit)",
+    )
+    validation_group.add_argument(
+        "-mc",
+        "--max-issues-per-code",
+        dest="max_issues_per_code",
+        type=int,
+        default=None,
+        help="Stop reporting issues of a code once this many have been found (default: No limit)",
+    )
+    validation_group.add_argument(
+        "-mf",
+        "--max-issues-per-file",
+        dest="max_issues_per_file",
+        type=int,
+        default=None,
+        help="Stop validating a file once this many issues have been found in it (default: No limit)",
+    )
+    validation_group.add_argument(
+        "-fe",
+        "--stop-on-first-error",
+        action="store_true",
+        dest="stop_on_first_error",
+        help="Stop validating each file after its first error",
     )
 
     # Output options
@@ -122,9 +159,9 @@ def get_parser():
     output_group.add_argument(
         "-f",
         "--format",
-        choices=["text", "json", "json_pp"],
+        choices=["text", "json", "json_pp", "jsonl"],
         default="text",
-        help="Output format: 'text' (human-readable with counts), 'json' (compact JSON array), or 'json_pp' (pretty-printed JSON with metadata, default: %(default)s)",
+        help="Output format: 'text' (human-readable with counts), 'json' (compact JSON array), 'json_pp' (pretty-printed JSON with metadata), or 'jsonl' (one JSON issue per line, written as each file is validated; the final report goes to stderr, default: %(default)s)",
     )
     output_group.add_argument(
         "-o",
@@ -179,19 +216,21 @@ def get_parser():
     return parser
 
 
-def format_final_report(issue_list):
+def format_final_report(issue_list, code_counts=None):
     """Generate a final summary report of the validation results.
 
     Parameters:
         issue_list (list): List of validation issues found
+        code_counts (dict or None): Issue counts by code, used instead of issue_list when the issues were streamed.
 
     Returns:
         str: Summary report of the validation results
     """
-    report = f"Validation completed.\n\tFound {len(issue_list)} issues."
-    if issue_list:
-        unique_codes = ErrorHandler.get_code_counts(issue_list)
-        code_summary = ", ".join(f"{code}({count})" for code, count in unique_codes.items())
+    if code_counts is None:
+        code_counts = ErrorHandler.get_code_counts(issue_list)
+    report = f"Validation completed.\n\tFound {sum(code_counts.values())} issues."
+    if code_counts:
+        code_summary = ", ".join(f"{code}({count})" for code, count in code_counts.items())
         report += f"\nCode counts: {code_summary}"
     return report
 
@@ -228,16 +267,20 @@ def main(arg_list=None):
         logger.info(f"Log output will be saved to: {args.log_file}")
 
     try:
-        issue_list = validate_dataset(args)
+        if args.format == "jsonl":
+            code_counts = stream_dataset(args)
+        else:
+            code_counts = ErrorHandler.get_code_counts(validate_dataset(args))
     except Exception as e:
         logger.error(f"Validation failed with exception: {e}")
         raise
 
-    final_report = format_final_report(issue_list)
+    final_report = format_final_report([], code_counts=code_counts)
     logger.info(final_report)
-    print(final_report)
+    # Keep standard output valid JSON Lines when the issues are streamed there.
+    print(final_report, file=sys.stderr if args.format == "jsonl" else sys.stdout)
     # Return 1 if there are issues, 0 otherwise
-    return int(bool(issue_list))
+    return int(bool(code_counts))
 
 
 def validate_dataset(args):
@@ -252,27 +295,14 @@ def validate_dataset(args):
 
     """
     logger = logging.getLogger("validate_bids")
-    logger.info(f"Data directory: {args.data_path}")
-    logger.info(f"HEDTools version: {__version__}")
-    logger.debug(f"Exclude directories: {args.exclude_dirs}")
-    logger.debug(f"File suffixes: {args.suffixes}")
-    logger.debug(f"Check for warnings: {args.check_for_warnings}")
-
-    if args.suffixes == ["*"] or args.suffixes == []:
-        args.suffixes = None
 
     # Validate the dataset
     try:
-        logger.info("Creating BIDS dataset object...")
-        bids = BidsDataset(args.data_path, suffixes=args.suffixes, exclude_dirs=args.exclude_dirs)
-        logger.info(
-            f"BIDS dataset created with schema versions: {bids.schema.get_schema_versions() if bids.schema else 'None'}"
-        )
-        logger.info(f"Found file groups: {list(bids.file_groups.keys())}")
-
+        bids = _load_dataset(args)
         logger.info("Starting validation...")
-        issue_list = bids.validate(check_for_warnings=args.check_for_warnings)
+        issue_list = bids.validate(compact_issues=True, **_validate_kwargs(args))
         logger.info(f"Validation completed. Found {len(issue_list)} issues")
+        _log_suppressed(bids)
     except Exception as e:
         logger.error(f"Error during dataset validation: {e}")
         logger.debug("Full exception details:", exc_info=True)
@@ -300,5 +330,84 @@ def validate_dataset(args):
     return issue_list
 
 
+def stream_dataset(args):
+    """Run HED validation on the BIDS dataset and stream the issues as JSON Lines.
+
+    Each sidecar and data file writes its issues as soon as it has been validated, so memory use does
+    not grow with the number of issues. Output goes to args.output_file and/or stdout.
+
+    Parameters:
+        args (argparse.Namespace): Parsed CLI arguments including data_path, suffixes, check_for_warnings,
+            error_limit and errors_by_file.
+
+    Returns:
+        dict[str, int]: Issue counts by code (before any error limit is applied).
+
+    """
+    logger = logging.getLogger("validate_bids")
+
+    output_file = open(args.output_file, "w") if args.output_file else None
+    try:
+        bids = _load_dataset(args)
+        streams = [stream for stream in (output_file, sys.stdout if args.print_output else None) if stream]
+        with CountingIssueSink(
+            JsonLinesIssueSink(*streams), error_limit=args.error_limit, by_file=args.errors_by_file
+        ) as issue_sink:
+            logger.info("Starting streaming validation...")
+            bids.validate(compact_issues=True, issue_sink=issue_sink, **_validate_kwargs(args))
+        logger.info(f"Validation completed. Found {issue_sink.total_count} issues")
+        _log_suppressed(bids)
+    except Exception as e:
+        logger.error(f"Error during dataset validation: {e}")
+        logger.debug("Full exception details:", exc_info=True)
+        raise
+    finally:
+        if output_file:
+            output_file.close()
+
+    return issue_sink.get_code_counts()
+
+
+def _validate_kwargs(args):
+    """Return the BidsDataset.validate keyword arguments given by args."""
+    return {
+        "check_for_warnings": args.check_for_warnings,
+        "max_issues": args.max_issues,
+        "max_issues_per_code": args.max_issues_per_code,
+        "max_issues_per_file": args.max_issues_per_file,
+        "stop_on_first_error": args.stop_on_first_error,
+    }
+
+
+def _log_suppressed(bids):
+    """Warn that the issue limits stopped validation early, so the counts are incomplete."""
+    if bids.suppressed_issue_count:
+        logging.getLogger("validate_bids").warning(
+            f"Issue limits reached: {bids.suppressed_issue_count} further issues were not reported "
+            "and the remaining data was not fully validated"
+        )
+
+
+def _load_dataset(args):
+    """Create the BidsDataset described by args, logging the settings used."""
+    logger = logging.getLogger("validate_bids")
+    logger.info(f"Data directory: {args.data_path}")
+    logger.info(f"HEDTools version: {__version__}")
+    logger.debug(f"Exclude directories: {args.exclude_dirs}")
+    logger.debug(f"File suffixes: {args.suffixes}")
+    logger.debug(f"Check for warnings: {args.check_for_warnings}")
+
+    if args.suffixes == ["*"] or args.suffixes == []:
+        args.suffixes = None
+
+    logger.info("Creating BIDS dataset object...")
+    bids = BidsDataset(args.data_path, suffixes=args.suffixes, exclude_dirs=args.exclude_dirs)
+    logger.info(
+        f"BIDS dataset created with schema versions: {bids.schema.get_schema_versions() if bids.schema else 'None'}"
+    )
+    logger.info(f"Found file groups: {list(bids.file_groups.keys())}")
+    return bids
+
+
 if __name__ == "__main__":
     sys.exit(main())
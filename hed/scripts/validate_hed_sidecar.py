@@ -52,9 +52,9 @@ def get_parser():
     output_group.add_argument(
         "-f",
         "--format",
-        choices=["text", "json"],
+        choices=["text", "json", "jsonl"],
         default="text",
-        help="Output format for validation results (default: %(default)s)",
+        help="Output format for validation results; 'jsonl' writes one JSON issue per line (default: %(default)s)",
     )
     output_group.add_argument(
         "-o",
@@ -123,7 +123,7 @@ def main(arg_list=None):
 
         # Validate BIDS sidecar
         logging.info("Validating BIDS sidecar")
-        error_handler = ErrorHandler(check_for_warnings=args.check_for_warnings)
+        error_handler = ErrorHandler(check_for_warnings=args.check_for_warnings, compact_issues=True)
         issues = sidecar.validate(schema, name=sidecar.name, error_handler=error_handler)
 
         # Handle output
@@ -54,9 +54,9 @@ def get_parser():
     output_group.add_argument(
         "-f",
         "--format",
-        choices=["text", "json"],
+        choices=["text", "json", "jsonl"],
         default="text",
-        help="Output format for validation results (default: %(default)s)",
+        help="Output format for validation results; 'jsonl' writes one JSON issue per line (default: %(default)s)",
     )
     output_group.add_argument(
         "-o",
@@ -136,7 +136,7 @@ def main(arg_list=None):
         # Validate HED string only if no definition errors
         if not issues:
             logging.info("Validating HED string")
-            error_handler = ErrorHandler(check_for_warnings=args.check_for_warnings)
+            error_handler = ErrorHandler(check_for_warnings=args.check_for_warnings, compact_issues=True)
             validator = HedValidator(schema, def_dict)
             issues = validator.validate(hed_string, True, error_handler=error_handler)
 
@@ -76,9 +76,9 @@ def get_parser():
     output_group.add_argument(
         "-f",
         "--format",
-        choices=["text", "json"],
+        choices=["text", "json", "jsonl"],
         default="text",
-        help="Output format for validation results (default: %(default)s)",
+        help="Output format for validation results; 'jsonl' writes one JSON issue per line (default: %(default)s)",
     )
     output_group.add_argument(
         "-o",
@@ -144,7 +144,7 @@ def main(arg_list=None):
         # Parse Sidecar if provided
         sidecar = None
         issues = []
-        error_handler = ErrorHandler(check_for_warnings=args.check_for_warnings)
+        error_handler = ErrorHandler(check_for_warnings=args.check_for_warnings, compact_issues=True)
 
         if args.sidecar_file:
             logging.info("Loading Sidecar file")
@@ -1,36 +1,45 @@
 """HED analysis and summarization tools."""
 
-from .analysis.event_manager import EventManager
-from .analysis.file_dictionary import FileDictionary
-from .analysis.hed_tag_manager import HedTagManager
-from .analysis.hed_type_defs import HedTypeDefs
-from .analysis.hed_type_factors import HedTypeFactors
-from .analysis.hed_type import HedType
-from .analysis.hed_type_manager import HedTypeManager
-from .analysis.hed_type_counts import HedTypeCount
-from .analysis.key_map import KeyMap
-from .analysis.tabular_summary import TabularSummary
-from .analysis.temporal_event import TemporalEvent
+from hed._lazy_import import attach as _attach
 
-from .bids.bids_dataset import BidsDataset
-from .bids.bids_file import BidsFile
-from .bids.bids_file_group import BidsFileGroup
-from .bids.bids_sidecar_file import BidsSidecarFile
-from .bids.bids_tabular_file import BidsTabularFile
-from .bids.bids_util import parse_bids_filename
-
-from .util.data_util import get_new_dataframe, get_value_dict, replace_values, reorder_columns
-from .util.io_util import check_filename, clean_filename, extract_suffix_path, get_file_list
-from .util.io_util import get_path_components
-
-from .analysis.annotation_util import (
-    check_df_columns,
-    extract_tags,
-    generate_sidecar_entry,
-    hed_to_df,
-    df_to_hed,
-    merge_hed_dict,
-    str_to_tabular,
-    strs_to_sidecar,
-    to_strlist,
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "analysis.event_manager": ["EventManager"],
+        "analysis.file_dictionary": ["FileDictionary"],
+        "analysis.hed_tag_manager": ["HedTagManager"],
+        "analysis.hed_type_defs": ["HedTypeDefs"],
+        "analysis.hed_type_factors": ["HedTypeFactors"],
+        "analysis.hed_type": ["HedType"],
+        "analysis.hed_type_manager": ["HedTypeManager"],
+        "analysis.hed_type_counts": ["HedTypeCount"],
+        "analysis.key_map": ["KeyMap"],
+        "analysis.tabular_summary": ["TabularSummary"],
+        "analysis.temporal_event": ["TemporalEvent"],
+        "bids.bids_dataset": ["BidsDataset"],
+        "bids.bids_file": ["BidsFile"],
+        "bids.bids_file_group": ["BidsFileGroup"],
+        "bids.bids_sidecar_file": ["BidsSidecarFile"],
+        "bids.bids_tabular_file": ["BidsTabularFile"],
+        "bids.bids_util": ["parse_bids_filename"],
+        "util.data_util": ["get_new_dataframe", "get_value_dict", "replace_values", "reorder_columns"],
+        "util.io_util": [
+            "check_filename",
+            "clean_filename",
+            "extract_suffix_path",
+            "get_file_list",
+            "get_path_components",
+        ],
+        "analysis.annotation_util": [
+            "check_df_columns",
+            "extract_tags",
+            "generate_sidecar_entry",
+            "hed_to_df",
+            "df_to_hed",
+            "merge_hed_dict",
+            "str_to_tabular",
+            "strs_to_sidecar",
+            "to_strlist",
+        ],
+    },
 )
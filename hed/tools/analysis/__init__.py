@@ -1,23 +1,31 @@
 """Basic analysis tools."""
 
-from .file_dictionary import FileDictionary
-from .annotation_util import (
-    check_df_columns,
-    df_to_hed,
-    extract_tags,
-    generate_sidecar_entry,
-    hed_to_df,
-    str_to_tabular,
-    strs_to_sidecar,
-    to_strlist,
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "file_dictionary": ["FileDictionary"],
+        "annotation_util": [
+            "check_df_columns",
+            "df_to_hed",
+            "extract_tags",
+            "generate_sidecar_entry",
+            "hed_to_df",
+            "str_to_tabular",
+            "strs_to_sidecar",
+            "to_strlist",
+        ],
+        "event_manager": ["EventManager"],
+        "hed_tag_manager": ["HedTagManager"],
+        "hed_tag_table": ["HedTagTable"],
+        "hed_type_defs": ["HedTypeDefs"],
+        "hed_type_factors": ["HedTypeFactors"],
+        "hed_type": ["HedType"],
+        "hed_type_manager": ["HedTypeManager"],
+        "hed_type_counts": ["HedTypeCount"],
+        "key_map": ["KeyMap"],
+        "tabular_summary": ["TabularSummary"],
+        "temporal_event": ["TemporalEvent"],
+    },
 )
-from .event_manager import EventManager
-from .hed_tag_manager import HedTagManager
-from .hed_type_defs import HedTypeDefs
-from .hed_type_factors import HedTypeFactors
-from .hed_type import HedType
-from .hed_type_manager import HedTypeManager
-from .hed_type_counts import HedTypeCount
-from .key_map import KeyMap
-from .tabular_summary import TabularSummary
-from .temporal_event import TemporalEvent
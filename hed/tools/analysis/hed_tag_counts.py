@@ -2,6 +2,9 @@
 
 import copy
 
+import numpy as np
+import pandas as pd
+
 
 class HedTagCount:
     """Counts for a particular HedTag in particular file."""
@@ -21,6 +24,29 @@ class HedTagCount:
         self.value_dict = {}  # Keys are the values of the tag and values are counts. None is key for no value.
         self.set_value(hed_tag)
 
+    @classmethod
+    def from_counts(cls, tag, tag_terms, file_name, events, value_dict) -> "HedTagCount":
+        """Create the counts of a tag that have already been computed.
+
+        Parameters:
+            tag (str): The short base tag.
+            tag_terms (tuple): The tag_terms of the tag.
+            file_name (str): Name of the file associated with the counts.
+            events (int): The number of events containing the tag.
+            value_dict (dict): Counts of the values of the tag, with None as the key for no value.
+
+        Returns:
+            HedTagCount: The counts.
+
+        """
+        count = cls.__new__(cls)
+        count.tag = tag
+        count.tag_terms = tag_terms
+        count.events = events
+        count.files = {file_name: ""}
+        count.value_dict = value_dict
+        return count
+
     def set_value(self, hed_tag):
         """Update the tag term value counts for a HedTag.
 
@@ -114,6 +140,79 @@ class HedTagCounts:
 
         self.merge_tag_dicts(tag_dict)
 
+    def update_from_table(self, tag_table, file_name, weights=None):
+        """Update the tag counts with all the rows of a tag table at once.
+
+        Parameters:
+            tag_table (HedTagTable): The tags of a tabular file.
+            file_name (str): The name of the file corresponding to these counts.
+            weights (array-like or None): The number of events each table row stands for. If None, each row is one
+                event. Use a table of the distinct strings of a file with their numbers of occurrences to count
+                each distinct string once.
+
+        Notes:
+            - The result is the same as calling update_tag_counts for the HedString of each event.
+            - Tags are counted with array operations, and only one HedTagCount is made for each distinct tag.
+
+        """
+        if file_name not in self.files:
+            self.files[file_name] = ""
+        table = tag_table.table
+        if table.empty:
+            return
+        if weights is None:
+            weights = np.ones(tag_table.n_rows, dtype=np.int64)
+        tag_codes = table["tag"].cat.codes.to_numpy().astype(np.int64)
+        tag_names = table["tag"].cat.categories
+        rows = table["row"].to_numpy()
+        tag_weights = np.asarray(weights, dtype=np.int64)[rows]
+
+        # A row counts once as an event for each distinct tag in it.
+        _, firsts = np.unique(rows * len(tag_names) + tag_codes, return_index=True)
+        events = np.bincount(tag_codes[firsts], weights=tag_weights[firsts], minlength=len(tag_names))
+
+        # Every occurrence counts for its value, with tags that have no value counted under NaN (None).
+        value_codes, values = pd.factorize(table["extension"], use_na_sentinel=False)
+        pairs, pair_codes = np.unique(tag_codes * len(values) + value_codes, return_inverse=True)
+        pair_counts = np.bincount(pair_codes.ravel(), weights=tag_weights)
+        value_dicts = [{} for _ in tag_names]
+        for pair, pair_count in zip(pairs, pair_counts, strict=True):
+            value = values[pair % len(values)]
+            value_dicts[pair // len(values)][None if pd.isna(value) else value] = int(pair_count)
+
+        _, tag_firsts = np.unique(tag_codes, return_index=True)
+        entry_codes = table["entry"].to_numpy()[tag_firsts]
+        tag_dict = {}
+        for tag_code, entry_code in enumerate(entry_codes):
+            entry = tag_table.entries[entry_code] if entry_code >= 0 else None
+            tag_dict[tag_names[tag_code]] = HedTagCount.from_counts(
+                entry.short_tag_name if entry else tag_names[tag_code],
+                entry.tag_terms if entry else (),
+                file_name,
+                int(events[tag_code]),
+                value_dicts[tag_code],
+            )
+        self.merge_tag_dicts(tag_dict)
+
+    def merge(self, other) -> "HedTagCounts":
+        """Add the counts of another HedTagCounts to these counts.
+
+        Parameters:
+            other (HedTagCounts): The counts to add, usually of other files.
+
+        Returns:
+            HedTagCounts: These counts, so that per-file counts can be combined with functools.reduce.
+
+        Notes:
+            - Merging is associative, so the counts of files can be computed in parallel and combined in any grouping.
+
+        """
+        for file_name in other.files:
+            self.files[file_name] = ""
+        self.total_events += other.total_events
+        self.merge_tag_dicts(other.tag_dict)
+        return self
+
     def organize_tags(self, tag_template) -> tuple:
         """Organize tags into categories as specified by the tag_template.
 
@@ -145,8 +244,6 @@ class HedTagCounts:
             self.tag_dict[tag].events = self.tag_dict[tag].events + count.events
             for file in count.files:
                 self.tag_dict[tag].files[file] = ""
-            if not self.tag_dict[tag].value_dict:
-                continue
             for value, val_count in count.value_dict.items():
                 if value in self.tag_dict[tag].value_dict:
                     self.tag_dict[tag].value_dict[value] = self.tag_dict[tag].value_dict[value] + val_count
@@ -0,0 +1,222 @@
+"""A columnar table of the tag occurrences in a tabular file."""
+
+import numpy as np
+import pandas as pd
+
+from hed.models.hed_string import HedString
+from hed.models.hed_tag import HedTag
+
+
+class HedTagTable:
+    """The tags of a tabular file stored as columns, with one table row per tag occurrence.
+
+    Attributes:
+        name (str): An identifier for the table (usually the name of the tabular file).
+        n_rows (int): The number of rows in the tabular file.
+        entries (list): The schema entries (HedTagEntry) of the tags, indexed by the entry column.
+        table (DataFrame): The tag occurrences, in row order and in tag order within each row, with columns:
+            - row (int): The row of the tabular file containing the tag.
+            - group (int): Number of the group directly containing the tag. 0 is the top level of the row
+              and the other groups of the row are numbered from 1 in the order they start.
+            - parent (int): Number of the group containing that group, or -1 for tags at the top level.
+            - depth (int): Nesting depth of the tag, 0 for tags at the top level.
+            - tag (category): The casefolded short base tag, e.g. 'sensory-event'.
+            - entry (int): Position of the schema entry of the tag in entries, or -1 if it has none.
+            - extension (str): The extension or value of the tag, or missing (NaN) if it has none.
+            - value (float): The value of a takes-value tag in default units, or NaN if not numeric.
+
+    Notes:
+        - Tag counts, value indicators and simple term queries are answered with array operations,
+          rather than by walking the HedString of every row.
+
+    """
+
+    COLUMNS = ["row", "group", "parent", "depth", "tag", "entry", "extension", "value"]
+
+    def __init__(self, hed_objs, name="", codes=None):
+        """Create the table from the HedString objects of a tabular file.
+
+        Parameters:
+            hed_objs (list): HedString (or None) for each row, or for each distinct string if codes is given.
+            name (str): An identifier for the table.
+            codes (array-like or None): Position in hed_objs of the string of each row, or -1 for rows without HED.
+
+        Notes:
+            - If codes is given, each distinct string is traversed once and its tags are repeated for its rows.
+
+        """
+        if codes is None:
+            codes = np.arange(len(hed_objs))
+        codes = np.asarray(codes, dtype=np.intp)
+        self.name = name
+        self.n_rows = len(codes)
+        self.entries = []
+        self._entry_positions = {}
+        self.table = self._make_table(hed_objs, codes)
+
+    @classmethod
+    def from_tabular(cls, input_data, hed_schema, extra_def_dicts=None, expand_defs=True, name=None) -> "HedTagTable":
+        """Create the tag table of a tabular file.
+
+        Parameters:
+            input_data (TabularInput): The tabular file with its sidecar.
+            hed_schema (HedSchema): The schema used to parse the HED strings.
+            extra_def_dicts (list or DefinitionDict or None): Definitions not included in the input_data.
+            expand_defs (bool): If True (the default), Def tags are replaced by their Def-expand groups,
+                so the tags of the definitions are in the table.
+            name (str or None): An identifier for the table. If None, the name of input_data.
+
+        Returns:
+            HedTagTable: The tag table, with a row for each row of input_data.
+
+        """
+        def_dict = input_data.get_def_dict(hed_schema, extra_def_dicts=extra_def_dicts)
+        codes, uniques = pd.factorize(input_data.series_a)
+        hed_objs = []
+        for hed_str in uniques:
+            if not isinstance(hed_str, str) or not hed_str:
+                hed_objs.append(None)
+                continue
+            hed_obj = HedString(hed_str, hed_schema, def_dict=def_dict)
+            if expand_defs:
+                hed_obj.expand_defs()
+            hed_objs.append(hed_obj)
+        if name is None:
+            name = input_data.name
+        return cls(hed_objs, name=name, codes=codes)
+
+    def tag_counts(self) -> pd.DataFrame:
+        """Return the number of rows and the number of occurrences of each tag.
+
+        Returns:
+            DataFrame: Indexed by tag, with columns 'events' (rows containing the tag) and 'occurrences'.
+
+        """
+        grouped = self.table.groupby("tag", observed=True)["row"]
+        counts = pd.DataFrame({"events": grouped.nunique(), "occurrences": grouped.size()})
+        return counts.sort_index()
+
+    def value_counts(self, tag) -> pd.Series:
+        """Return the number of occurrences of each extension value of a tag.
+
+        Parameters:
+            tag (str): The short base tag, e.g. 'Condition-variable'.
+
+        Returns:
+            Series: Counts indexed by extension value, in descending order of count.
+
+        """
+        selected = self.table["tag"] == tag.casefold()
+        return self.table.loc[selected, "extension"].value_counts()
+
+    def rows_with_tag(self, tag, include_descendants=True) -> np.ndarray:
+        """Return a mask of the rows containing a tag.
+
+        Parameters:
+            tag (str): The short base tag, e.g. 'Event'.
+            include_descendants (bool): If True (the default), also match tags that have tag in their tag_terms,
+                as in a bare-term search.
+
+        Returns:
+            ndarray: Boolean array of length n_rows.
+
+        """
+        tag = tag.casefold()
+        if include_descendants:
+            matching = np.array([tag in entry.tag_terms for entry in self.entries] + [False], dtype=bool)
+            # Tags without a schema entry have code -1, which picks the trailing False entry.
+            selected = matching[self.table["entry"].to_numpy()]
+        else:
+            selected = (self.table["tag"] == tag).to_numpy()
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.table["row"].to_numpy()[selected]] = True
+        return mask
+
+    def get_value_indicators(self, tag) -> pd.DataFrame:
+        """Return the number of times each extension value of a tag appears in each row.
+
+        Parameters:
+            tag (str): The short base tag whose values are counted, e.g. 'Condition-variable'.
+
+        Returns:
+            DataFrame: n_rows rows and a column for each distinct value of the tag, in order of appearance.
+
+        Notes:
+            - This is not equivalent to the factors of HedType or HedTypeFactors. The columns are the values of
+              the tag, not the definition names that HedType uses as levels, and a tag is only counted in the
+              rows that contain it, not in every row that an Onset/Offset or Duration event spans.
+
+        """
+        selected = self.table[self.table["tag"] == tag.casefold()]
+        level_codes, levels = pd.factorize(selected["extension"].fillna(""))
+        factors = np.zeros((self.n_rows, len(levels)), dtype=int)
+        np.add.at(factors, (selected["row"].to_numpy(), level_codes), 1)
+        return pd.DataFrame(factors, columns=list(levels))
+
+    def _make_table(self, hed_objs, codes):
+        """Return the table for rows whose strings are hed_objs[codes]."""
+        # Traverse each distinct string once, then repeat its tags for every row containing it.
+        unique_tags = [self._get_tag_columns(hed_obj) for hed_obj in hed_objs]
+        tag_counts = np.array([len(tags) for tags in unique_tags] + [0], dtype=np.intp)
+        tag_starts = np.concatenate(([0], np.cumsum(tag_counts[:-1])))
+        flat = [tag for tags in unique_tags for tag in tags]
+        row_counts = tag_counts[codes]
+        rows = np.repeat(np.arange(self.n_rows), row_counts)
+        row_starts = np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+        positions = tag_starts[codes][rows] + (np.arange(len(rows)) - row_starts)
+
+        unique_table = pd.DataFrame.from_records(flat, columns=self.COLUMNS[1:], nrows=len(flat))
+        table = unique_table.iloc[positions].reset_index(drop=True)
+        table.insert(0, "row", rows)
+        table = table.astype({"group": np.intp, "parent": np.intp, "depth": np.intp, "entry": np.intp})
+        table["tag"] = table["tag"].astype("category")
+        table["value"] = table["value"].astype(float)
+        return table
+
+    def _get_tag_columns(self, hed_obj):
+        """Return the table columns (except row) of each tag in a HedString, in tag order."""
+        tags = []
+        if hed_obj:
+            self._add_group_tags(hed_obj, 0, -1, 0, tags, [0])
+        return tags
+
+    def _add_group_tags(self, group, group_number, parent, depth, tags, group_count):
+        """Append the columns of the tags in a group and its subgroups to tags."""
+        for child in group.children:
+            if not isinstance(child, HedTag):
+                group_count[0] += 1
+                self._add_group_tags(child, group_count[0], group_number, depth + 1, tags, group_count)
+                continue
+            tags.append(
+                (
+                    group_number,
+                    parent,
+                    depth,
+                    child.short_base_tag.casefold(),
+                    self._get_entry_position(child._schema_entry),
+                    child.extension or None,
+                    self._get_value(child),
+                )
+            )
+
+    def _get_entry_position(self, entry):
+        """Return the position of a schema entry in entries, adding it if it is new."""
+        if entry is None:
+            return -1
+        position = self._entry_positions.get(id(entry))
+        if position is None:
+            position = len(self.entries)
+            self._entry_positions[id(entry)] = position
+            self.entries.append(entry)
+        return position
+
+    @staticmethod
+    def _get_value(tag):
+        """Return the numeric value of a takes-value tag in default units, or NaN."""
+        if not tag.extension or not tag.is_takes_value_tag():
+            return np.nan
+        try:
+            value = tag.value_as_default_unit()
+        except ValueError:
+            return np.nan
+        return np.nan if value is None else value
@@ -1,5 +1,6 @@
 """A map of column value keys into new column values."""
 
+import numpy as np
 import pandas as pd
 
 from hed.errors.exceptions import HedFileError
@@ -103,12 +104,37 @@ class KeyMap:
             list:  List which is the same length as the col_map containing the counts of the combinations.
 
         """
-        counts = [0 for _ in range(len(self.col_map))]
-        for index, row in self.col_map.iterrows():
-            key_hash = data_util.get_row_hash(row, self.key_cols)
-            counts[index] = self.count_dict[key_hash]
+        counts = [0] * len(self.col_map)
+        for key_hash, position in self.map_dict.items():
+            counts[position] = self.count_dict[key_hash]
         return counts
 
+    def _factorize_keys(self, df):
+        """Group the rows of a dataframe by their key column values.
+
+        Parameters:
+            df (DataFrame):  DataFrame containing the key columns.
+
+        Returns:
+            tuple[ndarray, ndarray, list]:
+            - The group number of each row, numbered in order of first appearance.
+            - The position of the first row of each group.
+            - The key hash of each group, the same value data_util.get_row_hash gives for its rows.
+
+        Notes:
+            - Only one row per distinct key combination is hashed, so the cost is a few columnar operations.
+
+        """
+        key_df = df[self.key_cols].fillna("n/a").astype(str)
+        if key_df.empty:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), []
+        codes = key_df.groupby(self.key_cols, sort=False).ngroup().to_numpy()
+        _, first_positions = np.unique(codes, return_index=True)
+        key_hashes = [
+            data_util.get_key_hash(key) for key in key_df.iloc[first_positions].itertuples(index=False, name=None)
+        ]
+        return codes, first_positions, key_hashes
+
     def remap(self, data):
         """Remap the columns of a dataframe or columnar file.
 
@@ -143,52 +169,27 @@ class KeyMap:
         Returns:
             list:  The row numbers that had no correspondence in the mapping.
         """
-        # The values here are Python hash() values, which can differ in magnitude by more than
-        # 2**63 (e.g. one near sys.maxsize and another near -sys.maxsize). Keep this Series as
-        # dtype=object (rather than letting pandas infer int64) so that neither this Series nor
-        # anything built from its values is ever treated as a plain numeric array - see the
-        # dtype="object" comment below for why that matters.
-        key_series = df.apply(lambda row: data_util.get_row_hash(row, self.key_cols), axis=1).astype(object)
-        # Key series now contains row_number: hash for each row in the dataframe
-
-        # Add a column containing the mapped index for each row
-        # If pandas is allowed to infer a numeric dtype for an Index built from these hash
-        # values, it may try to detect an evenly-spaced integer range by subtracting adjacent
-        # values, and that subtraction can silently overflow int64. Under pandas >= 3.0 this can
-        # corrupt the resulting Index (e.g. collapse it to length 0), which later raises "Length
-        # of values does not match length of index" - see hed-standard/hed-python for details.
-        # Forcing dtype="object" on the index bypasses that numeric fast path entirely, since
-        # hash keys are only ever used for equality lookups, never arithmetic.
-        map_index = pd.Index(list(self.map_dict.keys()), dtype="object")
-        map_series = pd.Series(
-            data=list(self.map_dict.values()), index=map_index
-        )  # map_series is hash:row_index for each entry in the map_dict index
-        key_values = key_series.map(map_series)  # key_values is df_row_number:map_dict_index
-        # e.g. a key_value entry of 0:79 means row 0 maps to row 79 in the map_dict
-
-        # This adds the map_dict_index column, to merged_df as a new column "key_value"
-        merged_df = df.assign(key_value=key_values.values)
-
-        # Copy all the map_dict data into merged_df as new columns, merging on the map_dict_index number of both
-        remapped_df = pd.merge(
-            merged_df, self.col_map, left_on="key_value", right_index=True, suffixes=("", "_new"), how="left"
-        ).fillna("n/a")
-
-        # Override the original columns with our newly calculated ones
+        codes, _, key_hashes = self._factorize_keys(df)
+        # Position in col_map of each distinct key combination (-1 if it is not in the map) and then of each row.
+        map_positions = np.array([self.map_dict.get(key_hash, -1) for key_hash in key_hashes], dtype=np.intp)
+        row_positions = map_positions[codes]
+        found = row_positions >= 0
+
+        # Rows whose key is not in the map get position -1, which reindex fills with NaN and then n/a.
+        remapped = self.col_map[self.target_cols].reindex(row_positions).fillna("n/a")
+        remapped.index = df.index
         for col in self.target_cols:
-            df[col] = remapped_df[col + "_new"]
+            df[col] = remapped[col]
 
-        # Finally calculate missing indices
-        missing_indices = key_series.index[key_values.isna()].tolist()
-
-        return missing_indices
+        return df.index[~found].tolist()
 
     def resort(self):
         """Sort the col_map in place by the key columns."""
-        self.col_map.sort_values(by=self.key_cols, inplace=True, ignore_index=True)
-        for index, row in self.col_map.iterrows():
-            key_hash = data_util.get_row_hash(row, self.key_cols)
-            self.map_dict[key_hash] = index
+        order = self.col_map.sort_values(by=self.key_cols).index.to_numpy()
+        self.col_map = self.col_map.iloc[order].reset_index(drop=True)
+        new_positions = np.empty(len(order), dtype=np.intp)
+        new_positions[order] = np.arange(len(order))
+        self.map_dict = {key_hash: int(new_positions[position]) for key_hash, position in self.map_dict.items()}
 
     def update(self, data, allow_missing=True):
         """Update the existing map with information from data.
@@ -227,42 +228,23 @@ class KeyMap:
             base_df (DataFrame):       DataFrame of consisting of the columns in the KeyMap
 
         """
-
-        row_list = []
+        codes, first_positions, key_hashes = self._factorize_keys(base_df)
+        key_counts = np.bincount(codes, minlength=len(key_hashes))
+        new_rows = []
         next_pos = len(self.col_map)
-        for _index, row in base_df.iterrows():
-            key, pos_update = self._handle_update(row, row_list, next_pos)
-            next_pos += pos_update
-        if row_list:
-            df = pd.DataFrame(row_list)
+        for key_hash, first_position, key_count in zip(key_hashes, first_positions, key_counts, strict=True):
+            if key_hash not in self.map_dict:
+                self.map_dict[key_hash] = next_pos
+                self.count_dict[key_hash] = 0
+                new_rows.append(first_position)
+                next_pos += 1
+            self.count_dict[key_hash] += int(key_count)
+        if new_rows:
+            df = base_df.iloc[new_rows]
             # Ignore empty col_map to suppress warning
             col_map = self.col_map if not self.col_map.empty else None
             self.col_map = pd.concat([col_map, df], axis=0, ignore_index=True)
 
-    def _handle_update(self, row, row_list, next_pos):
-        """Update the dictionary and counts of the number of times this combination of key columns appears.
-
-        Parameters:
-            row (DataSeries):  Data the values in a row.
-            row_list (list):   A list of rows to be appended to hold the unique rows.
-            next_pos (int):    Index into the row_list of this row
-
-        Returns:
-            tuple[int, int]:
-            - the row hash.
-            - 1 if new row or 0 otherwise.
-
-        """
-        key = data_util.get_row_hash(row, self.key_cols)
-        pos_update = 0
-        if key not in self.map_dict:
-            self.map_dict[key] = next_pos
-            row_list.append(row)
-            pos_update = 1
-            self.count_dict[key] = 0
-        self.count_dict[key] = self.count_dict[key] + 1
-        return key, pos_update
-
     @staticmethod
     def remove_quotes(df, columns=None):
         """Remove quotes from the specified columns and convert to string.
@@ -1,8 +1,10 @@
 """Summarize the contents of columnar files."""
 
 import json
+from functools import partial
 
 from hed.errors.exceptions import HedFileError
+from hed.models.parallel_util import map_chunks
 from hed.tools.analysis import annotation_util
 from hed.tools.util import data_util
 
@@ -342,6 +344,54 @@ class TabularSummary:
         new_tab.files = summary_info.get("Files", {})
         return new_tab
 
+    @staticmethod
+    def summarize_files(
+        file_list, value_cols=None, skip_cols=None, name="", categorical_limit=None, jobs=1
+    ) -> tuple["TabularSummary", dict[str, str]]:
+        """Return the combined summary of a list of tabular files, summarizing them in parallel if requested.
+
+        Parameters:
+            file_list (list): Paths of the tabular files to summarize.
+            value_cols (list, None):  List of columns to be treated as value columns.
+            skip_cols (list, None):   List of columns to be skipped.
+            name (str):               Name of the combined summary.
+            categorical_limit (int, None):  Maximum number of unique values to store for a categorical column.
+            jobs (int, None):  Number of worker processes. If 1, the files are summarized in this process.
+                If None or 0, one worker per CPU is used.
+
+        Returns:
+            tuple[TabularSummary, dict[str, str]]:
+            - The combined summary of the files that could be read.
+            - A dictionary of the files that could not be read and the corresponding error messages.
+
+        Notes:
+            - Each file is summarized separately and merged with update_summary, the same as summarizing the
+              files one at a time. Only if a column overflows categorical_limit can the retained values differ.
+            - Each worker merges the summaries of a contiguous chunk of files, and the chunk summaries are then
+              merged pairwise in order. Every summary held in memory is bounded by categorical_limit.
+
+        """
+        summarize = partial(
+            _summarize_chunk, value_cols=value_cols, skip_cols=skip_cols, categorical_limit=categorical_limit
+        )
+        results = map_chunks(summarize, file_list, jobs)
+        summaries = [summary for summary, _ in results]
+        failures = {file_path: error for _, chunk_failures in results for file_path, error in chunk_failures.items()}
+        while len(summaries) > 1:
+            merged = []
+            for index in range(0, len(summaries) - 1, 2):
+                summaries[index].update_summary(summaries[index + 1])
+                merged.append(summaries[index])
+            if len(summaries) % 2:
+                merged.append(summaries[-1])
+            summaries = merged
+        summary = TabularSummary(
+            value_cols=value_cols, skip_cols=skip_cols, name=name, categorical_limit=categorical_limit
+        )
+        if summaries:
+            summary.update_summary(summaries[0])
+        return summary, failures
+
     @staticmethod
     def get_columns_info(dataframe, skip_cols=None) -> dict[str, dict]:
         """Extract unique value counts for columns.
@@ -387,3 +437,29 @@ class TabularSummary:
             summary_dict[key] = orig_dict
             summary_all.update_summary(orig_dict)
         return summary_all, summary_dict
+
+
+def _summarize_chunk(file_list, value_cols, skip_cols, categorical_limit):
+    """Summarize each file in a list separately and merge the summaries (run in a worker process).
+
+    Parameters:
+        file_list (list): Paths of the tabular files to summarize.
+        value_cols (list, None):  List of columns to be treated as value columns.
+        skip_cols (list, None):   List of columns to be skipped.
+        categorical_limit (int, None):  Maximum number of unique values to store for a categorical column.
+
+    Returns:
+        tuple[TabularSummary, dict[str, str]]: The merged summary and the error messages of files that failed.
+    """
+    chunk_summary = TabularSummary(value_cols=value_cols, skip_cols=skip_cols, categorical_limit=categorical_limit)
+    failures = {}
+    for file_path in file_list:
+        try:
+            file_summary = TabularSummary(
+                value_cols=value_cols, skip_cols=skip_cols, name=file_path, categorical_limit=categorical_limit
+            )
+            file_summary.update(file_path)
+            chunk_summary.update_summary(file_summary)
+        except Exception as e:
+            failures[file_path] = str(e)
+    return chunk_summary, failures
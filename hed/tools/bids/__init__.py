@@ -1,8 +1,15 @@
 """Models for BIDS datasets and files."""
 
-from .bids_dataset import BidsDataset
-from .bids_file import BidsFile
-from .bids_file_group import BidsFileGroup
-from .bids_sidecar_file import BidsSidecarFile
-from .bids_tabular_file import BidsTabularFile
-from .bids_util import parse_bids_filename
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "bids_dataset": ["BidsDataset"],
+        "bids_file": ["BidsFile"],
+        "bids_file_group": ["BidsFileGroup"],
+        "bids_sidecar_file": ["BidsSidecarFile"],
+        "bids_tabular_file": ["BidsTabularFile"],
+        "bids_util": ["parse_bids_filename"],
+    },
+)
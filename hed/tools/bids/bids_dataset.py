@@ -3,6 +3,8 @@
 import logging
 import os
 
+from hed.errors.error_reporter import ErrorHandler
+from hed.errors.issue_sink import send_to_sink
 from hed.tools.bids import bids_util
 from hed.tools.bids.bids_file_group import BidsFileGroup
 from hed.tools.util import io_util
@@ -18,6 +20,7 @@ class BidsDataset:
         root_path (str):  Real root path of the BIDS dataset.
         schema (HedSchema or HedSchemaGroup):  The schema used for evaluation.
         file_groups (dict):  A dictionary of BidsFileGroup objects with a given file suffix.
+        suppressed_issue_count (int):  Number of issues suppressed by the issue limits in the last validate call.
 
     """
 
@@ -65,6 +68,7 @@ class BidsDataset:
         logger.info("Setting up file groups...")
         self.file_groups = self._set_file_groups()
         self.bad_files = []
+        self.suppressed_issue_count = 0
 
         logger.info(
             f"BidsDataset initialized with {len(self.file_groups)} file groups: {list(self.file_groups.keys())}"
@@ -82,16 +86,37 @@ class BidsDataset:
         """
         return self.file_groups.get(suffix, None)
 
-    def validate(self, check_for_warnings=False, schema=None):
+    def validate(
+        self,
+        check_for_warnings=False,
+        schema=None,
+        compact_issues=False,
+        issue_sink=None,
+        max_issues=None,
+        max_issues_per_code=None,
+        max_issues_per_file=None,
+        stop_on_first_error=False,
+    ):
         """Validate the dataset.
 
         Parameters:
             check_for_warnings (bool):  If True, check for warnings.
             schema (HedSchema or HedSchemaGroup or None):  The schema used for validation.
+            compact_issues (bool):  If True, return issues as IssueRecord objects that do not retain parse trees.
+            issue_sink (IssueSink or None):  If given, issues are written to this sink file by file and an empty
+                list is returned.
+            max_issues (int or None):  Stop validating once this many issues have been reported.
+            max_issues_per_code (int or None):  Report at most this many issues of each code.
+            max_issues_per_file (int or None):  Stop validating a file once this many issues have been reported for it.
+            stop_on_first_error (bool):  If True, stop validating each file after its first error.
 
         Returns:
             list:  List of issues encountered during validation. Each issue is a dictionary.
 
+        Notes:
+            - The limits are applied while validating, so files, rows and strings that can no longer
+              contribute issues are skipped. The number of suppressed issues is kept in suppressed_issue_count.
+
         """
         logger = logging.getLogger("hed.bids_dataset")
         logger.info(f"Starting validation of {len(self.file_groups)} file groups")
@@ -106,22 +131,37 @@ class BidsDataset:
             logger.debug(f"Using dataset schema for validation: {this_schema.get_schema_versions()}")
         else:
             logger.error("No valid schema available for validation")
-            return [
+            schema_issues = [
                 {
                     "code": "SCHEMA_LOAD_FAILED",
                     "message": "BIDS dataset_description.json has invalid HEDVersion and passed schema was invalid",
                 }
             ]
-
+            return send_to_sink(schema_issues, issue_sink)
+
+        error_handler = ErrorHandler(
+            check_for_warnings,
+            compact_issues=compact_issues,
+            max_issues=max_issues,
+            max_issues_per_code=max_issues_per_code,
+            max_issues_per_file=max_issues_per_file,
+            stop_on_first_error=stop_on_first_error,
+        )
         for suffix, group in self.file_groups.items():
+            if error_handler.limit_reached:
+                logger.info(f"Issue limit of {max_issues} reached, skipping file group {suffix}")
+                continue
             if group.has_hed:
                 logger.info(f"Validating file group: {suffix} ({len(group.datafile_dict)} files)")
-                group_issues = group.validate(this_schema, check_for_warnings=check_for_warnings)
+                group_issues = group.validate(this_schema, issue_sink=issue_sink, error_handler=error_handler)
                 logger.info(f"File group {suffix} validation completed: {len(group_issues)} issues found")
                 issues += group_issues
             else:
                 logger.debug(f"Skipping file group {suffix} - no HED content")
 
+        self.suppressed_issue_count = error_handler.suppressed_count
+        if error_handler.suppressed_count:
+            logger.info(f"{error_handler.suppressed_count} issues were suppressed by the issue limits")
         logger.info(f"Dataset validation completed: {len(issues)} total issues found")
         return issues
 
@@ -102,13 +102,26 @@ class BidsFileGroup:
                 task_names.add(match.group(1))
         return sorted(task_names)
 
-    def validate(self, hed_schema, extra_def_dicts=None, check_for_warnings=False):
+    def validate(
+        self,
+        hed_schema,
+        extra_def_dicts=None,
+        check_for_warnings=False,
+        compact_issues=False,
+        issue_sink=None,
+        error_handler=None,
+    ):
         """Validate the sidecars and datafiles and return a list of issues.
 
         Parameters:
             hed_schema (HedSchema):  Schema to apply to the validation.
             extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
             check_for_warnings (bool):  If True, include warnings in the check.
+            compact_issues (bool):  If True, return issues as IssueRecord objects that do not retain parse trees.
+            issue_sink (IssueSink or None):  If given, each sidecar and data file writes its issues to this sink
+                as soon as it has been validated and an empty list is returned.
+            error_handler (ErrorHandler or None):  Error handler to use, for example one with issue limits shared
+                across file groups. If given, check_for_warnings and compact_issues are taken from it.
 
         Returns:
             list:  A list of validation issues found. Each issue is a dictionary.
@@ -118,12 +131,13 @@ class BidsFileGroup:
             f"Starting validation of file group '{self.suffix}' (sidecars: {len(self.sidecar_dict)}, data files: {len(self.datafile_dict)})"
         )
 
-        error_handler = ErrorHandler(check_for_warnings)
+        if error_handler is None:
+            error_handler = ErrorHandler(check_for_warnings, compact_issues=compact_issues)
         issues = []
 
         logger.debug(f"Validating {len(self.sidecar_dict)} sidecars...")
         sidecar_issues = self.validate_sidecars(
-            hed_schema, extra_def_dicts=extra_def_dicts, error_handler=error_handler
+            hed_schema, extra_def_dicts=extra_def_dicts, error_handler=error_handler, issue_sink=issue_sink
         )
         logger.info(f"Sidecar validation completed: {len(sidecar_issues)} issues found")
         issues += sidecar_issues
@@ -132,7 +146,7 @@ class BidsFileGroup:
             f"Validating {len([f for f in self.datafile_dict.values() if f.has_hed])} HED-enabled data files..."
         )
         datafile_issues = self.validate_datafiles(
-            hed_schema, extra_def_dicts=extra_def_dicts, error_handler=error_handler
+            hed_schema, extra_def_dicts=extra_def_dicts, error_handler=error_handler, issue_sink=issue_sink
         )
         logger.info(f"Data file validation completed: {len(datafile_issues)} issues found")
         issues += datafile_issues
@@ -140,13 +154,14 @@ class BidsFileGroup:
         logger.info(f"File group '{self.suffix}' validation completed: {len(issues)} total issues")
         return issues
 
-    def validate_sidecars(self, hed_schema, extra_def_dicts=None, error_handler=None):
+    def validate_sidecars(self, hed_schema, extra_def_dicts=None, error_handler=None, issue_sink=None):
         """Validate merged sidecars.
 
         Parameters:
             hed_schema (HedSchema):  HED schema for validation.
             extra_def_dicts (DefinitionDict): Extra definitions.
             error_handler (ErrorHandler):  Error handler to use.
+            issue_sink (IssueSink or None):  If given, the issues of each sidecar are written to this sink.
 
         Returns:
             list:   A list of validation issues found. Each issue is a dictionary.
@@ -157,18 +172,25 @@ class BidsFileGroup:
         issues = []
         validator = SidecarValidator(hed_schema)
         for sidecar in self.sidecar_dict.values():
+            if error_handler.limit_reached:
+                break
             issues += validator.validate(
-                sidecar.contents, extra_def_dicts=extra_def_dicts, name=sidecar.file_path, error_handler=error_handler
+                sidecar.contents,
+                extra_def_dicts=extra_def_dicts,
+                name=sidecar.file_path,
+                error_handler=error_handler,
+                issue_sink=issue_sink,
             )
         return issues
 
-    def validate_datafiles(self, hed_schema, extra_def_dicts=None, error_handler=None):
+    def validate_datafiles(self, hed_schema, extra_def_dicts=None, error_handler=None, issue_sink=None):
         """Validate the datafiles and return an error list.
 
         Parameters:
             hed_schema (HedSchema):  Schema to apply to the validation.
             extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
             error_handler (ErrorHandler):  Error handler to use.
+            issue_sink (IssueSink or None):  If given, the issues of each data file are written to this sink.
 
         Returns:
             list:    A list of validation issues found. Each issue is a dictionary.
@@ -185,12 +207,19 @@ class BidsFileGroup:
         logger.debug(f"Processing {len(hed_files)} out of {len(self.datafile_dict)} data files with HED annotations")
 
         for i, data_obj in enumerate(hed_files, 1):
+            if error_handler.limit_reached:
+                logger.info(f"Issue limit reached, skipping the remaining {len(hed_files) - i + 1} data files")
+                break
             logger.debug(f"Validating data file {i}/{len(hed_files)}: {os.path.basename(data_obj.file_path)}")
 
             had_contents = data_obj.contents
             data_obj.set_contents(overwrite=False)
             file_issues = data_obj.contents.validate(
-                hed_schema, extra_def_dicts=extra_def_dicts, name=data_obj.file_path, error_handler=error_handler
+                hed_schema,
+                extra_def_dicts=extra_def_dicts,
+                name=data_obj.file_path,
+                error_handler=error_handler,
+                issue_sink=issue_sink,
             )
 
             if file_issues:
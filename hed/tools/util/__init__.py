@@ -1,4 +1,11 @@
 """Data and file handling utilities."""
 
-from .data_util import get_new_dataframe, get_value_dict, replace_values, reorder_columns
-from .io_util import check_filename, clean_filename, extract_suffix_path, get_file_list, get_path_components
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "data_util": ["get_new_dataframe", "get_value_dict", "replace_values", "reorder_columns"],
+        "io_util": ["check_filename", "clean_filename", "extract_suffix_path", "get_file_list", "get_path_components"],
+    },
+)
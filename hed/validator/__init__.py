@@ -1,7 +1,14 @@
 """Validation of HED tags."""
 
-from .hed_validator import HedValidator
-from .sidecar_validator import SidecarValidator
-from .def_validator import DefValidator
-from .onset_validator import OnsetValidator
-from .spreadsheet_validator import SpreadsheetValidator
+from hed._lazy_import import attach as _attach
+
+__getattr__, __dir__, __all__ = _attach(
+    __name__,
+    {
+        "hed_validator": ["HedValidator"],
+        "sidecar_validator": ["SidecarValidator"],
+        "def_validator": ["DefValidator"],
+        "onset_validator": ["OnsetValidator"],
+        "spreadsheet_validator": ["SpreadsheetValidator"],
+    },
+)
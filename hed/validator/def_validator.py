@@ -135,11 +135,22 @@ class DefValidator(DefinitionDict):
         Parameters:
             hed_string_obj (HedString): The HED string to check.
 
+        Returns:
+            list[dict]: A list of issues found in validating onsets (i.e., out of order onsets, unknown def names).
+        """
+        return self.validate_onset_groups(self._find_onset_tags(hed_string_obj))
+
+    def validate_onset_groups(self, onset_groups) -> list[dict]:
+        """Validate onset/offset groups that have already been located.
+
+        Parameters:
+            onset_groups (list): The (tag, group) pairs of top-level groups with an Onset, Offset or Inset tag.
+
         Returns:
             list[dict]: A list of issues found in validating onsets (i.e., out of order onsets, unknown def names).
         """
         onset_issues = []
-        for found_onset, found_group in self._find_onset_tags(hed_string_obj):
+        for found_onset, found_group in onset_groups:
             if not found_onset:
                 return []
 
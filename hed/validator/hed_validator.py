@@ -1,9 +1,11 @@
 """Top level validation of HED strings."""
 
+import functools
 import re
 
 from hed.errors import error_reporter
 from hed.errors.error_types import DefinitionErrors, ValidationErrors
+from hed.errors.issue_sink import send_to_sink
 from hed.validator.def_validator import DefValidator
 from hed.validator.util import CharRexValidator, GroupValidator, StringValidator, TagValidator, UnitValueValidator
 
@@ -34,33 +36,36 @@ class HedValidator:
 
         self._validate_characters = hed_schema.schema_83_props
 
-        self._unit_validator = UnitValueValidator(modern_allowed_char_rules=self._validate_characters)
-        self._char_validator = CharRexValidator(modern_allowed_char_rules=self._validate_characters)
-        self._string_validator = StringValidator()
-        self._tag_validator = TagValidator()
+        # The stateless validators only depend on the character rules, so they are shared by all HedValidators.
+        (self._unit_validator, self._char_validator, self._string_validator, self._tag_validator) = (
+            _get_shared_validators(self._validate_characters)
+        )
         self._group_validator = GroupValidator(hed_schema)
 
-    def validate(self, hed_string, allow_placeholders, error_handler=None) -> list[dict]:
+    def validate(self, hed_string, allow_placeholders, error_handler=None, issue_sink=None) -> list[dict]:
         """Validate the HED string object using the schema.
 
         Parameters:
             hed_string (HedString): the string to validate.
             allow_placeholders (bool): allow placeholders in the string.
             error_handler (ErrorHandler or None): the error handler to use, creates a default one if none passed.
+            issue_sink (IssueSink or None): If given, the issues are written to this sink instead of returned.
 
         Returns:
-            list[dict]: A list of issues for HED string.
+            list[dict]: A list of issues for HED string (empty if an issue_sink is given).
         """
         if not error_handler:
             error_handler = error_reporter.ErrorHandler()
         issues = []
         issues += self.run_basic_checks(hed_string, allow_placeholders=allow_placeholders)
+        # Check before filtering, since issue limits on the error handler may suppress errors.
+        has_errors = error_reporter.check_for_any_errors(issues)
         error_handler.add_context_and_filter(issues)
-        if error_reporter.check_for_any_errors(issues):
-            return issues
+        if has_errors or error_handler.file_limit_reached():
+            return send_to_sink(issues, issue_sink)
         issues += self.run_full_string_checks(hed_string)
         error_handler.add_context_and_filter(issues)
-        return issues
+        return send_to_sink(issues, issue_sink)
 
     def run_basic_checks(self, hed_string, allow_placeholders) -> list[dict]:
         """Run basic validation checks on a HED string.
@@ -104,24 +109,15 @@ class HedValidator:
             list[dict]: A list of issues found during validation. Each issue is represented as a dictionary.
 
         Notes:
-            - This method iterates through a series of validation checks defined in the `checks` list.
-            - Each check is a callable function that takes `hed_string` as input and returns a list of issues.
-            - If any check returns issues, the method stops and returns those issues immediately.
-            - If no issues are found, an empty list is returned.
+            - The all-tags, group-level and duplicate checks run in a single traversal of the string.
+            - The checks run in order and the issues of the first check that finds any are returned.
+            - The onset/offset check reuses the temporal groups located during the traversal.
 
         """
-        checks = [
-            self._group_validator.run_all_tags_validators,
-            self._group_validator.run_tag_level_validators,
-            self._def_validator.validate_onset_offset,
-        ]
-
-        for check in checks:
-            issues = check(hed_string)  # Call each function with `hed_string`
-            if issues:
-                return issues
-
-        return []  # Return an empty list if no issues are found
+        issues, onset_groups = self._group_validator.run_tree_validators(hed_string)
+        if issues:
+            return issues
+        return self._def_validator.validate_onset_groups(onset_groups)
 
     # Todo: mark semi private/actually private below this
     def _run_validate_tag_characters(self, original_tag, allow_placeholders) -> list[dict]:
@@ -265,3 +261,25 @@ class HedValidator:
                     validation_issues += self.validate_units(hed_tag, allow_placeholders=allow_placeholders)
 
         return validation_issues
+
+
+@functools.cache
+def _get_shared_validators(modern_allowed_char_rules):
+    """Return the unit, character, string and tag validators shared by validators with the same character rules.
+
+    Parameters:
+        modern_allowed_char_rules (bool): If True, use 8.3 style rules for unicode characters.
+
+    Returns:
+        tuple: The UnitValueValidator, CharRexValidator, StringValidator and TagValidator.
+
+    Notes:
+        - These validators keep no state between calls, so they are built once per process rather than once
+          per HedValidator. The GroupValidator and DefValidator are still created per HedValidator.
+    """
+    return (
+        UnitValueValidator(modern_allowed_char_rules=modern_allowed_char_rules),
+        CharRexValidator(modern_allowed_char_rules=modern_allowed_char_rules),
+        StringValidator(),
+        TagValidator(),
+    )
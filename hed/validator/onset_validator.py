@@ -3,6 +3,7 @@
 from hed.errors.error_reporter import ErrorHandler
 from hed.errors.error_types import TemporalErrors
 from hed.models.model_constants import DefTagNames
+from hed.schema.hed_schema_constants import TagFlags
 
 
 class OnsetValidator:
@@ -73,9 +74,8 @@ class OnsetValidator:
         Returns:
             list[dict]: The validation issues associated with the characters. Each issue is dictionary.
         """
-        banned_tag_list = DefTagNames.TIMELINE_KEYS
         issues = []
         for tag in hed_string.get_all_tags():
-            if tag.short_base_tag in banned_tag_list:
+            if tag.tag_flags & TagFlags.RequiresTimeline:
                 issues += ErrorHandler.format_error(TemporalErrors.TEMPORAL_TAG_NO_TIME, tag)
         return issues
@@ -1,13 +1,13 @@
 """Singleton checker that validates reserved HED tag usage rules loaded from reservedTags.json."""
 
-import json
 import math
-import os
 from collections import defaultdict
 from threading import Lock
 
 from hed.errors.error_reporter import ErrorHandler
 from hed.errors.error_types import TemporalErrors, ValidationErrors
+from hed.schema import reserved_tags
+from hed.schema.hed_schema_constants import TagFlags
 
 
 class ReservedChecker:
@@ -15,7 +15,7 @@ class ReservedChecker:
 
     _instance = None
     _lock = Lock()
-    reserved_reqs_path = os.path.join(os.path.dirname(__file__), "data/reservedTags.json")
+    reserved_reqs_path = reserved_tags.RESERVED_TAGS_PATH
 
     def __new__(cls):
         if cls._instance is None:
@@ -26,10 +26,9 @@ class ReservedChecker:
         return cls._instance
 
     def _initialize(self):
-        # Load the JSON file during the first instantiation
+        # The rules are loaded by the schema package, which also precomputes their TagFlags on each tag entry.
         if not hasattr(self, "reserved_map"):
-            with open(self.reserved_reqs_path) as file:
-                self.reserved_map = json.load(file)
+            self.reserved_map = reserved_tags.get_reserved_map()
         self._initialize_special_tags()
 
     @staticmethod
@@ -67,7 +66,7 @@ class ReservedChecker:
             list[HedTag]: Tags in the group whose short base tag is a reserved name.
 
         """
-        reserved_tags = [tag for tag in group.tags() if tag.short_base_tag in self.special_names]
+        reserved_tags = [tag for tag in group.tags() if tag.tag_flags & TagFlags.Reserved]
         return reserved_tags
 
     @staticmethod
@@ -178,7 +177,7 @@ class ReservedChecker:
         Returns:
             list[list]: A list containing [requires_defs, defs].
         """
-        requires_defs = [tag for tag in reserved_tags if tag.short_base_tag in self.requires_def_tags]
+        requires_defs = [tag for tag in reserved_tags if tag.tag_flags & TagFlags.RequiresDef]
         defs = group.find_def_tags(recursive=False, include_groups=1)
         return [requires_defs, defs]
 
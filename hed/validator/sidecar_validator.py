@@ -8,6 +8,7 @@ import re
 
 from hed.errors import ColumnErrors, DefinitionErrors, ErrorContext, ErrorHandler, SidecarErrors
 from hed.errors.error_reporter import check_for_any_errors, sort_issues
+from hed.errors.issue_sink import send_to_sink
 from hed.models import df_util
 from hed.models.column_mapper import ColumnType
 from hed.models.column_metadata import ColumnMetadata
@@ -33,7 +34,7 @@ class SidecarValidator:
         """
         self._schema = hed_schema
 
-    def validate(self, sidecar, extra_def_dicts=None, name=None, error_handler=None) -> list[dict]:
+    def validate(self, sidecar, extra_def_dicts=None, name=None, error_handler=None, issue_sink=None) -> list[dict]:
         """Validate the input data using the schema
 
         Parameters:
@@ -41,9 +42,10 @@ class SidecarValidator:
             extra_def_dicts (list or DefinitionDict): extra def dicts in addition to sidecar
             name (str): The name to report this sidecar as
             error_handler (ErrorHandler): Error context to use. Creates a new one if None.
+            issue_sink (IssueSink or None): If given, the sorted issues for this sidecar are written to this sink.
 
         Returns:
-            list[dict]: A list of issues associated with each level in the HED string.
+            list[dict]: A list of issues associated with each level in the HED string (empty if an issue_sink is given).
         """
         from hed.validator import HedValidator
 
@@ -51,14 +53,16 @@ class SidecarValidator:
         if error_handler is None:
             error_handler = ErrorHandler()
 
+        suppressed_errors = error_handler.suppressed_error_count
         error_handler.push_error_context(ErrorContext.FILE_NAME, name)
         issues += self.validate_structure(sidecar, error_handler=error_handler)
         issues += self._validate_refs(sidecar, error_handler)
 
         # only allowed early out, something is very wrong with structure or refs
-        if check_for_any_errors(issues):
+        # (errors may have been suppressed by issue limits on the error handler, so count those too)
+        if check_for_any_errors(issues) or error_handler.suppressed_error_count > suppressed_errors:
             error_handler.pop_error_context()
-            return issues
+            return send_to_sink(issues, issue_sink)
         sidecar_def_dict = sidecar.get_def_dict(hed_schema=self._schema, extra_def_dicts=extra_def_dicts)
         hed_validator = HedValidator(self._schema, def_dicts=sidecar_def_dict, definitions_allowed=True)
 
@@ -69,12 +73,17 @@ class SidecarValidator:
         all_ref_columns = sidecar.get_column_refs()
         definition_checks = {}
         for column_data in sidecar:
+            # Nothing more can be reported for this sidecar, so skip the remaining columns.
+            if error_handler.file_limit_reached():
+                break
             column_name = column_data.column_name
             column_data = column_data._get_unvalidated_data()
             hed_strings = column_data.get_hed_strings()
             is_ref_column = column_name in all_ref_columns
             error_handler.push_error_context(ErrorContext.SIDECAR_COLUMN_NAME, column_name)
             for key_name, hed_string in hed_strings.items():
+                if error_handler.file_limit_reached():
+                    break
                 new_issues = []
                 if len(hed_strings) > 1:
                     error_handler.push_error_context(ErrorContext.SIDECAR_KEY_NAME, key_name)
@@ -125,7 +134,7 @@ class SidecarValidator:
 
         error_handler.pop_error_context()  # Filename
 
-        return issues
+        return send_to_sink(issues, issue_sink)
 
     def validate_structure(self, sidecar, error_handler) -> list[dict]:
         """Validate the raw structure of this sidecar.
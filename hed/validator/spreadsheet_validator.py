@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import copy
-import math
 import re
 
+import numpy as np
 import pandas as pd
 
 from hed.errors.error_reporter import ErrorHandler, check_for_any_errors, sort_issues
 from hed.errors.error_types import ErrorContext, TemporalErrors, ValidationErrors
+from hed.errors.issue_sink import send_to_sink
 from hed.models import df_util
 from hed.models.base_input import BaseInput
 from hed.models.column_mapper import ColumnType
@@ -39,7 +40,7 @@ class SpreadsheetValidator:
         self._onset_validator = None
         self.invalid_original_rows = set()
 
-    def validate(self, data, def_dicts=None, name=None, error_handler=None) -> list[dict]:
+    def validate(self, data, def_dicts=None, name=None, error_handler=None, issue_sink=None) -> list[dict]:
         """
         Validate the input data using the schema
 
@@ -48,9 +49,10 @@ class SpreadsheetValidator:
             def_dicts (list of DefDict or DefDict): all definitions to use for validation
             name (str): The name to report errors from this file as
             error_handler (ErrorHandler): Error context to use. Creates a new one if None.
+            issue_sink (IssueSink or None): If given, the sorted issues for this file are written to this sink.
 
         Returns:
-            list[dict]: A list of issues for HED string
+            list[dict]: A list of issues for HED string (empty if an issue_sink is given).
         """
 
         if error_handler is None:
@@ -72,25 +74,28 @@ class SpreadsheetValidator:
 
         if data.needs_sorting:
             data_new = copy.deepcopy(data)
-            data_new._dataframe = df_util.sort_dataframe_by_onsets(data.dataframe)
+            data_new._dataframe = df_util.sort_dataframe_by_onsets(data._dataframe)
             issues += error_handler.format_error_with_context(ValidationErrors.ONSETS_UNORDERED)
             data = data_new
 
-        # If there are n/a errors in the onset column, further validation cannot proceed
-        onsets = data.onsets
-        if onsets is not None:
-            onsets = onsets.astype(str).str.strip()
-            onsets = pd.to_numeric(onsets, errors="coerce")
-            assembled = data.series_a
-            na_issues = self._check_onset_nans(onsets, assembled, self._schema, error_handler, row_adj)
-            issues += na_issues
-            if len(na_issues) > 0:
-                return issues
-            onsets = df_util.split_delay_tags(assembled, self._schema, onsets)
-        else:
-            onsets = None
+        # The assembled strings are read more than once, so they are assembled once for this file.
+        with data._caching_assembly():
+            # If there are n/a errors in the onset column, further validation cannot proceed
+            onsets = data.onsets
+            if onsets is not None:
+                onsets = onsets.astype(str).str.strip()
+                onsets = pd.to_numeric(onsets, errors="coerce")
+                assembled = data.series_a
+                na_issues = self._check_onset_nans(onsets, assembled, self._schema, error_handler, row_adj)
+                issues += na_issues
+                if len(na_issues) > 0:
+                    error_handler.pop_error_context()
+                    return send_to_sink(issues, issue_sink)
+                onsets = df_util.split_delay_tags(assembled, self._schema, onsets)
+            else:
+                onsets = None
 
-        df = data.dataframe_a
+            df = data.dataframe_a
 
         self._hed_validator = HedValidator(self._schema, def_dicts=def_dicts)
         if onsets is not None:
@@ -102,22 +107,32 @@ class SpreadsheetValidator:
 
         # Check the rows of the input data
         issues += self._run_checks(df, error_handler=error_handler, row_adj=row_adj, onset_mask=onset_mask)
-        if self._onset_validator:
-            issues += self._run_onset_checks(onsets, error_handler=error_handler, row_adj=row_adj)
-            issues += self._recheck_duplicates(onsets, error_handler=error_handler, row_adj=row_adj)
+        if self._onset_validator and not error_handler.file_limit_reached():
+            # The merged rows are parsed once and reused by the duplicate re-check.
+            parsed_rows = dict.fromkeys(self._get_merged_rows(onsets))
+            issues += self._run_onset_checks(
+                onsets, error_handler=error_handler, row_adj=row_adj, parsed_rows=parsed_rows
+            )
+            issues += self._recheck_duplicates(
+                onsets, error_handler=error_handler, row_adj=row_adj, parsed_rows=parsed_rows
+            )
         error_handler.pop_error_context()
 
         issues = sort_issues(issues)
-        return issues
+        return send_to_sink(issues, issue_sink)
 
     def _run_checks(self, hed_df, error_handler, row_adj, onset_mask=None):
         issues = []
         columns = list(hed_df.columns)
         self.invalid_original_rows = set()
         for row_number, text_file_row in hed_df.iterrows():
+            # Nothing more can be reported for this file, so skip the remaining rows.
+            if error_handler.file_limit_reached():
+                break
             error_handler.push_error_context(ErrorContext.ROW, row_number + row_adj)
             row_strings = []
             new_column_issues = []
+            has_errors = False
             for column_number, cell in enumerate(text_file_row):
                 if not cell or cell == "n/a":
                     continue
@@ -128,6 +143,8 @@ class SpreadsheetValidator:
                 row_strings.append(column_hed_string)
                 error_handler.push_error_context(ErrorContext.HED_STRING, column_hed_string)
                 new_column_issues = self._hed_validator.run_basic_checks(column_hed_string, allow_placeholders=False)
+                # Check before filtering, since issue limits on the error handler may suppress errors.
+                has_errors = check_for_any_errors(new_column_issues)
 
                 error_handler.add_context_and_filter(new_column_issues)
                 error_handler.pop_error_context()  # HedString
@@ -135,7 +152,7 @@ class SpreadsheetValidator:
 
                 issues += new_column_issues
             # We want to do full onset checks on the combined and filtered rows
-            if check_for_any_errors(new_column_issues):
+            if has_errors:
                 self.invalid_original_rows.add(row_number)
                 error_handler.pop_error_context()  # Row
                 continue
@@ -157,14 +174,20 @@ class SpreadsheetValidator:
             error_handler.pop_error_context()  # Row
         return issues
 
-    def _run_onset_checks(self, onset_filtered, error_handler, row_adj):
+    def _run_onset_checks(self, onset_filtered, error_handler, row_adj, parsed_rows=None):
         issues = []
-        for row in onset_filtered[["HED", "original_index"]].itertuples(index=True):
+        for position, (hed, original_index) in enumerate(
+            zip(onset_filtered["HED"], onset_filtered["original_index"], strict=True)
+        ):
+            if error_handler.file_limit_reached():
+                break
             # Skip rows that had issues.
-            if row.original_index in self.invalid_original_rows:
+            if original_index in self.invalid_original_rows:
                 continue
-            error_handler.push_error_context(ErrorContext.ROW, row.original_index + row_adj)
-            row_string = HedString(row.HED, self._schema, self._hed_validator._def_validator)
+            error_handler.push_error_context(ErrorContext.ROW, original_index + row_adj)
+            row_string = HedString(hed, self._schema, self._hed_validator._def_validator)
+            if parsed_rows is not None and position in parsed_rows:
+                parsed_rows[position] = row_string
 
             if row_string:
                 error_handler.push_error_context(ErrorContext.HED_STRING, row_string)
@@ -176,23 +199,20 @@ class SpreadsheetValidator:
             error_handler.pop_error_context()  # Row
         return issues
 
-    def _recheck_duplicates(self, onset_filtered, error_handler, row_adj):
+    def _recheck_duplicates(self, onset_filtered, error_handler, row_adj, parsed_rows=None):
         issues = []
-        for i in range(len(onset_filtered) - 1):
-            current_row = onset_filtered.iloc[i]
-            next_row = onset_filtered.iloc[i + 1]
-
-            # Skip if the HED column is empty or there was already an error
-            if (
-                not current_row["HED"]
-                or (current_row["original_index"] in self.invalid_original_rows)
-                or (not self._is_within_tolerance(next_row["onset"], current_row["onset"]))
-            ):
-                continue
-
+        if parsed_rows is None:
+            parsed_rows = dict.fromkeys(self._get_merged_rows(onset_filtered))
+        for position, row_string in parsed_rows.items():
+            if error_handler.file_limit_reached():
+                break
+            original_index = onset_filtered["original_index"].iloc[position]
             # At least two rows have been merged with their onsets recognized as the same.
-            error_handler.push_error_context(ErrorContext.ROW, current_row.original_index + row_adj)
-            row_string = HedString(current_row.HED, self._schema, self._hed_validator._def_validator)
+            error_handler.push_error_context(ErrorContext.ROW, original_index + row_adj)
+            if row_string is None:
+                row_string = HedString(
+                    onset_filtered["HED"].iloc[position], self._schema, self._hed_validator._def_validator
+                )
             error_handler.push_error_context(ErrorContext.HED_STRING, row_string)
             new_column_issues = self._hed_validator.run_full_string_checks(row_string)
             error_handler.add_context_and_filter(new_column_issues)
@@ -202,31 +222,30 @@ class SpreadsheetValidator:
 
         return issues
 
-    def _is_within_tolerance(self, onset1, onset2):
-        """
-        Checks if two onset strings are within the specified tolerance.
+    def _get_merged_rows(self, onset_filtered):
+        """Return the positions of the rows that hold merged lines and need their full checks rerun.
 
         Parameters:
-            onset1 (str): The first onset value as a string.
-            onset2 (str): The second onset value as a string.
+            onset_filtered (pd.DataFrame): The split and filtered rows with HED, onset and original_index columns.
 
         Returns:
-            bool: True if the values are within tolerance and valid, False otherwise.
-        """
-        try:
-            # Convert to floats
-            onset1 = float(onset1)
-            onset2 = float(onset2)
+            np.ndarray: The positions of the non-empty rows, without prior errors, whose onset is within
+                ONSET_TOLERANCE of the next row's onset.
 
-            # Check if both values are finite
-            if not (math.isfinite(onset1) and math.isfinite(onset2)):
-                return False
-
-            # Check if the difference is within tolerance
-            return abs(onset1 - onset2) <= self.ONSET_TOLERANCE
-        except ValueError:
-            # Return False if either value is not convertible to a float
-            return False
+        Notes:
+            - Onsets that are missing, infinite or not numbers never match.
+        """
+        onsets = pd.to_numeric(onset_filtered["onset"], errors="coerce").to_numpy(dtype=float)
+        near_next = np.zeros(len(onsets), dtype=bool)
+        with np.errstate(invalid="ignore"):
+            near_next[:-1] = (
+                np.isfinite(onsets[:-1])
+                & np.isfinite(onsets[1:])
+                & (np.abs(onsets[1:] - onsets[:-1]) <= self.ONSET_TOLERANCE)
+            )
+        has_hed = onset_filtered["HED"].ne("").to_numpy(dtype=bool)
+        is_valid = ~onset_filtered["original_index"].isin(self.invalid_original_rows).to_numpy(dtype=bool)
+        return np.flatnonzero(near_next & has_hed & is_valid).tolist()
 
     def _validate_column_structure(self, base_input, error_handler):
         """
@@ -246,7 +265,7 @@ class SpreadsheetValidator:
         for column in base_input.column_metadata().values():
             if column.column_type == ColumnType.Categorical:
                 valid_keys = set(column.hed_dict.keys())
-                column_values = base_input.dataframe[column.column_name]
+                column_values = base_input._dataframe[column.column_name]
 
                 # Find non n/a values that are not in the valid keys
                 invalid_values = set(column_values[(column_values != "n/a") & (~column_values.isin(valid_keys))])
@@ -1,5 +1,6 @@
 """Classes responsible for basic character validation of a string or tag."""
 
+import functools
 import json
 import os
 import re
@@ -196,18 +197,10 @@ class CharRexValidator(CharValidator):
         # List to store problem indices and characters
         bad_indices = []
 
-        # Retrieve the allowed character classes for the given class_name
-        allowed_classes = self._rex_dict["class_chars"].get(cname, [])
-        if not allowed_classes:
+        # The combined regex of the allowed character classes is compiled once per class name
+        compiled_regex = _get_class_char_regex(cname)
+        if compiled_regex is None:
             return bad_indices
-        # Combine the corresponding regular expressions from the char_regex section
-        allowed_regex_parts = [self._rex_dict["char_regex"][char_class] for char_class in allowed_classes]
-
-        # Create one combined regex that matches any of the allowed character classes
-        combined_regex = "|".join(allowed_regex_parts)
-
-        # Compile the combined regular expression
-        compiled_regex = re.compile(combined_regex)
 
         # Iterate through the input string, checking each character
         for index, char in enumerate(in_str):
@@ -241,7 +234,25 @@ class CharRexValidator(CharValidator):
 
     @staticmethod
     def _get_rex_dict():
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        json_path = os.path.realpath(os.path.join(current_dir, CLASS_REX_FILENAME))
-        with open(json_path, encoding="utf-8") as f:
-            return json.load(f)
+        """Return the class regex tables, which are read from disk once and shared, so must not be modified."""
+        return _load_rex_dict()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_rex_dict():
+    """Read the class regex tables from CLASS_REX_FILENAME."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    json_path = os.path.realpath(os.path.join(current_dir, CLASS_REX_FILENAME))
+    with open(json_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.cache
+def _get_class_char_regex(cname):
+    """Return the compiled regex matching any character allowed by value class cname, or None if unrestricted."""
+    rex_dict = _load_rex_dict()
+    allowed_classes = rex_dict["class_chars"].get(cname, [])
+    if not allowed_classes:
+        return None
+    # One combined regex that matches any of the allowed character classes
+    return re.compile("|".join(rex_dict["char_regex"][char_class] for char_class in allowed_classes))
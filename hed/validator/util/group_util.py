@@ -2,8 +2,9 @@
 
 from hed.errors.error_reporter import ErrorHandler
 from hed.errors.error_types import TemporalErrors, ValidationErrors
+from hed.models.hed_tag import HedTag
 from hed.models.model_constants import DefTagNames
-from hed.schema.hed_schema_constants import HedKey
+from hed.schema.hed_schema_constants import HedKey, TagFlags
 from hed.validator.reserved_checker import ReservedChecker
 from hed.validator.util.dup_util import DuplicateChecker
 
@@ -25,6 +26,12 @@ class GroupValidator:
         self._hed_schema = hed_schema
         self._reserved_checker = ReservedChecker.get_instance()
         self._duplicate_checker = DuplicateChecker()
+        self._required_prefixes = [
+            (prefix, prefix.casefold()) for prefix in hed_schema.get_tags_with_attribute(HedKey.Required)
+        ]
+        self._unique_prefixes = [
+            (prefix, prefix.casefold()) for prefix in hed_schema.get_tags_with_attribute(HedKey.Unique)
+        ]
 
     def run_tag_level_validators(self, hed_string_obj) -> list[dict]:
         """Report invalid groups at each level.
@@ -65,6 +72,30 @@ class GroupValidator:
         validation_issues += self._validate_tags_in_hed_string(tags)
         return validation_issues
 
+    def run_tree_validators(self, hed_string_obj) -> tuple[list[dict], list[tuple]]:
+        """Run the all-tags and tag-level checks in a single traversal of a HED string.
+
+        Parameters:
+            hed_string_obj (HedString): A HedString object.
+
+        Returns:
+            tuple[list[dict], list[tuple]]:
+            - The issues run_all_tags_validators and then run_tag_level_validators would report, stopping at the
+              first check that finds issues.
+            - The (tag, group) pairs of the top-level groups with an Onset, Offset or Inset tag, as returned by
+              find_top_level_tags, for DefValidator.validate_onset_groups.
+
+        Notes:
+            - Each tag and group is visited once, gathering the required/unique tag counts, the group
+              relationship issues and the duplicate hashes together.
+        """
+        walk = _TreeWalk(self, hed_string_obj)
+        walk.visit(hed_string_obj, False)
+        issues = walk.tag_issues()
+        if not issues:
+            issues = walk.group_issues or walk.duplicate_issues
+        return issues, walk.temporal_groups
+
     # ==========================================================================
     # Mostly internal functions to check individual types of errors
     # =========================================================================+
@@ -83,23 +114,35 @@ class GroupValidator:
         """
 
         for original_tag_group, is_top_level in hed_string_obj.get_all_groups(also_return_depth=True):
-            is_group = original_tag_group.is_group
+            validation_issues = self._check_group(original_tag_group, is_top_level)
+            if validation_issues:
+                return validation_issues
 
-            # Check for empty group anywhere this is fatal
-            if not original_tag_group and is_group:
-                return ErrorHandler.format_error(ValidationErrors.HED_GROUP_EMPTY, tag=original_tag_group)
+        return []
 
-            # If a tag should be in a group. If not at the top level, a fatal error occurs.
-            validation_issues = self.check_tag_level_issue(original_tag_group.tags(), is_top_level, is_group)
-            if len(validation_issues) > 0:
-                return validation_issues
+    def _check_group(self, group, is_top_level):
+        """Check the relationships of the tags directly in a single group.
 
-            # If the reserved group requirements are not met, this is a fatal error.
-            validation_issues = self._check_reserved_group_requirements(original_tag_group)
-            if len(validation_issues) > 0:
-                return validation_issues
+        Parameters:
+            group (HedGroup): The group to check.
+            is_top_level (bool): If True, this group is a direct child of the HED string.
 
-        return []
+        Returns:
+            list: Validation issues for the first failing check. Each issue is a dictionary.
+        """
+        is_group = group.is_group
+
+        # Check for empty group anywhere this is fatal
+        if not group and is_group:
+            return ErrorHandler.format_error(ValidationErrors.HED_GROUP_EMPTY, tag=group)
+
+        # If a tag should be in a group. If not at the top level, a fatal error occurs.
+        validation_issues = self.check_tag_level_issue(group.tags(), is_top_level, is_group)
+        if len(validation_issues) > 0:
+            return validation_issues
+
+        # If the reserved group requirements are not met, this is a fatal error.
+        return self._check_reserved_group_requirements(group)
 
     def _check_reserved_group_requirements(self, group):
         """This is called if group is top-level.
@@ -142,7 +185,7 @@ class GroupValidator:
         if len(validation_issues) > 0:
             return validation_issues
 
-        top_level_tags = [tag for tag in original_tag_list if tag.base_tag_has_attribute(HedKey.TopLevelTagGroup)]
+        top_level_tags = [tag for tag in original_tag_list if tag.tag_flags & TagFlags.TopLevelTagGroup]
         if not is_top_level:
             validation_issues += GroupValidator._check_no_top_tags(top_level_tags)
         return validation_issues
@@ -188,7 +231,7 @@ class GroupValidator:
         TODO: Incorporate the
         """
         validation_issues = []
-        tag_group_tags = [tag for tag in tag_list if tag.base_tag_has_attribute(HedKey.TagGroup)]
+        tag_group_tags = [tag for tag in tag_list if tag.tag_flags & TagFlags.TagGroup]
         for tag_group_tag in tag_group_tags:
             if not is_group:
                 validation_issues += ErrorHandler.format_error(ValidationErrors.HED_TAG_GROUP_TAG, tag=tag_group_tag)
@@ -248,9 +291,7 @@ class GroupValidator:
         duration_issues = []
         for top_tag, group in hed_string_obj.find_top_level_tags(anchor_tags=DefTagNames.DURATION_KEYS):
             top_level_tags = [
-                tag.short_base_tag
-                for tag in group.get_all_tags()
-                if tag.base_tag_has_attribute(HedKey.TopLevelTagGroup)
+                tag.short_base_tag for tag in group.get_all_tags() if tag.tag_flags & TagFlags.TopLevelTagGroup
             ]
             # Skip onset/inset/offset
             if any(tag in DefTagNames.TEMPORAL_KEYS for tag in top_level_tags):
@@ -285,3 +326,79 @@ class GroupValidator:
         validation_issues += self.check_for_required_tags(tags)
         validation_issues += self.check_multiple_unique_tags_exist(tags)
         return validation_issues
+
+
+class _TreeWalk:
+    """State gathered by GroupValidator.run_tree_validators during its single pass over a HED string."""
+
+    _temporal_keys = {key.casefold() for key in DefTagNames.TEMPORAL_KEYS}
+
+    def __init__(self, group_validator, root):
+        self._validator = group_validator
+        self._root = root
+        self._required_found = [False] * len(group_validator._required_prefixes)
+        self._unique_counts = [0] * len(group_validator._unique_prefixes)
+        self.group_issues = []
+        self.duplicate_issues = []
+        self.temporal_groups = []
+
+    def visit(self, group, is_top_level):
+        """Check a group and its descendants, returning its duplicate hash.
+
+        Parameters:
+            group (HedGroup): The group to visit.
+            is_top_level (bool): If True, this group is a direct child of the HED string.
+
+        Returns:
+            int or None: The hash used for duplicate detection or None once a duplicate has been found.
+
+        Notes:
+            - Groups are checked in the same pre-order as get_all_groups and duplicates are found in the same
+              order as DuplicateChecker, so the first issue reported is unchanged.
+        """
+        if not self.group_issues:
+            self.group_issues = self._validator._check_group(group, is_top_level)
+        find_temporal = is_top_level
+        group_hashes = set()
+        for child in group.children:
+            if isinstance(child, HedTag):
+                self._count_tag(child)
+                if find_temporal and child.short_base_tag.casefold() in self._temporal_keys:
+                    self.temporal_groups.append((child, group))
+                    find_temporal = False
+                this_hash = hash(child) if not self.duplicate_issues else None
+            else:
+                this_hash = self.visit(child, group is self._root)
+            if self.duplicate_issues or this_hash is None:
+                continue
+            if this_hash in group_hashes:
+                self.duplicate_issues = DuplicateChecker._get_duplication_error(child)
+                continue
+            group_hashes.add(this_hash)
+        if self.duplicate_issues:
+            return None
+        return hash(frozenset(group_hashes))
+
+    def _count_tag(self, tag):
+        if not self._required_found and not self._unique_counts:
+            return
+        long_tag = tag.long_tag.casefold()
+        for index, (_, prefix) in enumerate(self._validator._required_prefixes):
+            if long_tag.startswith(prefix):
+                self._required_found[index] = True
+        for index, (_, prefix) in enumerate(self._validator._unique_prefixes):
+            if long_tag.startswith(prefix):
+                self._unique_counts[index] += 1
+
+    def tag_issues(self):
+        """Return the missing required tag and repeated unique tag issues."""
+        validation_issues = []
+        for (prefix, _), found in zip(self._validator._required_prefixes, self._required_found, strict=True):
+            if not found:
+                validation_issues += ErrorHandler.format_error(
+                    ValidationErrors.REQUIRED_TAG_MISSING, tag_namespace=prefix
+                )
+        for (prefix, _), count in zip(self._validator._unique_prefixes, self._unique_counts, strict=True):
+            if count > 1:
+                validation_issues += ErrorHandler.format_error(ValidationErrors.TAG_NOT_UNIQUE, tag_namespace=prefix)
+        return validation_issues
@@ -5,6 +5,7 @@ from hed.errors import (
     ErrorContext,
     ErrorHandler,
     ErrorSeverity,
+    IssueRecord,
     SchemaWarnings,
     ValidationErrors,
     get_printable_issue_string,
@@ -346,3 +347,125 @@ class TestSeparateIssues(unittest.TestCase):
         errors, warnings = separate_issues(issues)
         self.assertEqual(len(errors), 1, "Issue missing severity should default to ERROR")
         self.assertEqual(len(warnings), 1)
+
+
+class TestCompactIssues(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._schema = load_schema_version("8.3.0")
+
+    def _validate(self, compact_issues):
+        error_handler = ErrorHandler(check_for_warnings=True, compact_issues=compact_issues)
+        error_handler.push_error_context(ErrorContext.FILE_NAME, "file.tsv")
+        error_handler.push_error_context(ErrorContext.ROW, 3)
+        hed_string = HedString("Red, Sensory-event/Blech, (Def/Missing)", self._schema)
+        error_handler.push_error_context(ErrorContext.HED_STRING, hed_string)
+        issues = hed_string.validate(error_handler=error_handler)
+        error_handler.pop_error_context()
+        error_handler.add_context_and_filter(issues)
+        return issues
+
+    def test_records_hold_no_hed_objects(self):
+        issues = self._validate(compact_issues=True)
+        self.assertTrue(issues)
+        for issue in issues:
+            self.assertIsInstance(issue, IssueRecord)
+            self.assertIsInstance(issue[ErrorContext.HED_STRING], str)
+            self.assertEqual(issue[ErrorContext.ROW], 3)
+            for value in issue.values():
+                self.assertNotIsInstance(value, (HedString, HedTag))
+
+    def test_records_are_immutable(self):
+        issue = self._validate(compact_issues=True)[0]
+        with self.assertRaises(TypeError):
+            issue["code"] = "OTHER"
+        with self.assertRaises(TypeError):
+            issue.update(code="OTHER")
+        mutable = issue.copy()
+        mutable["code"] = "OTHER"
+        self.assertNotEqual(issue["code"], "OTHER")
+
+    def test_output_matches_full_issues(self):
+        full = self._validate(compact_issues=False)
+        compact = self._validate(compact_issues=True)
+        self.assertEqual(get_printable_issue_string(full), get_printable_issue_string(compact))
+        for full_issue, compact_issue in zip(iter_errors(full), iter_errors(compact), strict=True):
+            # Records keep the HED string as originally written rather than its normalized str() form.
+            self.assertEqual(compact_issue.pop(ErrorContext.HED_STRING), "Red, Sensory-event/Blech, (Def/Missing)")
+            full_issue.pop(ErrorContext.HED_STRING)
+            self.assertEqual(full_issue, compact_issue)
+        self.assertEqual(ErrorHandler.get_code_counts(full), ErrorHandler.get_code_counts(compact))
+
+    def test_format_error_with_context(self):
+        error_handler = ErrorHandler(compact_issues=True)
+        hed_string = HedString("Red", self._schema)
+        error_handler.push_error_context(ErrorContext.HED_STRING, hed_string)
+        issue = error_handler.format_error_with_context(ValidationErrors.TAG_NOT_UNIQUE, "Red")[0]
+        self.assertIsInstance(issue, IssueRecord)
+        self.assertEqual(issue[ErrorContext.HED_STRING], "Red")
+
+    def test_record_pickles(self):
+        import pickle
+
+        issue = self._validate(compact_issues=True)[0]
+        restored = pickle.loads(pickle.dumps(issue))
+        self.assertIsInstance(restored, IssueRecord)
+        self.assertEqual(restored, issue)
+
+
+class TestIssueLimits(unittest.TestCase):
+    def _report(self, error_handler, file_name, count, code=ValidationErrors.TAG_NOT_UNIQUE):
+        error_handler.push_error_context(ErrorContext.FILE_NAME, file_name)
+        issues = []
+        for _ in range(count):
+            issues += error_handler.format_error_with_context(code, "Red")
+        error_handler.pop_error_context()
+        return issues
+
+    def test_no_limits(self):
+        error_handler = ErrorHandler()
+        self.assertEqual(len(self._report(error_handler, "a.tsv", 5)), 5)
+        self.assertFalse(error_handler.limit_reached)
+        self.assertFalse(error_handler.file_limit_reached("a.tsv"))
+
+    def test_max_issues(self):
+        error_handler = ErrorHandler(max_issues=3)
+        self.assertEqual(len(self._report(error_handler, "a.tsv", 2)), 2)
+        self.assertFalse(error_handler.limit_reached)
+        self.assertEqual(len(self._report(error_handler, "b.tsv", 4)), 1)
+        self.assertTrue(error_handler.limit_reached)
+        self.assertTrue(error_handler.file_limit_reached("c.tsv"))
+        self.assertEqual(error_handler.issue_count, 3)
+        self.assertEqual(error_handler.suppressed_count, 3)
+
+    def test_max_issues_per_code(self):
+        error_handler = ErrorHandler(max_issues_per_code=2)
+        self.assertEqual(len(self._report(error_handler, "a.tsv", 3)), 2)
+        self.assertEqual(len(self._report(error_handler, "b.tsv", 3)), 0)
+        self.assertEqual(len(self._report(error_handler, "b.tsv", 3, ValidationErrors.HED_DEF_UNMATCHED)), 2)
+        self.assertFalse(error_handler.file_limit_reached("b.tsv"))
+        self.assertEqual(error_handler.suppressed_error_count, 5)
+
+    def test_max_issues_per_file(self):
+        error_handler = ErrorHandler(max_issues_per_file=2)
+        self.assertEqual(len(self._report(error_handler, "a.tsv", 3)), 2)
+        self.assertTrue(error_handler.file_limit_reached("a.tsv"))
+        self.assertEqual(len(self._report(error_handler, "b.tsv", 3)), 2)
+
+    def test_stop_on_first_error(self):
+        error_handler = ErrorHandler(check_for_warnings=True, stop_on_first_error=True)
+        issues = self._report(error_handler, "a.tsv", 2, ValidationErrors.HED_UNKNOWN_COLUMN)
+        self.assertEqual(len(issues), 2, "Warnings do not stop a file")
+        self.assertFalse(error_handler.file_limit_reached("a.tsv"))
+        self.assertEqual(len(self._report(error_handler, "a.tsv", 3)), 1)
+        self.assertTrue(error_handler.file_limit_reached("a.tsv"))
+        self.assertFalse(error_handler.file_limit_reached("b.tsv"))
+
+    def test_limits_count_each_issue_once(self):
+        error_handler = ErrorHandler(max_issues=2)
+        issues = self._report(error_handler, "a.tsv", 2)
+        self.assertTrue(all(isinstance(issue, IssueRecord) for issue in issues))
+        error_handler.push_error_context(ErrorContext.FILE_NAME, "a.tsv")
+        error_handler.add_context_and_filter(issues)
+        self.assertEqual(len(issues), 2)
+        self.assertEqual(error_handler.issue_count, 2)
@@ -0,0 +1,69 @@
+import io
+import json
+import os
+import unittest
+
+from hed import Sidecar, load_schema
+from hed.errors import CountingIssueSink, ErrorContext, ErrorSeverity, JsonLinesIssueSink, ListIssueSink
+from hed.errors.issue_sink import IssueSink, send_to_sink
+from hed.validator.sidecar_validator import SidecarValidator
+
+
+def _make_issue(code, file_name="a.tsv", severity=ErrorSeverity.ERROR):
+    return {"code": code, "message": f"{code} message", "severity": severity, ErrorContext.FILE_NAME: file_name}
+
+
+class TestIssueSinks(unittest.TestCase):
+    def test_send_to_sink(self):
+        issues = [_make_issue("A")]
+        self.assertIs(send_to_sink(issues, None), issues)
+        sink = ListIssueSink()
+        self.assertEqual(send_to_sink(issues, sink), [])
+        self.assertEqual(sink.issues, issues)
+
+    def test_issue_sink_is_abstract(self):
+        with self.assertRaises(TypeError):
+            IssueSink()
+
+    def test_json_lines_sink(self):
+        stream1, stream2 = io.StringIO(), io.StringIO()
+        sink = JsonLinesIssueSink(stream1, stream2)
+        sink.write([_make_issue("A"), _make_issue("B")])
+        sink.write([])
+        sink.write([_make_issue("C")])
+        lines = stream1.getvalue().splitlines()
+        self.assertEqual([json.loads(line)["code"] for line in lines], ["A", "B", "C"])
+        self.assertEqual(stream1.getvalue(), stream2.getvalue())
+
+    def test_counting_sink_matches_filter_issues_by_count(self):
+        from hed.errors import ErrorHandler
+
+        issues = [_make_issue("A"), _make_issue("A"), _make_issue("A", "b.tsv"), _make_issue("B", "b.tsv")]
+        issues.append(_make_issue("W", severity=ErrorSeverity.WARNING))
+        for by_file in (False, True):
+            with self.subTest(by_file=by_file):
+                collected = ListIssueSink()
+                sink = CountingIssueSink(collected, error_limit=1, by_file=by_file)
+                sink.write(issues[:2])
+                sink.write(issues[2:])
+                expected, expected_counts = ErrorHandler.filter_issues_by_count(issues, 1, by_file=by_file)
+                self.assertEqual(collected.issues, expected)
+                self.assertEqual(sink.get_code_counts(), expected_counts)
+                self.assertEqual(sink.get_code_counts(), ErrorHandler.get_code_counts(issues))
+                self.assertEqual(sink.error_count, 4)
+                self.assertEqual(sink.warning_count, 1)
+                self.assertEqual(sink.total_count, 5)
+
+    def test_sidecar_validator_streams(self):
+        base_data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../data/")
+        hed_schema = load_schema(os.path.join(base_data_dir, "schema_tests/HED8.0.0t.xml"))
+        sidecar = Sidecar(os.path.join(base_data_dir, "sidecar_tests/malformed_refs_test.json"))
+        validator = SidecarValidator(hed_schema)
+        expected = validator.validate(sidecar, name="sidecar.json")
+        sink = ListIssueSink()
+        self.assertEqual(validator.validate(sidecar, name="sidecar.json", issue_sink=sink), [])
+        self.assertEqual(sink.issues, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
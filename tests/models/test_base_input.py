@@ -77,6 +77,61 @@ class Test(unittest.TestCase):
         }
         self.assertEqual(defs, expected_defs)
 
+    def test_expand_and_shrink_defs(self):
+        def_dict = DefinitionDict("(Definition/MyDef, (Red, Square))", hed_schema=self.hed_schema)
+        df = pd.DataFrame({"onset": ["1.0", "2.0", "3.0"], "HED": ["Def/MyDef, Blue", "Blue", "Def/MyDef, Blue"]})
+        mapper = ColumnMapper(optional_tag_columns=["HED"], warn_on_missing_column=False)
+        hed_input = BaseInput(df, mapper=mapper)
+        hed_input.expand_defs(self.hed_schema, def_dict)
+        expanded = hed_input.dataframe["HED"].tolist()
+        self.assertEqual(
+            expanded, ["(Def-expand/MyDef,(Red,Square)),Blue", "Blue", "(Def-expand/MyDef,(Red,Square)),Blue"]
+        )
+        hed_input.shrink_defs(self.hed_schema)
+        self.assertEqual(hed_input.dataframe["HED"].tolist(), ["Def/MyDef,Blue", "Blue", "Def/MyDef,Blue"])
+
+    def test_assembly_cache(self):
+        df = pd.DataFrame({"onset": ["1.0", "2.0"], "HED": ["Def/MyDef, Blue", "n/a"], "value": ["3", "n/a"]})
+        mapper = ColumnMapper(tag_columns=["HED"], column_prefix_dictionary={"value": "Age/"})
+        hed_input = BaseInput(df, mapper=mapper)
+        self.assertEqual(hed_input.series_a.tolist(), ["Def/MyDef, Blue, Age/3", ""])
+
+        with hed_input._caching_assembly():
+            # Returned results are copies, so changing them leaves the cache intact.
+            series = hed_input.series_a
+            series[0] = "Red"
+            assembled = hed_input.dataframe_a
+            assembled.loc[0, "HED"] = "Red"
+            self.assertEqual(hed_input.series_a.tolist(), ["Def/MyDef, Blue, Age/3", ""])
+            self.assertEqual(hed_input.dataframe_a["HED"].tolist(), ["Def/MyDef, Blue", "n/a"])
+
+            # Changes made through the input or a new mapper rebuild the assembly.
+            def_dict = DefinitionDict("(Definition/MyDef, (Red, Square))", hed_schema=self.hed_schema)
+            hed_input.expand_defs(self.hed_schema, def_dict)
+            self.assertEqual(hed_input.series_a.tolist(), ["(Def-expand/MyDef,(Red,Square)),Blue, Age/3", ""])
+            hed_input.reset_mapper(ColumnMapper(tag_columns=["HED"]))
+            self.assertEqual(hed_input.series_a.tolist(), ["(Def-expand/MyDef,(Red,Square)),Blue", ""])
+            self.assertEqual(hed_input.assemble(mapper).columns.tolist(), ["HED", "value"])
+        self.assertIsNone(hed_input._assembly_cache)
+
+    def test_assembly_in_place_edit(self):
+        df = pd.DataFrame({"onset": ["1.0", "2.0"], "HED": ["Sensory-event", "Red"]})
+        hed_input = BaseInput(df, mapper=ColumnMapper(tag_columns=["HED"]))
+        kept = hed_input.dataframe
+        self.assertEqual(hed_input.series_a.tolist(), ["Sensory-event", "Red"])
+        self.assertEqual(hed_input.dataframe_a["HED"].tolist(), ["Sensory-event", "Red"])
+        # Edits through a kept reference are picked up, since results are only cached during validation.
+        kept.loc[0, "HED"] = "Blue"
+        self.assertEqual(hed_input.series_a.tolist(), ["Blue", "Red"])
+        self.assertEqual(hed_input.dataframe_a["HED"].tolist(), ["Blue", "Red"])
+        hed_input.dataframe.loc[1, "HED"] = "Green"
+        self.assertEqual(hed_input.series_a.tolist(), ["Blue", "Green"])
+
+    def test_assemble_keeps_dataframe_types(self):
+        dtypes = self.input_data1.dataframe.dtypes.tolist()
+        self.input_data1.assemble()
+        self.assertEqual(self.input_data1.dataframe.dtypes.tolist(), dtypes)
+
     def test_file_not_found(self):
         with self.assertRaises(HedFileError):
             BaseInput("nonexistent_file.tsv")
@@ -367,3 +367,17 @@ class TestFindMatching(unittest.TestCase):
         search_string = "word0, (word1, (word2), ~word3)"
         expected = pd.Series([True, False, False, False])
         self.base_find_matching(series, search_string, expected)
+
+    def test_multiple_negative_words(self):
+        series = pd.Series(["word0, word1", "word0, word2", "word0, word3", "word0, word22"])
+        expected = pd.Series([False, False, True, True])
+        self.base_find_matching(series, "word0, ~word1, ~word2", expected)
+
+    def test_repeated_lines_and_index(self):
+        lines = ["word0, (word1, word2)", "word0, word1, word2", None, "(word1, word2), word3"]
+        series = pd.Series(lines * 50, index=[f"row{i}" for i in range(200)])
+        mask = find_matching(series, "@word0, (word1, word2)")
+        self.assertTrue(mask.index.equals(series.index))
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(mask.tolist(), [True, True, False, False] * 50)
+        self.assertEqual(find_matching(series, "word1, ~word3").tolist(), [True, True, False, False] * 50)
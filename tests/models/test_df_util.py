@@ -108,6 +108,18 @@ class TestExpandDefs(unittest.TestCase):
             hed_schema=self.schema,
         )
 
+    def test_expand_defs_repeated_values(self):
+        df = pd.DataFrame(
+            {"column1": ["Def/TestDefNormal,Event/SomeEvent", "Event/SomeEvent", "Def/TestDefPlaceholder/5"] * 10}
+        )
+        expand_defs(df, self.schema, self.def_dict, ["column1"])
+        expected = [
+            "(Def-expand/TestDefNormal,(Acceleration/2471,Action/TestDef2)),Event/SomeEvent",
+            "Event/SomeEvent",
+            "(Def-expand/TestDefPlaceholder/5,(Acceleration/5,Action/TestDef2))",
+        ]
+        self.assertEqual(df["column1"].tolist(), expected * 10)
+
     def test_expand_defs_normal(self):
         df = pd.DataFrame({"column1": ["Def/TestDefNormal,Event/SomeEvent"]})
         expected_df = pd.DataFrame(
@@ -162,6 +174,22 @@ class TestConvertToForm(unittest.TestCase):
     def setUp(self):
         self.schema = load_schema_version("8.2.0")
 
+    def test_convert_to_form_repeated_values(self):
+        series = pd.Series(["Azure,See", "Event", None, "Azure,See", "Event"] * 20, index=range(100, 200))
+        convert_to_form(series, self.schema, "long_tag")
+        long_azure = "Property/Sensory-property/Sensory-attribute/Visual-attribute/Color/CSS-color/White-color/Azure"
+        self.assertEqual(series[100], long_azure + ",Action/Perceive/See")
+        self.assertEqual(series[101], "Event")
+        self.assertTrue(pd.isna(series[102]))
+        self.assertTrue(series.equals(pd.concat([series.iloc[:5]] * 20, ignore_index=True).set_axis(series.index)))
+
+    def test_convert_to_form_jobs(self):
+        df = pd.DataFrame({"column1": ["Azure,See", "Event", "See", "Azure"] * 5, "column2": ["Azure"] * 20})
+        expected_df = df.copy()
+        convert_to_form(expected_df, self.schema, "long_tag")
+        convert_to_form(df, self.schema, "long_tag", jobs=2)
+        pd.testing.assert_frame_equal(df, expected_df)
+
     def test_convert_to_form_short_tags(self):
         df = pd.DataFrame(
             {
@@ -320,6 +348,30 @@ class TestConvertToForm(unittest.TestCase):
         self.assertEqual(len(ambiguous), 0)
         self.assertEqual(len(errors["a1"]), 3)
 
+    def test_repeated_strings(self):
+        # Repeated strings and groups are parsed once, but every occurrence still counts.
+        test_strings = [
+            "(Def-expand/A1/2, (Action/2, Age/5, Item-count/2)), Event",
+            "(Def-expand/A1/3, (Action/3, Age/4, Item-count/3))",
+            "(Def-expand/B2, (Item, Red)), (Def-expand/A1/2, (Action/2, Age/5, Item-count/2))",
+            "(Def-expand/A1/2, (Action/2, Age/5, Item-count/2)), Event",
+            "(Def-expand/B2, (Red, Item))",
+            "(Def-expand/A1/4, (Action/4, Age/5, Item-count/4))",
+            "(Def-expand/B2, (Item, Blue))",
+            "(Def-expand/B2, (Item, Blue))",
+        ]
+        defs, ambiguous, errors = process_def_expands(test_strings, self.schema)
+        self.assertEqual(len(ambiguous), 0)
+        self.assertEqual(len(errors["a1"]), 3)
+        self.assertEqual(len(errors["b2"]), 2)
+        self.assertIn("b2", defs.defs)
+        jobs_defs, jobs_ambiguous, jobs_errors = process_def_expands(test_strings, self.schema, jobs=2)
+        self.assertEqual(list(jobs_defs.defs), list(defs.defs))
+        self.assertEqual(
+            {key: [str(group) for group in value] for key, value in jobs_errors.items()},
+            {key: [str(group) for group in value] for key, value in errors.items()},
+        )
+
     def test_errors(self):
         # Basic recognition of conflicting errors
         test_strings = [
@@ -558,6 +610,12 @@ class TestOnsetDict(unittest.TestCase):
             _indexed_dict_from_onsets([3.5, 3.5, 4.0, 4.4, 4.4, -1.0]), {3.5: [0, 1], 4.0: [2], 4.4: [3, 4], -1.0: [5]}
         )
 
+    def test_drifting_and_missing_onsets(self):
+        # Onsets are compared against the first onset of the run, not the previous line.
+        self.assertEqual(_indexed_dict_from_onsets([1.0, 1.0 + 6e-10, 1.0 + 12e-10]), {1.0: [0, 1], 1.0 + 12e-10: [2]})
+        self.assertEqual(_indexed_dict_from_onsets([1.0, float("nan"), 1.0, 2.0]), {1.0: [0, 2], 2.0: [3]})
+        self.assertEqual(_indexed_dict_from_onsets([1.0, 2.0, 1.0]), {1.0: [0, 2], 2.0: [1]})
+
     def test_empty_and_single_item_series(self):
         self.assertTrue(_filter_by_index_list(pd.Series([], dtype=str), {}).equals(pd.Series([], dtype=str)))
         self.assertTrue(_filter_by_index_list(pd.Series(["apple"]), {0: [0]}).equals(pd.Series(["apple"])))
@@ -683,3 +741,14 @@ class TestSplitDelayTags(unittest.TestCase):
             )
         )
         self.assertTrue(result.original_index.equals(pd.Series([0, 1, 2, 0, 1])))
+
+    def test_dense_delays(self):
+        series = pd.Series(["Tag1,(Delay/0.5 s,(Tag2)),(Delay/1.0 s,(Tag3))"] * 4)
+        onsets = pd.Series([0.0, 1.0, 2.0, 3.0])
+        result = split_delay_tags(series, self.schema, onsets)
+        self.assertEqual(list(result.onset), [0.0, 0.5, 1.0, 1.0, 1.5, 2.0, 2.0, 2.5, 3.0, 3.0, 3.5, 4.0])
+        self.assertEqual(sorted(result.original_index), [0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3])
+        # Lines with the same onset are joined into the first of them.
+        self.assertIn(result.HED[2], ["Tag1,(Delay/1.0 s,(Tag3))", "(Delay/1.0 s,(Tag3)),Tag1"])
+        self.assertEqual(result.HED[3], "")
+        self.assertEqual(result.HED[11], "(Delay/1.0 s,(Tag3))")
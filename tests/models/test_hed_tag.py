@@ -1,6 +1,9 @@
+import pickle
+
 from hed import load_schema_version
 from hed.models.hed_tag import HedTag
 from hed.schema import HedKey
+from hed.schema.term_ids import get_term_id
 from tests.schema import util_create_schemas
 from tests.validator.test_tag_validator_base import TestHedBase
 
@@ -176,3 +179,34 @@ class TestSchemaUtilityFunctions(TestHedBase):
 
         tag5 = HedTag("IntensityTakesValue/300 cd", hed_schema=util_create_schemas.load_schema_intensity())
         self.assertEqual(300, tag5.value_as_default_unit())
+
+    def test_unit_table_matches_unit_classes(self):
+        entry = HedTag("Duration/3 ms", hed_schema=self.hed_schema)._schema_entry
+        unit_strings = set()
+        for unit_class_entry in entry.unit_classes.values():
+            unit_strings.update(unit_class_entry.derivative_units)
+        unit_strings |= {units.upper() for units in unit_strings} | {"Seconds", "MS", "furlong"}
+        for units in unit_strings:
+            _, _, expected = HedTag._get_tag_units_portion("3 " + units, entry.unit_classes)
+            self.assertIs(entry.get_unit_entry(units)[0], expected, units)
+
+        self.assertAlmostEqual(HedTag("Duration/3 Seconds", hed_schema=self.hed_schema).value_as_default_unit(), 3)
+        self.assertAlmostEqual(HedTag("Duration/3 ms", hed_schema=self.hed_schema).value_as_default_unit(), 0.003)
+        self.assertEqual(entry.get_unit_entry("MS"), (None, None))
+
+    def test_tag_term_ids(self):
+        tag = HedTag("Sensory-event", hed_schema=self.hed_schema)
+        self.assertEqual(tag.tag_term_ids, frozenset(get_term_id(term) for term in tag.tag_terms))
+        # The ids are read from the schema entry rather than stored on each tag.
+        self.assertIs(tag.tag_term_ids, tag._schema_entry.tag_term_ids)
+        self.assertNotIn("tag_term_ids", vars(tag))
+
+        copied = pickle.loads(pickle.dumps(tag))
+        self.assertEqual(copied.tag_term_ids, tag.tag_term_ids)
+
+        tag.tag_terms = ("event", "not-a-schema-term-xyz")
+        self.assertEqual(tag.tag_term_ids, frozenset([get_term_id("event")]))
+        self.assertIsNone(get_term_id("not-a-schema-term-xyz"))
+        tag.tag_terms = ()
+        self.assertEqual(tag.tag_term_ids, frozenset())
+        self.assertEqual(HedTag("Not-a-schema-tag-xyz", hed_schema=self.hed_schema).tag_term_ids, frozenset())
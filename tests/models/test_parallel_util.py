@@ -0,0 +1,22 @@
+import unittest
+
+from hed.models.parallel_util import map_chunks, map_items
+
+
+class Test(unittest.TestCase):
+    def test_map_chunks(self):
+        self.assertEqual(map_chunks(sum, range(5)), [10])
+        self.assertEqual(map_chunks(sum, []), [0])
+        results = map_chunks(sum, range(100), jobs=2)
+        self.assertEqual(len(results), 8)
+        self.assertEqual(sum(results), 4950)
+
+    def test_map_items(self):
+        items = list(range(-50, 50))
+        self.assertEqual(map_items(abs, items), [abs(item) for item in items])
+        self.assertEqual(map_items(abs, items, jobs=3), [abs(item) for item in items])
+        self.assertEqual(map_items(abs, [], jobs=0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,13 @@
 import os
+import pickle
 import unittest
+from unittest import mock
 
 from hed import HedTag, schema
 from hed.errors.exceptions import HedQueryError
 from hed.models.hed_string import HedString
-from hed.models.query_handler import QueryHandler
+from hed.models.query_handler import QueryHandler, compile_query
+from hed.schema.term_ids import get_term_count, get_term_id
 
 
 # Override the tag terms function for testing purposes when we don't have a schema
@@ -37,6 +40,8 @@ class TestParser(unittest.TestCase):
             # if result2:
             #    print(f"\t\tFound as group(s) {str([str(r) for r in result2])}")
             self.assertEqual(bool(result2), expected_result)
+            # The existence-only evaluation must agree with the full search.
+            self.assertEqual(expression.has_match(hed_string), expected_result)
 
     def test_broken_search_strings(self):
         test_search_strings = ["A &&", "(A && B", "&& B", "A, ", ", A", "A)"]
@@ -874,3 +879,80 @@ class TestParser(unittest.TestCase):
             len(or_results),
             "Event || Event should match the same number of groups as Event alone",
         )
+
+    # --- Compiled query plans ---
+
+    def test_compiled_plan_is_shared(self):
+        handler1 = QueryHandler("Event && Action")
+        handler2 = QueryHandler("Event && Action")
+        self.assertIs(handler1.plan, handler2.plan)
+        self.assertIs(handler1.tree, compile_query("Event && Action").tree)
+        self.assertIsNot(handler1.plan, QueryHandler("Event || Action").plan)
+
+    def test_plan_pickles_as_expression(self):
+        handler = QueryHandler("{Event, Action: Agent}")
+        restored = pickle.loads(pickle.dumps(handler))
+        self.assertIsInstance(restored, QueryHandler)
+        self.assertIs(restored.plan, handler.plan)
+        self.assertIs(pickle.loads(pickle.dumps(handler.plan)), handler.plan)
+
+    def test_plan_metadata(self):
+        plan = compile_query("Event && [Action || (Action && Agent)] && ~Item && {Animal: Vehicle}")
+        self.assertEqual(plan.required_terms, frozenset({"event", "action", "animal"}))
+        self.assertTrue(plan.uses_negation)
+        self.assertTrue(plan.uses_exact_groups)
+        self.assertFalse(plan.uses_wildcards)
+        plan = compile_query("@Event || Eve* || {Action, ??}")
+        self.assertEqual(plan.required_terms, frozenset())
+        self.assertTrue(plan.uses_wildcards)
+        self.assertTrue(plan.uses_negation)
+        self.assertEqual(compile_query('"Event" && Def/Def1').required_terms, frozenset())
+
+    def test_missing_required_term_short_circuits(self):
+        handler = QueryHandler("Event && (Action, Agent)")
+        self.assertFalse(handler.plan.may_match(HedString("Event, (Action, Item)", self.hed_schema)))
+        self.assertFalse(handler.search(HedString("Event, (Action, Item)", self.hed_schema)))
+        self.assertTrue(handler.plan.may_match(HedString("Agent, (Action, Event)", self.hed_schema)))
+        self.assertTrue(handler.search(HedString("Event, Action, Agent", self.hed_schema)))
+
+    def test_and_with_repeated_tags(self):
+        hed_string = HedString("(Event, Action), (Event, Event, Action), Event", self.hed_schema)
+        handler = QueryHandler("Event && Action")
+        results = handler.search(hed_string)
+        self.assertTrue(handler.has_match(hed_string))
+        self.assertEqual(len(results), len(set(results)))
+        # Results keep the order of the left operand, and each Event pairs with the Action in its group.
+        self.assertEqual(str(results[0].group), "(Event,Action)")
+        inner_results = [result for result in results if str(result.group) == "(Event,Event,Action)"]
+        self.assertEqual(len(inner_results), 2)
+        self.assertFalse(QueryHandler("Event && Event && Event && Action").has_match(hed_string))
+        self.assertTrue(QueryHandler("Event && Event && Action").has_match(hed_string))
+
+    def test_has_match_builds_no_search_results(self):
+        hed_string = HedString("(Event, Action), (Event, (Item, Action)), Agent", self.hed_schema)
+        queries = {
+            "Event && Action": True,
+            "Event && Event && Action": False,
+            "(Event && Item) || Square": True,
+            "~(Event && Agent)": True,
+            "[Item && Action]": True,
+            "{Event && Action}": True,
+            "{Event: Action}": True,
+            "[[Event && Square]]": False,
+        }
+        handlers = {query: QueryHandler(query) for query in queries}
+        with mock.patch("hed.models.query_expressions.SearchResult", side_effect=AssertionError("SearchResult built")):
+            for query, expected in queries.items():
+                self.assertEqual(handlers[query].has_match(hed_string), expected, query)
+        for query, expected in queries.items():
+            self.assertEqual(bool(handlers[query].search(hed_string)), expected, query)
+
+    def test_query_terms_not_registered(self):
+        term_count = get_term_count()
+        handlers = [QueryHandler(f"Event && Unknown-term-{i} && {{Item-{i}: Action}}") for i in range(50)]
+        hed_string = HedString("(Event, Unknown-term-3), Item-3", self.hed_schema)
+        for handler in handlers:
+            self.assertFalse(handler.search(hed_string))
+            self.assertFalse(handler.has_match(hed_string))
+        self.assertEqual(get_term_count(), term_count)
+        self.assertIsNone(get_term_id("unknown-term-3"))
@@ -4,14 +4,23 @@ Tests cover:
 - generate_schema_lookup builds a valid dict from a real schema
 - save_schema_lookup / load_schema_lookup round-trip
 - Both individual HedSchema and HedSchemaGroup inputs are handled
+- Compact lookups round-trip and are stored and found by schema version
 """
 
 import json
 import os
+import shutil
 import tempfile
 import unittest
 
-from hed.models.schema_lookup import generate_schema_lookup, load_schema_lookup, save_schema_lookup
+from hed.models.schema_lookup import (
+    generate_schema_lookup,
+    get_schema_lookup,
+    load_compact_schema_lookup,
+    load_schema_lookup,
+    save_compact_schema_lookup,
+    save_schema_lookup,
+)
 
 
 class TestSchemaLookupBase(unittest.TestCase):
@@ -189,6 +198,50 @@ class TestSchemaLookupRoundTrip(TestSchemaLookupBase):
             os.unlink(tmp_path)
 
 
+class TestCompactSchemaLookup(TestSchemaLookupBase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        self._require_schema()
+        path = os.path.join(self.temp_dir, "lookup.json.gz")
+        save_compact_schema_lookup(self.lookup, path, version="8.0.0")
+        loaded = load_compact_schema_lookup(path)
+        self.assertEqual(loaded, self.lookup)
+        self.assertEqual(list(loaded), list(self.lookup))
+        # Each term is held once, so the same term in different paths is the same object.
+        self.assertIs(loaded["sensory-event"][0], loaded["event"][0])
+
+    def test_empty_and_bad_files(self):
+        path = os.path.join(self.temp_dir, "lookup.json.gz")
+        save_compact_schema_lookup({}, path)
+        self.assertEqual(load_compact_schema_lookup(path), {})
+        save_schema_lookup({"event": ("event",)}, path)
+        with self.assertRaises(OSError):
+            load_compact_schema_lookup(path)
+
+    def test_get_schema_lookup(self):
+        lookup = get_schema_lookup("8.2.0", xml_folder=self.temp_dir)
+        lookup_path = os.path.join(self.temp_dir, "schema_lookups", "HED8.2.0_lookup.json.gz")
+        self.assertTrue(os.path.exists(lookup_path))
+        self.assertEqual(lookup["sensory-event"], ("event", "sensory-event"))
+        self.assertEqual(get_schema_lookup("8.2.0", xml_folder=self.temp_dir), lookup)
+
+        # A damaged file is regenerated.
+        with open(lookup_path, "wb") as fp:
+            fp.write(b"damaged")
+        self.assertEqual(get_schema_lookup("8.2.0", xml_folder=self.temp_dir), lookup)
+
+    def test_get_schema_lookup_invalid_version(self):
+        with self.assertRaises(ValueError):
+            get_schema_lookup("sc:8.2.0", xml_folder=self.temp_dir)
+        with self.assertRaises(ValueError):
+            get_schema_lookup("8.2.0,score_1.1.0", xml_folder=self.temp_dir)
+
+
 class TestGenerateSchemaLookupGroup(unittest.TestCase):
     """Verify that generate_schema_lookup works correctly with HedSchemaGroup."""
 
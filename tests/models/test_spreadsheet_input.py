@@ -244,6 +244,22 @@ class Test(unittest.TestCase):
         )
         self.assertTrue(excel_book.dataframe.equals(reloaded_df.dataframe))
 
+    def test_excel_workbook_loaded_lazily(self):
+        excel_book = SpreadsheetInput(self.default_test_file_name, worksheet_name="PVT Events")
+        self.assertIsNone(excel_book._loaded_workbook)
+        self.assertEqual(excel_book.get_worksheet("PVT Events").title, "PVT Events")
+        self.assertEqual(len(excel_book.loaded_workbook.worksheets), 5)
+
+        with open(self.default_test_file_name, "rb") as fp:
+            file_book = SpreadsheetInput(fp, file_type=".xlsx", worksheet_name="PVT Events")
+        self.assertTrue(file_book.dataframe.equals(excel_book.dataframe))
+        self.assertEqual(file_book.get_worksheet().title, "LKT 8HED3")
+
+    def test_excel_trailing_empty_rows(self):
+        bad_dimensions = os.path.join(self.base_data_dir, "validator_tests/hed3_tags_single_sheet_bad_defs.xlsx")
+        self.assertEqual(SpreadsheetInput(bad_dimensions).dataframe.shape, (3, 4))
+        self.assertEqual(SpreadsheetInput(bad_dimensions, has_column_names=False).dataframe.shape, (4, 4))
+
 
 if __name__ == "__main__":
     unittest.main()
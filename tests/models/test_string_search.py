@@ -14,12 +14,20 @@ schema lookup table from a real schema file.
 
 import os
 import unittest
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
 from hed.errors.exceptions import HedQueryError
 from hed.models.schema_lookup import generate_schema_lookup
-from hed.models.string_search import StringNode, StringQueryHandler, parse_hed_string, string_search
+from hed.models.string_search import (
+    StringNode,
+    StringQueryHandler,
+    parse_hed_string,
+    search_series,
+    string_search,
+)
 
 # ---------------------------------------------------------------------------
 # Helper: mirror the base_test pattern from test_query_handler.py
@@ -81,6 +89,14 @@ class TestStringSearchBasicTags(StringSearchBase):
         self.base_test("a", test_strings)
         self.base_test("A", test_strings)
 
+    def test_bare_term_not_registered(self):
+        # Terms that are not schema terms have no id, so they are matched as text.
+        root = parse_hed_string("(Unregistered-term-xyz, B)")
+        self.assertFalse(StringQueryHandler("b && other-term-xyz").tree.has_match(root))
+        handler = StringQueryHandler("b && unregistered-term-xyz")
+        self.assertTrue(handler.plan.may_match(root))
+        self.assertTrue(handler.tree.handle_expr(root))
+
     def test_and_two_tags(self):
         test_strings = {"A": False, "B": False, "C": False, "A, B": True, "A, C": False, "B, C": False}
         self.base_test("a && b", test_strings)
@@ -1121,6 +1137,31 @@ class TestStringSearch(unittest.TestCase):
         self.assertTrue(mask[0])
         self.assertFalse(mask[1])
 
+    def test_search_series_mask(self):
+        data = pd.Series(["A, B", None, "A, B", "", "(A, B)", pd.NA, "C"] * 3, index=range(10, 31))
+        mask = search_series(data, "A && B")
+        self.assertIsInstance(mask, np.ndarray)
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(mask.tolist(), [True, False, True, False, True, False, False] * 3)
+        self.assertEqual(len(data[mask]), 9)
+
+    def test_search_series_evaluates_unique_strings_once(self):
+        handler = StringQueryHandler("A")
+        data = pd.Series(["A, B"] * 500 + ["C"] * 500)
+        with patch.object(
+            StringQueryHandler, "has_match", autospec=True, side_effect=StringQueryHandler.has_match
+        ) as mock:
+            mask = search_series(data, handler)
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(int(mask.sum()), 500)
+
+    def test_search_series_matches_row_by_row(self):
+        lookup = {"sensory-event": ("event", "sensory-event")}
+        data = ["Sensory-event, (Red, Blue)", "Action", float("nan"), "Sensory-event", "(Event, Red)", 3]
+        handler = StringQueryHandler("Event && {Red}")
+        expected = [bool(handler.search(s, schema_lookup=lookup)) if isinstance(s, str) else False for s in data]
+        self.assertEqual(handler.search_series(data, schema_lookup=lookup).tolist(), expected)
+
 
 # ---------------------------------------------------------------------------
 # Performance / benchmark utilities
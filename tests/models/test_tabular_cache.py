@@ -0,0 +1,153 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from hed import schema
+from hed.models import Sidecar, TabularInput, tabular_cache
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        bids_root_path = os.path.realpath(
+            os.path.join(os.path.dirname(os.path.realpath(__file__)), "../data/bids_tests/eeg_ds003645s_hed")
+        )
+        cls.events_path = os.path.join(bids_root_path, "sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv")
+        cls.sidecar1 = Sidecar(os.path.join(bids_root_path, "task-FacePerception_events.json"))
+        cls.sidecar2 = Sidecar(
+            os.path.realpath(
+                os.path.join(
+                    os.path.dirname(os.path.realpath(__file__)),
+                    "../data/other_tests/task-FacePerceptionSmall_events.json",
+                )
+            )
+        )
+        cls.hed_schema = schema.load_schema(
+            os.path.realpath(
+                os.path.join(os.path.dirname(os.path.realpath(__file__)), "../data/schema_tests/HED8.2.0.xml")
+            )
+        )
+
+    def setUp(self):
+        self.cache_folder = tempfile.mkdtemp()
+        tabular_cache.enable_tabular_cache(self.cache_folder)
+
+    def tearDown(self):
+        tabular_cache.disable_tabular_cache()
+        shutil.rmtree(self.cache_folder, ignore_errors=True)
+
+    @staticmethod
+    def _load_uncached(file, sidecar=None):
+        folder = tabular_cache.get_tabular_cache_folder()
+        tabular_cache.disable_tabular_cache()
+        try:
+            return TabularInput(file, sidecar=sidecar)
+        finally:
+            tabular_cache.enable_tabular_cache(folder)
+
+    def test_enable_disable(self):
+        self.assertEqual(tabular_cache.get_tabular_cache_folder(), self.cache_folder)
+        tabular_cache.disable_tabular_cache()
+        self.assertIsNone(tabular_cache.get_tabular_cache_folder())
+        self.assertFalse(TabularInput(self.events_path, sidecar=self.sidecar1).series_a.empty)
+        self.assertFalse(os.listdir(self.cache_folder))
+
+    def test_reload_from_cache(self):
+        expected = self._load_uncached(self.events_path, self.sidecar1)
+        first = TabularInput(self.events_path, sidecar=self.sidecar1)
+        self.assertTrue(first.series_a.equals(expected.series_a))
+        with (
+            mock.patch("hed.models.base_input.pd.read_csv", side_effect=AssertionError("read_csv called")),
+            mock.patch.object(TabularInput, "assemble", side_effect=AssertionError("assemble called")),
+        ):
+            second = TabularInput(self.events_path, sidecar=self.sidecar1)
+            series = second.series_a
+        self.assertTrue(second.dataframe.equals(expected.dataframe))
+        self.assertTrue(series.equals(expected.series_a))
+        self.assertEqual(second.name, self.events_path)
+
+    def test_sidecar_changes(self):
+        self.assertFalse(TabularInput(self.events_path, sidecar=self.sidecar1).series_a.empty)
+        series = TabularInput(self.events_path, sidecar=self.sidecar2).series_a
+        self.assertTrue(series.equals(self._load_uncached(self.events_path, self.sidecar2).series_a))
+        series = TabularInput(self.events_path).series_a
+        self.assertTrue(series.equals(self._load_uncached(self.events_path).series_a))
+
+    def test_assembly_changes(self):
+        expected = TabularInput(self.events_path, sidecar=self.sidecar1).series_a
+        sidecar_key = tabular_cache.get_sidecar_key(self.sidecar1)
+        for patcher in (
+            mock.patch.object(tabular_cache, "ASSEMBLY_FORMAT", tabular_cache.ASSEMBLY_FORMAT + 1),
+            mock.patch("hed.__version__", "0.0.0"),
+        ):
+            with (
+                patcher,
+                mock.patch.object(
+                    TabularInput, "assemble", autospec=True, side_effect=TabularInput.assemble
+                ) as assemble,
+            ):
+                self.assertNotEqual(tabular_cache.get_sidecar_key(self.sidecar1), sidecar_key)
+                self.assertTrue(TabularInput(self.events_path, sidecar=self.sidecar1).series_a.equals(expected))
+                assemble.assert_called_once()
+
+    def test_file_changes(self):
+        events_path = os.path.join(self.cache_folder, "events.tsv")
+        shutil.copyfile(self.events_path, events_path)
+        first = TabularInput(events_path, sidecar=self.sidecar1)
+        with open(events_path, "a") as fp:
+            fp.write("\t".join(["1000.0"] + ["n/a"] * (len(first.columns) - 1)) + "\n")
+        second = TabularInput(events_path, sidecar=self.sidecar1)
+        self.assertEqual(len(second.dataframe), len(first.dataframe) + 1)
+        self.assertEqual(len(second.series_a), len(second.dataframe))
+
+    def test_modified_input_not_cached(self):
+        self.assertFalse(TabularInput(self.events_path, sidecar=self.sidecar1).series_a.empty)
+        input_data = TabularInput(self.events_path, sidecar=self.sidecar1)
+        input_data.convert_to_long(self.hed_schema)
+        expected = self._load_uncached(self.events_path, self.sidecar1)
+        expected.convert_to_long(self.hed_schema)
+        self.assertTrue(input_data.series_a.equals(expected.series_a))
+        self.assertTrue(
+            TabularInput(self.events_path, sidecar=self.sidecar1).series_a.equals(
+                self._load_uncached(self.events_path, self.sidecar1).series_a
+            )
+        )
+
+    def test_sorted_copy_not_cached(self):
+        events_path = os.path.join(self.cache_folder, "events.tsv")
+        with open(events_path, "w") as fp:
+            fp.write("onset\tduration\tHED\n2.0\tn/a\tSensory-event\n1.0\tn/a\tAgent-action\n3.0\tn/a\tRed\n")
+        TabularInput(events_path).validate(self.hed_schema)
+        expected = self._load_uncached(events_path)
+        input_data = TabularInput(events_path)
+        self.assertEqual(input_data.series_a.tolist(), ["Sensory-event", "Agent-action", "Red"])
+        self.assertTrue(input_data.series_a.equals(expected.series_a))
+
+    def test_edited_input_not_cached(self):
+        expected = self._load_uncached(self.events_path, self.sidecar1)
+        self.assertTrue(TabularInput(self.events_path, sidecar=self.sidecar1).series_a.equals(expected.series_a))
+        input_data = TabularInput(self.events_path, sidecar=self.sidecar1)
+        kept = input_data.dataframe
+        kept.loc[0, "event_type"] = "show_face"
+        expected.dataframe.loc[0, "event_type"] = "show_face"
+        self.assertTrue(input_data.series_a.equals(expected.series_a))
+        self.assertTrue(
+            TabularInput(self.events_path, sidecar=self.sidecar1).series_a.equals(
+                self._load_uncached(self.events_path, self.sidecar1).series_a
+            )
+        )
+
+    def test_damaged_entry(self):
+        self.assertFalse(TabularInput(self.events_path, sidecar=self.sidecar1).series_a.empty)
+        file_key = tabular_cache.get_file_key(self.events_path)
+        entry_path = os.path.join(self.cache_folder, file_key[:2], file_key, "data")
+        os.remove(os.path.join(entry_path, "codes_0.npy"))
+        self.assertIsNone(tabular_cache.load_dataframe(file_key))
+        input_data = TabularInput(self.events_path, sidecar=self.sidecar1)
+        self.assertTrue(input_data.dataframe.equals(self._load_uncached(self.events_path).dataframe))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+from hed.schema import reserved_tags
+from hed.schema.hed_schema_constants import TagFlags
 from hed.schema.hed_schema_entry import HedTagEntry
 
 
@@ -45,3 +47,42 @@ class TestMockEntry(unittest.TestCase):
     def test_check_inherited_attribute_numeric(self):
         # Test numeric attribute present only in the current entry
         self.assertEqual(self.child_entry2._check_inherited_attribute("number", return_value=True), 5)
+
+
+class TestTagFlags(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from hed.schema import load_schema_version
+
+        cls.schema = load_schema_version("8.3.0")
+
+    def test_flags_match_attributes(self):
+        from hed.schema.hed_schema_constants import HedKey
+
+        for entry in self.schema.tags.values():
+            self.assertEqual(
+                bool(entry.tag_flags & TagFlags.TagGroup), entry.base_tag_has_attribute(HedKey.TagGroup), entry.name
+            )
+            self.assertEqual(
+                bool(entry.tag_flags & TagFlags.TopLevelTagGroup),
+                entry.base_tag_has_attribute(HedKey.TopLevelTagGroup),
+                entry.name,
+            )
+
+    def test_reserved_flags(self):
+        onset = self.schema.tags["Onset"]
+        self.assertTrue(onset.tag_flags & TagFlags.Reserved)
+        self.assertTrue(onset.tag_flags & TagFlags.RequiresDef)
+        self.assertTrue(onset.tag_flags & TagFlags.RequiresTimeline)
+        duration_value = self.schema.tags["Duration/#"]
+        self.assertTrue(duration_value.tag_flags & TagFlags.Reserved)
+        self.assertFalse(duration_value.tag_flags & TagFlags.RequiresTimeline)
+        self.assertTrue(self.schema.tags["Definition"].tag_flags & TagFlags.NoSpliceInGroup)
+        self.assertEqual(self.schema.tags["Red"].tag_flags, 0)
+
+    def test_reserved_tags_shared_with_checker(self):
+        from hed.validator.reserved_checker import ReservedChecker
+
+        reserved_map = reserved_tags.get_reserved_map()
+        self.assertIs(ReservedChecker.get_instance().reserved_map, reserved_map)
+        self.assertEqual(set(reserved_tags.get_reserved_flags()), {value["name"] for value in reserved_map.values()})
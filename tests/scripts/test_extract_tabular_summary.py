@@ -454,6 +454,15 @@ class TestExtractTabularSummary(unittest.TestCase):
             total_events = summary_dict["Total events"]
             self.assertGreater(total_events, 0)
 
+    def test_parallel_jobs_match_serial(self):
+        """Test that summarizing with several worker processes gives the same output."""
+        outputs = []
+        for jobs in ["1", "2"]:
+            with patch("sys.stdout", new=io.StringIO()) as mock_stdout:
+                self.assertEqual(main([self.data_root, "-s", "events", "-j", jobs]), 0)
+            outputs.append(json.loads(mock_stdout.getvalue()))
+        self.assertEqual(outputs[0], outputs[1])
+
     def test_categorical_limit_zero(self):
         """Test edge case of categorical limit of 0."""
         arg_list = [self.data_root, "-s", "events", "-cl", "0"]
@@ -1,4 +1,5 @@
 import io
+import json
 import os
 import unittest
 from unittest.mock import patch
@@ -45,6 +46,26 @@ class Test(unittest.TestCase):
             x = main(arg_list)
             self.assertTrue(x)
 
+    def test_main_jsonl_streams_issues(self):
+        arg_list = [self.data_root, "-x", "derivatives", "stimuli", "-w", "-p", "-s", "-f", "jsonl", "--no-log"]
+        with patch("sys.stdout", new=io.StringIO()) as stdout, patch("sys.stderr", new=io.StringIO()) as stderr:
+            x = main(arg_list)
+        self.assertTrue(x)
+        # Every line of the standard output is a JSON issue, and the report goes to the standard error.
+        issues = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertTrue(issues)
+        self.assertTrue(all("code" in issue and "ec_filename" in issue for issue in issues))
+        self.assertIn(f"Found {len(issues)} issues.", stderr.getvalue())
+
+    def test_main_max_issues(self):
+        arg_list = [self.data_root, "-x", "derivatives", "stimuli", "-w", "-s", "-mi", "1", "-f", "jsonl", "-p"]
+        with patch("sys.stdout", new=io.StringIO()) as stdout, patch("sys.stderr", new=io.StringIO()) as stderr:
+            x = main(arg_list + ["--no-log"])
+        self.assertTrue(x)
+        issues = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(issues), 1)
+        self.assertIn("Found 1 issues.", stderr.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
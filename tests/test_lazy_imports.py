@@ -0,0 +1,59 @@
+"""Guards for the lazy (PEP 562) top-level imports.
+
+Each check runs in a fresh interpreter so modules imported by other tests do not leak in.
+"""
+
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = ("pandas", "openpyxl", "inflect", "defusedxml")
+
+
+def _loaded_modules(code):
+    """Run *code* in a fresh interpreter and return which of HEAVY_MODULES it loaded."""
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return set(filter(None, result.stdout.rstrip("\n").split("\n")[-1].split(",")))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_hed_is_light(self):
+        self.assertEqual(_loaded_modules("import hed"), set())
+
+    def test_import_cli_is_light(self):
+        self.assertEqual(_loaded_modules("import hed.cli.cli"), set())
+
+    def test_hed_string_does_not_need_dataframes(self):
+        self.assertEqual(_loaded_modules("from hed import HedString, HedTag, HedGroup"), set())
+
+    def test_validate_string_does_not_import_openpyxl(self):
+        code = (
+            "from click.testing import CliRunner\n"
+            "from hed.cli.cli import cli\n"
+            "result = CliRunner().invoke(cli, ['validate', 'string', 'Sensory-event', '-sv', '8.3.0'])\n"
+            "assert result.exit_code == 0, result.output\n"
+        )
+        self.assertNotIn("openpyxl", _loaded_modules(code))
+
+    def test_public_names_resolve(self):
+        import hed
+        import hed.models
+        import hed.tools
+
+        for package in (hed, hed.models, hed.tools):
+            for name in package.__all__:
+                with self.subTest(package=package.__name__, name=name):
+                    self.assertIsNotNone(getattr(package, name))
+                    self.assertIn(name, dir(package))
+
+    def test_submodule_attribute_fallback(self):
+        import hed
+
+        self.assertTrue(callable(hed.models.df_util.convert_to_form))
+        with self.assertRaises(AttributeError):
+            hed.models.not_a_real_name  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,15 @@
+import functools
 import os
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from hed import schema as hedschema
 from hed.models import HedString, Sidecar, TabularInput
 from hed.models.df_util import expand_defs
 from hed.tools.analysis.hed_tag_counts import HedTagCounts
+from hed.tools.analysis.hed_tag_table import HedTagTable
 
 
 # noinspection PyBroadException
@@ -86,6 +89,46 @@ class Test(unittest.TestCase):
         self.assertEqual(14, len(counts3.tag_dict))
         self.assertEqual(2, counts3.tag_dict["experiment-structure"].events)
 
+    def test_update_from_table(self):
+        def_dict = self.input_data.get_def_dict(self.hed_schema)
+        expected = HedTagCounts("run-1")
+        for hed in self.input_data.series_a:
+            hed_obj = HedString(hed, self.hed_schema, def_dict=def_dict)
+            expected.update_tag_counts(hed_obj.expand_defs(), "run-1")
+
+        counts = HedTagCounts("run-1")
+        counts.update_from_table(HedTagTable.from_tabular(self.input_data, self.hed_schema), "run-1")
+
+        codes, uniques = pd.factorize(self.input_data.series_a)
+        unique_objs = [HedString(hed, self.hed_schema, def_dict=def_dict).expand_defs() for hed in uniques]
+        weighted = HedTagCounts("run-1")
+        weighted.update_from_table(HedTagTable(unique_objs), "run-1", weights=np.bincount(codes))
+
+        for result in (counts, weighted):
+            self.assertEqual(set(result.tag_dict), set(expected.tag_dict))
+            for tag, tag_count in expected.tag_dict.items():
+                self.assertEqual(result.tag_dict[tag].tag, tag_count.tag)
+                self.assertEqual(result.tag_dict[tag].events, tag_count.events)
+                self.assertEqual(result.tag_dict[tag].value_dict, tag_count.value_dict)
+        self.assertEqual(counts.tag_dict["condition-variable"].value_dict["Face-type"], 52)
+
+    def test_merge(self):
+        tag_table = HedTagTable.from_tabular(self.input_data, self.hed_schema)
+        file_counts = []
+        for name in ("run-1", "run-2", "run-3"):
+            counts = HedTagCounts(name, tag_table.n_rows)
+            counts.update_from_table(tag_table, name)
+            file_counts.append(counts)
+        left = HedTagCounts("All").merge(file_counts[0]).merge(file_counts[1]).merge(file_counts[2])
+        right = HedTagCounts("All").merge(file_counts[0])
+        right.merge(HedTagCounts("Rest").merge(file_counts[1]).merge(file_counts[2]))
+        self.assertEqual(left.get_summary(), right.get_summary())
+        self.assertEqual(left.total_events, 3 * tag_table.n_rows)
+        self.assertEqual(left.get_summary()["files"], ["run-1", "run-2", "run-3"])
+        self.assertEqual(left.tag_dict["condition-variable"].value_dict["Face-type"], 3 * 52)
+        reduced = functools.reduce(HedTagCounts.merge, file_counts, HedTagCounts("All"))
+        self.assertEqual(reduced.get_summary(), left.get_summary())
+
     def test_hed_tag_count(self):
         name = "Base_name1"
         counts1 = HedTagCounts(name, 0)
@@ -0,0 +1,94 @@
+import os
+import unittest
+
+import numpy as np
+
+from hed import schema as hedschema
+from hed.models import HedString, Sidecar, TabularInput
+from hed.models.query_handler import QueryHandler
+from hed.tools.analysis.hed_tag_counts import HedTagCounts
+from hed.tools.analysis.hed_tag_table import HedTagTable
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        bids_root_path = os.path.realpath(
+            os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../data/bids_tests/eeg_ds003645s_hed")
+        )
+        schema_path = os.path.realpath(
+            os.path.join(os.path.dirname(os.path.realpath(__file__)), "../../data/schema_tests/HED8.2.0.xml")
+        )
+        json_path = os.path.realpath(os.path.join(bids_root_path, "task-FacePerception_events.json"))
+        events_path = os.path.realpath(
+            os.path.join(bids_root_path, "sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv")
+        )
+        cls.hed_schema = hedschema.load_schema(schema_path)
+        cls.input_data = TabularInput(events_path, sidecar=Sidecar(json_path), name="face_sub1_events")
+        def_dict = cls.input_data.get_def_dict(cls.hed_schema)
+        cls.hed_objs = []
+        for hed_str in cls.input_data.series_a:
+            hed_obj = HedString(hed_str, cls.hed_schema, def_dict=def_dict) if hed_str else None
+            if hed_obj:
+                hed_obj.expand_defs()
+            cls.hed_objs.append(hed_obj)
+        cls.tag_table = HedTagTable.from_tabular(cls.input_data, cls.hed_schema)
+
+    def test_constructor(self):
+        tag_table = HedTagTable(
+            [None, HedString("Red, (Blue, (Green, Duration/3 ms)), Label/Apple", self.hed_schema)], name="test"
+        )
+        self.assertEqual(tag_table.n_rows, 2)
+        self.assertEqual(tag_table.name, "test")
+        table = tag_table.table
+        self.assertEqual(list(table.columns), HedTagTable.COLUMNS)
+        self.assertEqual(list(table["row"]), [1, 1, 1, 1, 1])
+        self.assertEqual(list(table["tag"]), ["red", "blue", "green", "duration", "label"])
+        self.assertEqual(list(table["group"]), [0, 1, 2, 2, 0])
+        self.assertEqual(list(table["parent"]), [-1, 0, 1, 1, -1])
+        self.assertEqual(list(table["depth"]), [0, 1, 2, 2, 0])
+        self.assertEqual(tag_table.entries[table["entry"][3]].short_tag_name, "Duration")
+        self.assertAlmostEqual(table["value"][3], 0.003)
+        self.assertTrue(np.isnan(table["value"][4]))
+        self.assertEqual(table["extension"][4], "Apple")
+
+        empty = HedTagTable([])
+        self.assertEqual(len(empty.table), 0)
+        self.assertTrue(empty.tag_counts().empty)
+
+    def test_from_tabular(self):
+        self.assertEqual(self.tag_table.n_rows, len(self.hed_objs))
+        self.assertEqual(self.tag_table.name, "face_sub1_events")
+        for row in (0, 1, 100):
+            tags = self.tag_table.table.loc[self.tag_table.table["row"] == row, "tag"]
+            self.assertEqual(list(tags), [tag.short_base_tag.casefold() for tag in self.hed_objs[row].get_all_tags()])
+
+    def test_tag_counts(self):
+        tag_counts = HedTagCounts("face_sub1_events")
+        for hed_obj in self.hed_objs:
+            tag_counts.update_tag_counts(hed_obj, "file1")
+        counts = self.tag_table.tag_counts()
+        self.assertEqual(set(counts.index), set(tag_counts.tag_dict))
+        for tag, tag_count in tag_counts.tag_dict.items():
+            self.assertEqual(counts.loc[tag, "events"], tag_count.events, tag)
+        self.assertTrue((counts["occurrences"] >= counts["events"]).all())
+
+    def test_rows_with_tag(self):
+        for term in ["Event", "Sensory-event", "Face", "Agent-action", "Condition-variable"]:
+            query = QueryHandler(term)
+            expected = [bool(hed_obj and query.search(hed_obj)) for hed_obj in self.hed_objs]
+            self.assertEqual(list(self.tag_table.rows_with_tag(term)), expected, term)
+        self.assertFalse(self.tag_table.rows_with_tag("Event", include_descendants=False).any())
+        self.assertTrue(self.tag_table.rows_with_tag("sensory-event", include_descendants=False).any())
+
+    def test_value_counts_and_indicators(self):
+        value_counts = self.tag_table.value_counts("Condition-variable")
+        self.assertEqual(value_counts["Face-type"], 52)
+        indicators = self.tag_table.get_value_indicators("Condition-variable")
+        self.assertEqual(len(indicators), self.tag_table.n_rows)
+        self.assertEqual(set(indicators.columns), set(value_counts.index))
+        self.assertEqual(indicators.sum().to_dict(), value_counts.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -297,7 +297,7 @@ class Test(unittest.TestCase):
 
         This test forces map_dict to contain keys of opposite sign with extreme magnitude
         (one near max int64, one near min int64) to exercise this overflow scenario
-        deterministically via patching get_row_hash, rather than relying on Python's
+        deterministically via patching get_key_hash, rather than relying on Python's
         randomized string hashing.
         """
         key_map = KeyMap(["key"], ["value"])
@@ -307,18 +307,18 @@ class Test(unittest.TestCase):
         problem_keys = [9223372036854775800, -9223372036854775800]  # Close to ±max_int64
         hash_lookup = {"6": problem_keys[0], "2": problem_keys[1]}
 
-        def fake_get_row_hash(row, key_list):
-            value = str(row[key_list[0]])
+        def fake_get_key_hash(key_tuple):
+            value = str(key_tuple[0])
             if value in hash_lookup:
                 return hash_lookup[value]
             # Return a fixed sentinel value guaranteed not to collide with problem_keys.
             # Uses a large positive integer clearly outside the range of the extreme keys.
             return 999999999999
 
-        # Patch get_row_hash so that both map-building (update) and lookup (remap) agree on
+        # Patch get_key_hash so that both map-building (update) and lookup (remap) agree on
         # using the pathological hash pair for "6"/"2" - relying on real hash() values would
         # only trigger the bug by chance, since Python's string hashing is randomized per run.
-        with patch("hed.tools.util.data_util.get_row_hash", side_effect=fake_get_row_hash):
+        with patch("hed.tools.util.data_util.get_key_hash", side_effect=fake_get_key_hash):
             map_df = pd.DataFrame({"key": ["6", "2"], "value": ["six", "two"]})
             key_map.update(map_df)
 
@@ -331,6 +331,24 @@ class Test(unittest.TestCase):
         self.assertEqual(df_result.iloc[2]["value"], "n/a")
         self.assertEqual(missing, [2], "remap should report the unmapped row")
 
+    def test_update_counts_repeated_keys(self):
+        key_map = KeyMap(["a", "b"], ["c"])
+        df1 = pd.DataFrame({"a": ["x", "y", "x", "x", None], "b": [1, 2, 1, 3, 1], "c": ["p", "q", "r", "s", "t"]})
+        key_map.update(df1)
+        self.assertEqual(len(key_map.col_map), 4)
+        self.assertEqual(list(key_map.col_map["c"]), ["p", "q", "s", "t"], "First row of each key is kept")
+        df2 = pd.DataFrame({"a": ["y", "z", "z"], "b": [2, 2, 2], "c": ["u", "v", "w"]})
+        key_map.update(df2)
+        self.assertEqual(list(key_map.col_map["c"]), ["p", "q", "s", "t", "v"])
+        self.assertEqual(key_map._get_counts(), [2, 2, 1, 1, 2])
+        key_map.resort()
+        self.assertEqual(list(key_map.col_map["c"]), ["p", "s", "q", "v", "t"])
+        self.assertEqual(key_map._get_counts(), [2, 1, 2, 2, 1])
+        test_df = pd.DataFrame({"a": ["z", "w", "x", None], "b": [2, 2, 3, 1]})
+        df_result, missing = key_map.remap(test_df)
+        self.assertEqual(list(df_result["c"]), ["v", "n/a", "s", "t"])
+        self.assertEqual(missing, [1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -259,6 +259,29 @@ class Test(unittest.TestCase):
         self.assertEqual(len(files_bids), tab_all.total_files)
         self.assertEqual(len(files_bids) * 200, tab_all.total_events)
 
+    def test_summarize_files(self):
+        files_bids = get_file_list(self.bids_base_dir, extensions=[".tsv"], name_suffix="events")
+        skip_cols = ["onset", "duration", "sample"]
+        serial = TabularSummary(skip_cols=skip_cols, name="all")
+        for name in files_bids:
+            tab = TabularSummary(skip_cols=skip_cols)
+            tab.update(name)
+            serial.update_summary(tab)
+        summary, failures = TabularSummary.summarize_files(files_bids, skip_cols=skip_cols, name="all")
+        self.assertFalse(failures)
+        self.assertEqual(summary.get_summary(), serial.get_summary())
+        parallel, failures = TabularSummary.summarize_files(files_bids, skip_cols=skip_cols, name="all", jobs=2)
+        self.assertFalse(failures)
+        self.assertEqual(parallel.get_summary(), serial.get_summary())
+
+    def test_summarize_files_failures(self):
+        bad_file = os.path.join(os.path.dirname(self.stern_map_path), "missing_events.tsv")
+        summary, failures = TabularSummary.summarize_files([self.stern_map_path, bad_file], jobs=2)
+        self.assertEqual(list(failures), [bad_file])
+        self.assertEqual(summary.total_files, 1)
+        summary, failures = TabularSummary.summarize_files([])
+        self.assertEqual(summary.total_files, 0)
+
     def test_categorical_limit_constructor(self):
         # Test that categorical_limit can be set in constructor
         dict1 = TabularSummary(categorical_limit=5)
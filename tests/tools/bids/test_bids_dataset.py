@@ -56,6 +56,16 @@ class Test(unittest.TestCase):
         issues = bids.validate(check_for_warnings=True)
         self.assertEqual(len(issues), 6, "BidsDataset validate should return issues when check_for_warnings is True")
 
+    def test_validate_issue_limits(self):
+        bids = BidsDataset(self.root_path, suffixes=["events"])
+        self.assertEqual(len(bids.validate(check_for_warnings=True)), 6)
+        issues = bids.validate(check_for_warnings=True, max_issues=2)
+        self.assertEqual(len(issues), 2)
+        self.assertEqual(bids.suppressed_issue_count, 0, "Files after the limit should not be validated")
+        issues = bids.validate(check_for_warnings=True, max_issues_per_code=4)
+        self.assertEqual(len(issues), 4)
+        self.assertEqual(bids.suppressed_issue_count, 2)
+
     def test_basic_none_suffixes(self):
         bids = BidsDataset(self.root_path, suffixes=None)
         self.assertIsInstance(bids, BidsDataset, "BidsDataset should create a valid object from valid dataset")
@@ -205,6 +205,16 @@ class Test(unittest.TestCase):
         source_span = test_string_obj._get_org_span(HedTag("Event", self.hed_schema))
         self.assertEqual(source_span, (None, None))
 
+    def test_shared_components(self):
+        validator1 = HedValidator(hed_schema=self.hed_schema)
+        validator2 = HedValidator(hed_schema=self.hed_schema)
+        self.assertIs(validator1._unit_validator, validator2._unit_validator)
+        self.assertIs(validator1._char_validator, validator2._char_validator)
+        self.assertIsNot(validator1._group_validator, validator2._group_validator)
+        self.assertIsNot(validator1._def_validator, validator2._def_validator)
+        test_string_obj = HedString("Event, Item/NotItem, (Duration/3 ps, Label/#)", self.hed_schema)
+        self.assertEqual(validator1.validate(test_string_obj, False), validator2.validate(test_string_obj, False))
+
     def test_duplicate_group_in_definition(self):
         schema_path = os.path.join(
             os.path.dirname(os.path.realpath(__file__)), "../data/schema_tests/HED8.2.0.mediawiki"
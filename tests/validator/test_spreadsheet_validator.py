@@ -213,3 +213,49 @@ class TestSpreadsheetValidation(unittest.TestCase):
         issues2 = self.validator.validate(TabularInput(df_with_nans, sidecar=sidecar2), def_dicts=def_dict)
         self.assertEqual(len(issues2), 1)
         self.assertEqual(issues1[0]["code"], ValidationErrors.ONSETS_UNORDERED)
+
+    def test_merged_rows_rechecked(self):
+        df = pd.DataFrame(
+            {
+                "onset": ["1.0", "1.0", "2.0", "3.0", "3.00000001", "4.0", "4.0"],
+                "HED": ["Red", "Red", "Blue", "Green", "Square", "Blech/1", "Blue"],
+            }
+        )
+        validator = SpreadsheetValidator(self.schema)
+        issues = validator.validate(TabularInput(df))
+        self.assertEqual([issue["code"] for issue in issues].count(ValidationErrors.TAG_EXPRESSION_REPEATED), 2)
+
+        onsets = pd.DataFrame(
+            {
+                "onset": [1.0, 1.0, 2.0, 3.0, 3.00000001, 4.0, 4.0, float("nan"), float("nan")],
+                "HED": ["Red,Red", "", "Blue", "Green", "Square", "Blech/1,Blue", "", "Red", "Red"],
+                "original_index": [0, 1, 2, 3, 4, 5, 6, 7, 8],
+            }
+        )
+        validator.invalid_original_rows = {5}
+        self.assertEqual(validator._get_merged_rows(onsets), [0, 3])
+
+    def test_issue_limits_stop_validation_early(self):
+        df = pd.DataFrame(
+            {
+                "onset": [str(i) for i in range(20)],
+                "duration": ["0"] * 20,
+                "HED": [f"Blech/{i}, Red" for i in range(20)],
+            }
+        )
+        tabular = TabularInput(df, name="bad.tsv")
+        self.assertEqual(len(self.validator.validate(tabular, error_handler=ErrorHandler(False))), 20)
+
+        error_handler = ErrorHandler(False, stop_on_first_error=True)
+        issues = self.validator.validate(tabular, error_handler=error_handler)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(error_handler.suppressed_count, 0, "Rows after the first error should not be validated")
+
+        error_handler = ErrorHandler(False, max_issues_per_file=3)
+        self.assertEqual(len(self.validator.validate(tabular, name="bad.tsv", error_handler=error_handler)), 3)
+        self.assertTrue(error_handler.file_limit_reached("bad.tsv"))
+        self.assertFalse(error_handler.file_limit_reached("other.tsv"))
+
+        error_handler = ErrorHandler(False, max_issues_per_code=2)
+        self.assertEqual(len(self.validator.validate(tabular, error_handler=error_handler)), 2)
+        self.assertEqual(error_handler.suppressed_count, 18)
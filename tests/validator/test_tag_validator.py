@@ -674,6 +674,12 @@ class TestTagLevels(TestHed):
         self.validator_semantic(test_strings, expected_results, expected_issues, False)
 
 
+class TestTagLevelsSinglePass(TestTagLevels):
+    @staticmethod
+    def string_obj_func(validator):
+        return lambda hed_string: validator._group_validator.run_tree_validators(hed_string)[0]
+
+
 class FullHedString(TestHed):
     compute_forms = False
 